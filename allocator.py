@@ -0,0 +1,291 @@
+from bisect import bisect_right, insort
+from collections import Counter, deque
+from datetime import date, timedelta
+import random
+import time
+
+from Room import Room
+from reservation import Reservation
+from availability import AvailabilityIndex
+from room_search import AmenityCodes
+
+OBJECTIVES = ("occupancy", "revenue", "guests")
+
+
+def _check_objective(objective):
+    # Raise ValueError unless objective is one of OBJECTIVES
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Objective must be one of {', '.join(OBJECTIVES)}.")
+
+
+class RoomRequest:
+    """A guest's request for a room type, with optional amenities and price cap, over a date range."""
+
+    def __init__(self, guest, room_type, check_in, check_out, amenities=(), max_price=None):
+        # Initialize request details
+        self.__guest = guest
+        self.__room_type = room_type
+        self.__check_in = check_in
+        self.__check_out = check_out
+        self.__amenities = tuple(amenities)
+        self.__max_price = max_price
+
+    def get_guest(self): return self.__guest            # Return guest
+    def get_room_type(self): return self.__room_type    # Return requested type
+    def get_check_in(self): return self.__check_in      # Return check-in
+    def get_check_out(self): return self.__check_out    # Return check-out
+    def get_amenities(self): return self.__amenities    # Return required amenities
+    def get_max_price(self): return self.__max_price    # Return price cap, or None
+    def get_nights(self): return (self.__check_out - self.__check_in).days  # Return length of stay
+
+    def __str__(self):
+        # Return request summary
+        return f"Request: {self.__room_type} from {self.__check_in} to {self.__check_out}"
+
+
+class Waitlist:
+    """Requests that could not be placed yet, kept in arrival order."""
+
+    def __init__(self):
+        # Initialize an empty waitlist
+        self.__requests = deque()
+
+    def __len__(self): return len(self.__requests)
+    def add(self, request): self.__requests.append(request)  # Put a request on the waitlist
+    def get_requests(self): return list(self.__requests)    # Return waiting requests
+
+    def retry(self, allocator, objective="occupancy"):
+        # Try to place every waiting request; the ones that still do not fit stay waiting
+        waiting = list(self.__requests)
+        self.__requests.clear()
+        reservations, unplaced = allocator.allocate(waiting, objective)
+        self.__requests.extend(unplaced)
+        return reservations
+
+
+class BatchAllocator:
+    """Assigns a whole batch of room requests at once instead of first-fit, one by one.
+
+    Objectives:
+      "occupancy" - most room-nights sold: the longest stays are placed first.
+      "revenue"   - most revenue: the most valuable stays are placed first, in the
+                    dearest room the guest's price cap allows.
+      "guests"    - most stays: requests are taken in check-out order, the
+                    interval-scheduling rule that places the most stays when
+                    rooms are interchangeable.
+    Each stay goes to the free eligible room whose previous stay ends closest
+    before its check-in, so gaps between stays stay as small as possible. Among
+    equal fits it picks the rooms fewest other requests can use.
+
+    Reservations are booked into the availability index. Adding them to guests
+    is left to the caller, as with AvailabilityIndex.book().
+    """
+
+    def __init__(self, rooms, availability=None):
+        # Group interchangeable rooms (same type, amenities and price)
+        self.__availability = availability if availability is not None else AvailabilityIndex(rooms)
+        self.__codes = AmenityCodes()
+        self.__groups = {}      # (type, amenity mask, price) -> room numbers
+        for room in rooms:
+            key = (room.get_room_type(), self.__codes.mask(room.get_amenities()), room.get_price_per_night())
+            self.__groups.setdefault(key, []).append(room.get_room_number())
+
+    def get_availability(self): return self.__availability  # Return availability index
+
+    def __eligible(self, request):
+        # Return the room groups a request may use
+        wanted = self.__codes.lookup(request.get_amenities())
+        if wanted is None:
+            return []
+        cap = request.get_max_price()
+        return [key for key in self.__groups
+                if key[0] == request.get_room_type() and key[1] & wanted == wanted and (cap is None or key[2] <= cap)]
+
+    def allocate(self, requests, objective="occupancy"):
+        # Book as many requests as possible; return (reservations, requests left over)
+        placed, unplaced = self.__allocate(requests, objective)
+        return [reservation for _, reservation in placed], unplaced
+
+    def __allocate(self, requests, objective):
+        # Return ([(request, reservation)], unplaced requests). If anything fails part
+        # way, the rooms booked so far are released before the error is passed on
+        _check_objective(objective)
+        kind_of = lambda r: (r.get_room_type(), r.get_amenities(), r.get_max_price())
+        kinds = Counter(map(kind_of, requests))
+        eligible = {kind: self.__eligible(RoomRequest(None, kind[0], None, None, kind[1], kind[2])) for kind in kinds}
+
+        # Demand on a group is how many requests could use it. Each request prefers
+        # the groups fewest others can use, leaving contested rooms for those who need them
+        demand = Counter()
+        for kind, keys in eligible.items():
+            for key in keys:
+                demand[key] += kinds[kind] / len(self.__groups[key])
+        for keys in eligible.values():
+            if objective == "revenue":
+                keys.sort(key=lambda key: (-key[2], demand[key]))
+            else:
+                keys.sort(key=lambda key: demand[key])
+
+        if objective == "guests":
+            order = sorted(requests, key=lambda r: (r.get_check_out(), r.get_check_in()))
+        elif objective == "occupancy":
+            order = sorted(requests, key=lambda r: (-r.get_nights(), r.get_check_in()))
+        else:
+            best_rate = {kind: max((key[2] for key in keys), default=0) for kind, keys in eligible.items()}
+            order = sorted(requests, key=lambda r: (-r.get_nights() * best_rate[kind_of(r)], r.get_check_in()))
+
+        # Per group, (last check-out placed in this batch, room number), sorted
+        ends = {key: [(0, number) for number in sorted(numbers)] for key, numbers in self.__groups.items()}
+        placed, unplaced = [], []
+        try:
+            for request in order:
+                number = self.__place(request, eligible[kind_of(request)], ends, objective == "guests")
+                if number is None:
+                    unplaced.append(request)
+                    continue
+                reservation = Reservation(request.get_guest(), self.__availability.get_room(number),
+                                          request.get_check_in(), request.get_check_out())
+                self.__availability.book(reservation)
+                placed.append((request, reservation))
+        except BaseException:
+            for _, reservation in placed:
+                self.__availability.release(reservation)
+            raise
+        return placed, unplaced
+
+    def __place(self, request, keys, ends, in_end_order):
+        # Return the number of the closest-fitting free room, or None
+        check_in, check_out = request.get_check_in(), request.get_check_out()
+        day = check_in.toordinal()
+        best = None     # (previous check-out, group preference, group key, position in its list)
+        for rank, key in enumerate(keys):
+            group = ends[key]
+            if in_end_order:
+                # Stays placed so far all end by this check-out, so only rooms whose
+                # last stay ends by check-in can be free; walk those from the closest fit
+                candidates = range(bisect_right(group, (day, float("inf"))) - 1, -1, -1)
+            else:
+                candidates = range(len(group))
+            for j in candidates:
+                number = group[j][1]
+                schedule = self.__availability.get_schedule(number)
+                if not schedule.is_free(check_in, check_out):
+                    continue
+                previous = schedule.previous_end(check_in)
+                fit = previous.toordinal() if previous else 0
+                if best is None or (fit, -rank) > best[:2]:
+                    best = (fit, -rank, key, j)
+                if in_end_order or fit == day:
+                    break       # Nothing later in this group fits more closely
+            if best is not None and best[0] == day:
+                break           # No gap at all; a later group cannot do better
+        if best is None:
+            return None
+        _, _, key, j = best
+        last_end, number = ends[key].pop(j)
+        insort(ends[key], (max(last_end, check_out.toordinal()), number))
+        return number
+
+    def reassign(self, reservations, requests, objective="occupancy"):
+        # Re-plan existing reservations together with new requests so long stays can fit.
+        # Existing guests keep their dates and room type but may change room. If the joint
+        # plan cannot keep every one of them, nothing is moved and only the new requests are
+        # placed around them. Returns (moves as (old, new) pairs, new reservations, unplaced).
+        # Nothing is released until the objective is known to be valid, and any error while
+        # re-planning books the original reservations back before it is passed on
+        _check_objective(objective)
+        for reservation in reservations:
+            self.__availability.release(reservation)
+        try:
+            existing = {}
+            for reservation in reservations:
+                room = reservation.get_room()
+                request = RoomRequest(reservation.get_guest(), room.get_room_type(), reservation.get_check_in(),
+                                      reservation.get_check_out(), room.get_amenities(), room.get_price_per_night())
+                existing[request] = reservation
+            placed, unplaced = self.__allocate(list(existing) + list(requests), objective)
+        except BaseException:
+            for reservation in reservations:
+                self.__availability.book(reservation)
+            raise
+
+        if any(request in existing for request in unplaced):
+            for _, reservation in placed:
+                self.__availability.release(reservation)
+            for reservation in reservations:
+                self.__availability.book(reservation)
+            new, unplaced = self.allocate(requests, objective)
+            return [], new, unplaced
+
+        moves, new = [], []
+        for request, reservation in placed:
+            old = existing.get(request)
+            if old is None:
+                new.append(reservation)
+            elif old.get_room().get_room_number() != reservation.get_room().get_room_number():
+                moves.append((old, reservation))
+            else:
+                # Same room as before: keep the original object booked
+                self.__availability.release(reservation)
+                self.__availability.book(old)
+        return moves, new, unplaced
+
+
+def first_fit(rooms, availability, requests):
+    """Baseline: book each request into the first free eligible room in list order, like main()."""
+    placed, unplaced = [], []
+    for request in requests:
+        cap = request.get_max_price()
+        room = next((r for r in rooms
+                     if r.get_room_type() == request.get_room_type()
+                     and all(a in r.get_amenities() for a in request.get_amenities())
+                     and (cap is None or r.get_price_per_night() <= cap)
+                     and availability.is_free(r.get_room_number(), request.get_check_in(), request.get_check_out())),
+                    None)
+        if room is None:
+            unplaced.append(request)
+            continue
+        reservation = Reservation(request.get_guest(), room, request.get_check_in(), request.get_check_out())
+        availability.book(reservation)
+        placed.append(reservation)
+    return placed, unplaced
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(rooms=2000, requests=10000, days=14):
+    """Compare the batch allocator with first-fit on a day's pending requests."""
+    rng = random.Random(19)
+    types = (("Single", 300), ("Double", 450), ("Suite", 800))
+    amenities = ("Wi-Fi", "TV", "Mini-Bar", "Jacuzzi")
+    room_list = []
+    for i in range(rooms):
+        room_type, price = types[i % 3]
+        extras = amenities[:1 + i % len(amenities)]
+        room_list.append(Room(100 + i, room_type, list(extras), price + 50 * len(extras)))
+    start = date(2026, 7, 1)
+    pending = []
+    for _ in range(requests):
+        room_type, price = types[rng.randrange(3)]
+        check_in = start + timedelta(days=rng.randrange(days))
+        check_out = check_in + timedelta(days=rng.choice((1, 1, 2, 2, 3, 4, 7, 10)))
+        wanted = rng.sample(amenities[:2], rng.randrange(2))
+        pending.append(RoomRequest(None, room_type, check_in, check_out, wanted, price + 50 * rng.randint(1, 4)))
+
+    def summary(name, reservations, seconds):
+        nights = sum((r.get_check_out() - r.get_check_in()).days for r in reservations)
+        revenue = sum((r.get_check_out() - r.get_check_in()).days * r.get_room().get_price_per_night()
+                      for r in reservations)
+        print(f"{name:<22}{len(reservations):>8} placed{nights:>9} nights  AED{revenue:>12,}  {seconds:.2f}s")
+
+    began = time.perf_counter()
+    placed, _ = first_fit(room_list, AvailabilityIndex(room_list), pending)
+    summary("first-fit", placed, time.perf_counter() - began)
+    for objective in OBJECTIVES:
+        began = time.perf_counter()
+        placed, _ = BatchAllocator(room_list).allocate(pending, objective)
+        summary(f"batch ({objective})", placed, time.perf_counter() - began)
+
+
+if __name__ == '__main__':
+    benchmark()
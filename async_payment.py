@@ -0,0 +1,206 @@
+import asyncio
+import itertools
+import random
+import time
+import uuid
+
+
+class PaymentError(Exception):
+    """Raised when the gateway declines or fails a charge."""
+
+
+class PaymentDeclined(PaymentError):
+    """The gateway refused the charge; trying again will not help."""
+
+
+class TransientPaymentError(PaymentError):
+    """The gateway failed for a passing reason (e.g. it was busy); the charge may be retried."""
+
+
+# ---------------------- Local Gateway ----------------------
+
+class FakeGateway:
+    """Local stand-in for the payment gateway that simulates network latency and failures."""
+
+    def __init__(self, latency=0.05, jitter=0.02, failure_rate=0.0, decline_rate=0.0, seed=None):
+        # Initialize the simulated round-trip behaviour
+        self.__latency = latency            # Average round-trip time in seconds
+        self.__jitter = jitter              # Random extra delay, up to this many seconds
+        self.__failure_rate = failure_rate  # Share of charges that fail transiently
+        self.__decline_rate = decline_rate  # Share of charges that are declined
+        self.__random = random.Random(seed)
+        self.__ids = itertools.count(1)     # Transaction id source
+        self.__connections = 0              # Connections opened so far
+        self.__charged = {}                 # Idempotency key -> transaction id
+
+    def get_connection_count(self): return self.__connections  # Return connections opened
+    def get_charge_count(self): return len(self.__charged)    # Return payments actually charged
+
+    async def connect(self):
+        # Open a new connection; this costs one round trip
+        await asyncio.sleep(self.__latency)
+        self.__connections += 1
+        return GatewayConnection(self)
+
+    async def _charge(self, amount, method, idempotency_key):
+        # Simulate one charge round trip; a key already charged returns its first
+        # transaction id instead of charging again
+        await asyncio.sleep(self.__latency + self.__random.random() * self.__jitter)
+        if idempotency_key in self.__charged:
+            return self.__charged[idempotency_key]
+        roll = self.__random.random()
+        if roll < self.__decline_rate:
+            raise PaymentDeclined(f"Charge of AED{amount} via {method} was declined.")
+        if roll < self.__decline_rate + self.__failure_rate:
+            raise TransientPaymentError(f"Gateway error while charging AED{amount} via {method}.")
+        transaction_id = self.__charged[idempotency_key] = f"TX{next(self.__ids):08d}"
+        return transaction_id
+
+
+class GatewayConnection:
+    """An open connection to a gateway."""
+
+    def __init__(self, gateway):
+        # Keep a reference to the gateway this connection talks to
+        self.__gateway = gateway
+
+    async def charge(self, amount, method, idempotency_key):
+        # Charge the amount and return the transaction id; repeating a key never charges twice
+        return await self.__gateway._charge(amount, method, idempotency_key)
+
+
+class ConnectionPool:
+    """Reuses up to `size` gateway connections instead of connecting per payment."""
+
+    def __init__(self, gateway, size=10):
+        # Connections are opened lazily, up to size
+        self.__gateway = gateway
+        self.__slots = asyncio.Semaphore(size)  # Connections that may be checked out
+        self.__idle = asyncio.Queue()
+
+    async def acquire(self):
+        # Wait for a free slot, then reuse an idle connection or open a new one
+        await self.__slots.acquire()
+        if not self.__idle.empty():
+            return self.__idle.get_nowait()
+        try:
+            return await self.__gateway.connect()
+        except BaseException:
+            self.__slots.release()
+            raise
+
+    def release(self, connection):
+        # Hand a connection back to the pool
+        self.__idle.put_nowait(connection)
+        self.__slots.release()
+
+    def discard(self):
+        # Forget a connection that broke; its slot wakes a waiter, who opens a new one
+        self.__slots.release()
+
+
+# ---------------------- Processor ----------------------
+
+class PaymentResult:
+    """Outcome of one payment."""
+
+    def __init__(self, amount, method, transaction_id, attempts, error=None):
+        # Initialize result details
+        self.__amount = amount                  # Amount charged
+        self.__method = method                  # Payment method
+        self.__transaction_id = transaction_id  # Gateway transaction id, None on failure
+        self.__attempts = attempts              # Number of tries used
+        self.__error = error                    # Last error message, None on success
+
+    def get_amount(self): return self.__amount                  # Return amount
+    def get_method(self): return self.__method                  # Return method
+    def get_transaction_id(self): return self.__transaction_id  # Return transaction id
+    def get_attempts(self): return self.__attempts              # Return attempts
+    def get_error(self): return self.__error                    # Return error
+    def is_successful(self): return self.__transaction_id is not None  # Return success
+
+    def __str__(self):
+        # Return a summary in the same style as Payment.process_payment
+        if self.is_successful():
+            return f"✅ Payment of AED{self.__amount} processed via {self.__method}. ({self.__transaction_id})"
+        return f"❌ Payment of AED{self.__amount} via {self.__method} failed: {self.__error}"
+
+
+class AsyncPaymentProcessor:
+    """Processes payments concurrently with pooling, a concurrency limit, timeouts and retries."""
+
+    def __init__(self, gateway, pool_size=10, concurrency=50, timeout=2.0, retries=3, backoff=0.05):
+        # Initialize processor settings; must be created inside a running event loop
+        self.__pool = ConnectionPool(gateway, pool_size)
+        self.__limit = asyncio.Semaphore(concurrency)  # Payments in flight at once
+        self.__timeout = timeout        # Seconds allowed per attempt
+        self.__retries = retries        # Extra attempts after the first failure
+        self.__backoff = backoff        # Base delay between attempts, doubled each retry
+
+    async def __attempt(self, amount, method, idempotency_key):
+        # Get a connection and charge once; the caller's timeout covers both steps
+        connection = await self.__pool.acquire()
+        try:
+            transaction_id = await connection.charge(amount, method, idempotency_key)
+        except PaymentError:
+            self.__pool.release(connection)    # The gateway answered; the connection is fine
+            raise
+        except BaseException:
+            self.__pool.discard()   # Timed out or cancelled mid-request; free the slot
+            raise
+        self.__pool.release(connection)
+        return transaction_id
+
+    async def process_payment(self, amount, method, idempotency_key=None):
+        # Charge one amount, retrying transient failures and timeouts. Every attempt sends
+        # the same idempotency key, so a retry after a charge that went through but timed
+        # out on the way back cannot charge twice
+        idempotency_key = idempotency_key or uuid.uuid4().hex
+        async with self.__limit:
+            error = None
+            for attempt in range(1, self.__retries + 2):
+                try:
+                    transaction_id = await asyncio.wait_for(self.__attempt(amount, method, idempotency_key),
+                                                            self.__timeout)
+                except TransientPaymentError as e:
+                    error = str(e)
+                except PaymentError as e:
+                    return PaymentResult(amount, method, None, attempt, str(e))    # Declined: not retried
+                except asyncio.TimeoutError:
+                    error = "Timed out waiting for the gateway."
+                else:
+                    return PaymentResult(amount, method, transaction_id, attempt)
+                if attempt <= self.__retries:
+                    await asyncio.sleep(self.__backoff * 2 ** (attempt - 1))
+            return PaymentResult(amount, method, None, self.__retries + 1, error)
+
+    async def process_many(self, amounts, method):
+        # Charge every amount concurrently and return the results in input order
+        return await asyncio.gather(*(self.process_payment(amount, method) for amount in amounts))
+
+    async def pay_invoices(self, invoices, method):
+        # Charge the total of every invoice
+        return await self.process_many([invoice.calculate_total() for invoice in invoices], method)
+
+
+# ---------------------- Load Test ----------------------
+
+def load_test(payments=1000, levels=(1, 10, 50, 200, 500), latency=0.005):
+    """Print payment throughput for each concurrency level against the fake gateway."""
+    async def run(concurrency):
+        gateway = FakeGateway(latency=latency, jitter=latency / 2, failure_rate=0.01, decline_rate=0.005, seed=1)
+        processor = AsyncPaymentProcessor(gateway, pool_size=concurrency, concurrency=concurrency)
+        began = time.perf_counter()
+        results = await processor.process_many([300 + i % 500 for i in range(payments)], "Credit Card")
+        elapsed = time.perf_counter() - began
+        failed = sum(1 for r in results if not r.is_successful())
+        print(f"concurrency {concurrency:>4}: {payments / elapsed:>9,.0f} payments/s"
+              f"  ({elapsed:.2f}s, {failed} failed, {gateway.get_charge_count()} charged,"
+              f" {gateway.get_connection_count()} connections)")
+
+    for concurrency in levels:
+        asyncio.run(run(concurrency))
+
+
+if __name__ == '__main__':
+    load_test()
@@ -0,0 +1,98 @@
+from bisect import bisect_left, bisect_right, insort
+
+
+class RoomSchedule:
+    """Keeps the booked date ranges of one room in sorted order."""
+
+    def __init__(self, room):
+        # Initialize an empty schedule for the room
+        self.__room = room          # Room this schedule belongs to
+        self.__starts = []          # Sorted check-in dates
+        self.__ends = []            # Check-out dates, same order as starts
+
+    def get_room(self): return self.__room                # Return room
+    def set_room(self, room): self.__room = room          # Replace the room, keeping its bookings
+    def get_bookings(self): return list(zip(self.__starts, self.__ends))  # Return (check_in, check_out) pairs
+
+    def is_free(self, check_in, check_out):
+        # Booked ranges never overlap, so the range starting last before
+        # check_out is the only one that can reach past check_in
+        i = bisect_left(self.__starts, check_out)
+        return i == 0 or self.__ends[i - 1] <= check_in
+
+    def previous_end(self, day):
+        # Return the latest check-out on or before day, or None if there is none
+        i = bisect_right(self.__ends, day)
+        return self.__ends[i - 1] if i else None
+
+    def book(self, check_in, check_out):
+        # Add a [check_in, check_out) range, refusing overlaps
+        if check_out <= check_in:
+            raise ValueError("Check-out must be after check-in.")
+        if not self.is_free(check_in, check_out):
+            return False
+        i = bisect_left(self.__starts, check_in)
+        self.__starts.insert(i, check_in)
+        self.__ends.insert(i, check_out)
+        return True
+
+    def release(self, check_in, check_out):
+        # Remove a previously booked range
+        i = bisect_left(self.__starts, check_in)
+        if i < len(self.__starts) and self.__starts[i] == check_in and self.__ends[i] == check_out:
+            del self.__starts[i]
+            del self.__ends[i]
+            return True
+        return False
+
+
+class AvailabilityIndex:
+    """Date-range availability for every room, keyed by room number."""
+
+    def __init__(self, rooms=()):
+        # Initialize the index with an optional list of rooms
+        self.__schedules = {}       # Room number -> RoomSchedule
+        self.__numbers = []         # Sorted room numbers
+        for room in rooms:
+            self.add_room(room)
+
+    def add_room(self, room):
+        # Register a room so it can be booked; adding a room number again updates
+        # the room but keeps the dates already booked on it
+        number = room.get_room_number()
+        schedule = self.__schedules.get(number)
+        if schedule is not None:
+            schedule.set_room(room)
+            return
+        insort(self.__numbers, number)
+        self.__schedules[number] = RoomSchedule(room)
+
+    def get_room(self, room_number):
+        # Return the room with this number, or None
+        schedule = self.__schedules.get(room_number)
+        return schedule.get_room() if schedule else None
+
+    def get_schedule(self, room_number): return self.__schedules.get(room_number)  # Return schedule
+    def get_rooms(self): return [self.__schedules[n].get_room() for n in self.__numbers]  # Return all rooms
+
+    def is_free(self, room_number, check_in, check_out):
+        # Check one room for the given dates
+        schedule = self.__schedules.get(room_number)
+        return schedule is not None and schedule.is_free(check_in, check_out)
+
+    def free_rooms(self, check_in, check_out):
+        # Return all rooms free for [check_in, check_out), in room number order
+        return [s.get_room() for s in (self.__schedules[n] for n in self.__numbers)
+                if s.is_free(check_in, check_out)]
+
+    def book(self, reservation):
+        # Block the reservation's dates on its room
+        schedule = self.__schedules.get(reservation.get_room().get_room_number())
+        if schedule is None:
+            raise KeyError(f"Room {reservation.get_room().get_room_number()} is not in the index.")
+        return schedule.book(reservation.get_check_in(), reservation.get_check_out())
+
+    def release(self, reservation):
+        # Free the reservation's dates on its room
+        schedule = self.__schedules.get(reservation.get_room().get_room_number())
+        return schedule is not None and schedule.release(reservation.get_check_in(), reservation.get_check_out())
@@ -0,0 +1,152 @@
+from datetime import datetime
+import csv
+import json
+import sys
+
+from guest import Guest
+from reservation import Reservation
+from invoice import Invoice
+from availability import AvailabilityIndex
+from validation import is_valid_name, is_valid_email, is_valid_phone
+from hotel.data import load_rooms
+
+
+# ---------------------- Input ----------------------
+
+def default_rooms():
+    """Return the hotel's predefined rooms, from the shared inventory in hotel/rooms.csv."""
+    return load_rooms()
+
+
+def read_requests(path):
+    """Yield (line number, request) from a .csv file or a JSON Lines file.
+
+    The request is a dict, or None for a JSON line that is not a valid object,
+    so one bad line is rejected on its own instead of stopping the import.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            reader = csv.DictReader(f)
+            for request in reader:
+                yield reader.line_num, request
+            return
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                request = None
+            yield number, request if isinstance(request, dict) else None
+
+
+# ---------------------- Processing ----------------------
+
+def _text(request, key):
+    # Return a field as text, or "" if it is missing, null or not a string
+    value = request.get(key)
+    return value if isinstance(value, str) else ""
+
+
+def _room_text(request):
+    # Return the room field as text; JSON may give it as a whole number
+    value = request.get("room")
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return _text(request, "room")
+
+
+def _parse_date(value):
+    # Return a date for YYYY-MM-DD text, or None
+    try:
+        return datetime.strptime(value.strip(), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def validate_request(request):
+    """Return a list of error messages for one booking request."""
+    errors = []
+    # Missing cells, JSON nulls and other non-text values count as empty,
+    # never as the text "None"
+    if not is_valid_name(_text(request, "name")):
+        errors.append("Name must contain only letters.")
+    if not is_valid_email(_text(request, "email")):
+        errors.append("Invalid email format.")
+    if not is_valid_phone(_text(request, "phone")):
+        errors.append("Phone must be at least 10 digits.")
+    if not _room_text(request).strip().isdecimal():
+        errors.append("Please enter a valid numeric room number.")
+    check_in = _parse_date(_text(request, "check_in"))
+    check_out = _parse_date(_text(request, "check_out"))
+    if check_in is None or check_out is None:
+        errors.append("Invalid date format. Please use YYYY-MM-DD.")
+    elif check_out <= check_in:
+        errors.append("Check-out must be after check-in.")
+    if not _text(request, "payment_method").strip():
+        errors.append("Payment method cannot be empty.")
+    return errors
+
+
+def process_requests(requests, availability):
+    """Validate and book each (line number, request) pair, yielding one result dict per request."""
+    for line, request in requests:
+        if request is None:
+            yield {"line": line, "status": "rejected", "errors": ["Line is not a valid JSON object."]}
+            continue
+        errors = validate_request(request)
+        if errors:
+            yield {"line": line, "status": "rejected", "errors": errors}
+            continue
+
+        room_number = int(_room_text(request).strip())
+        check_in = _parse_date(request["check_in"])
+        check_out = _parse_date(request["check_out"])
+        room = availability.get_room(room_number)
+        if room is None or not availability.is_free(room_number, check_in, check_out):
+            yield {"line": line, "status": "rejected",
+                   "errors": ["Selected room is not available or does not exist."]}
+            continue
+
+        guest = Guest(request["name"], request["email"], request["phone"])
+        reservation = Reservation(guest, room, check_in, check_out)
+        guest.add_reservation(reservation)
+        availability.book(reservation)
+        invoice = Invoice(reservation)
+        yield {"line": line, "status": "confirmed", "guest": guest.get_name(), "room": room_number,
+               "check_in": check_in.isoformat(), "check_out": check_out.isoformat(),
+               "payment_method": request["payment_method"].strip(), "total": invoice.calculate_total()}
+
+
+# ---------------------- Output ----------------------
+
+def write_results(results, out):
+    """Write each result as a JSON line as soon as it is produced; return (confirmed, rejected)."""
+    confirmed = rejected = 0
+    for result in results:
+        out.write(json.dumps(result, ensure_ascii=False))
+        out.write("\n")
+        if result["status"] == "confirmed":
+            confirmed += 1
+        else:
+            rejected += 1
+    return confirmed, rejected
+
+
+def run_batch(input_path, output_path=None, rooms=None):
+    """Book every request in input_path and write the results to output_path (or stdout)."""
+    availability = AvailabilityIndex(rooms if rooms is not None else default_rooms())
+    results = process_requests(read_requests(input_path), availability)
+    if output_path is None:
+        return write_results(results, sys.stdout)
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as out:
+        return write_results(results, out)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python batch_booking.py <requests.jsonl|requests.csv> [results.jsonl]")
+        sys.exit(1)
+    confirmed, rejected = run_batch(sys.argv[1], sys.argv[2] if len(sys.argv) == 3 else None)
+    print(f"✅ {confirmed} confirmed, ❌ {rejected} rejected", file=sys.stderr)
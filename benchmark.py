@@ -0,0 +1,214 @@
+"""Benchmark suite for the hotel domain model.
+
+Runs the same workload against each copy of the classes (the split modules,
+"Assignment 2 final code.py" and "assignment 2 draft.py") at several scales and
+writes the timings as JSON. Searches on the shared AvailabilityIndex are the same
+code for every copy, so they are timed once per scale as variant "index".
+Two result files can be compared to catch regressions:
+
+    python benchmark.py --output results.json
+    python benchmark.py --compare old.json results.json
+"""
+
+from datetime import date, timedelta
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from availability import AvailabilityIndex
+from feedback_analytics import FeedbackAggregator
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCALES = {"small": (50, 500, 2000), "medium": (500, 5000, 20000), "large": (5000, 50000, 200000)}  # rooms, guests, reservations
+ROOM_TYPES = (("Single", 300), ("Double", 450), ("Suite", 800))
+AMENITIES = ("Wi-Fi", "TV", "Mini-Bar", "Jacuzzi")
+
+
+# ---------------------- Variants ----------------------
+
+class Variant:
+    """One copy of the domain classes."""
+
+    def __init__(self, name, namespace):
+        # Pick the classes out of a module or namespace
+        self.name = name
+        self.Room = namespace.Room
+        self.Guest = namespace.Guest
+        self.Reservation = namespace.Reservation
+        self.Invoice = namespace.Invoice
+        self.Feedback = namespace.Feedback
+
+
+def _load_script(name, filename):
+    # Import a script by path without running its main program
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_variants():
+    """Return every copy of the classes that can be imported."""
+    from Room import Room
+    from guest import Guest
+    from reservation import Reservation
+    from invoice import Invoice
+    from feedback import Feedback
+
+    split = type("split", (), dict(Room=Room, Guest=Guest, Reservation=Reservation, Invoice=Invoice, Feedback=Feedback))
+    variants = [Variant("modules", split)]
+    for name, filename in (("final", "Assignment 2 final code.py"), ("draft", "assignment 2 draft.py")):
+        variants.append(Variant(name, _load_script(f"hotel_{name}", filename)))
+    return variants
+
+
+# ---------------------- Synthetic Hotel ----------------------
+
+def make_plan(rooms, guests, reservations, seed=1):
+    """Return plain-data rooms, guests and stays so every variant gets identical input."""
+    rng = random.Random(seed)
+    start = date(2026, 1, 1)
+    room_rows = []
+    for i in range(rooms):
+        room_type, price = ROOM_TYPES[i % len(ROOM_TYPES)]
+        room_rows.append((100 + i, room_type, rng.sample(AMENITIES, 2), price + rng.randrange(0, 200, 10)))
+    guest_rows = [(f"Guest {i}", f"guest{i}@example.com", f"05{i:08d}") for i in range(guests)]
+    stays = []
+    for _ in range(reservations):
+        check_in = start + timedelta(days=rng.randrange(365))
+        stays.append((rng.randrange(guests), rng.randrange(rooms), check_in,
+                      check_in + timedelta(days=rng.randint(1, 7)), rng.randint(1, 5)))
+    return room_rows, guest_rows, stays
+
+
+def _time(fn, repeat):
+    # Return the best wall time of fn over repeat runs
+    best = float("inf")
+    for _ in range(repeat):
+        began = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - began)
+    return best
+
+
+def run_variant(variant, plan, repeat=3):
+    """Time each operation for one variant; return {operation: (count, seconds)}."""
+    room_rows, guest_rows, stays = plan
+    rooms = [variant.Room(*row) for row in room_rows]
+    guests = [variant.Guest(*row) for row in guest_rows]
+    results = {}
+
+    def create_reservations():
+        made = []
+        for g, r, check_in, check_out, _ in stays:
+            reservation = variant.Reservation(guests[g], rooms[r], check_in, check_out)
+            guests[g].add_reservation(reservation)
+            made.append(reservation)
+        return made
+    began = time.perf_counter()
+    reservations = create_reservations()
+    results["reservation_creation"] = (len(stays), time.perf_counter() - began)
+    invoices = [variant.Invoice(reservation) for reservation in reservations]
+
+    # The scripts list free rooms by scanning every room's is_available() flag
+    searches = stays[:200]
+    results["room_search"] = (len(searches), _time(
+        lambda: [[r for r in rooms if r.is_available()] for _ in searches], repeat))
+    lookups = [room_rows[i % len(room_rows)][0] for i in range(2000)]
+    results["room_lookup_scan"] = (len(lookups), _time(
+        lambda: [next((r for r in rooms if r.get_room_number() == n), None) for n in lookups], repeat))
+
+    results["calculate_total"] = (len(invoices), _time(lambda: [i.calculate_total() for i in invoices], repeat))
+    results["str_rendering"] = (2 * len(invoices), _time(
+        lambda: ([str(r) for r in reservations], [str(i) for i in invoices]), repeat))
+
+    def ingest_feedback():
+        aggregator = FeedbackAggregator()
+        for g, r, _, check_out, rating in stays:
+            variant.Feedback(guests[g], rating, "Lovely stay")
+            aggregator.add(rating, room_rows[r][0], room_rows[r][1], check_out)
+    results["feedback_ingestion"] = (len(stays), _time(ingest_feedback, repeat))
+    return results
+
+
+def run_index(plan, repeat=3):
+    """Time date-range searches on the shared AvailabilityIndex; it is the same code for every variant."""
+    from Room import Room
+    from reservation import Reservation
+
+    room_rows, _, stays = plan
+    rooms = [Room(*row) for row in room_rows]
+    availability = AvailabilityIndex(rooms)
+    for _, r, check_in, check_out, _ in stays:
+        availability.book(Reservation(None, rooms[r], check_in, check_out))
+    searches = [(stay[2], stay[3]) for stay in stays[:200]]
+    return {"room_search_index": (len(searches), _time(lambda: [availability.free_rooms(*s) for s in searches],
+                                                         repeat))}
+
+
+# ---------------------- Results ----------------------
+
+def _commit():
+    # Return the current git commit, or None outside a checkout
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales=("small", "medium"), repeat=3, seed=1):
+    """Run the suite and return the results as a JSON-ready dict."""
+    rows = []
+    variants = load_variants()
+    for scale in scales:
+        plan = make_plan(*SCALES[scale], seed=seed)
+        timings = [(variant.name, run_variant(variant, plan, repeat)) for variant in variants]
+        timings.append(("index", run_index(plan, repeat)))
+        for name, results in timings:
+            for operation, (count, seconds) in results.items():
+                rows.append({"variant": name, "scale": scale, "operation": operation, "count": count,
+                             "seconds": round(seconds, 6), "us_per_op": round(seconds / count * 1e6, 3)})
+                print(f"{scale:<7}{name:<9}{operation:<22}{rows[-1]['us_per_op']:>10.3f} us/op")
+    return {"commit": _commit(), "python": platform.python_version(), "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": seed, "results": rows}
+
+
+def compare(old, new, threshold=1.2):
+    """Print the change for every operation; return how many slowed down past threshold."""
+    before = {(r["variant"], r["scale"], r["operation"]): r["us_per_op"] for r in old["results"]}
+    regressions = 0
+    for row in new["results"]:
+        key = (row["variant"], row["scale"], row["operation"])
+        if key not in before or not before[key]:
+            continue
+        ratio = row["us_per_op"] / before[key]
+        flag = "❌ REGRESSION" if ratio > threshold else ""
+        regressions += ratio > threshold
+        print(f"{' / '.join(key):<48}{before[key]:>10.3f} -> {row['us_per_op']:>10.3f} us/op  x{ratio:.2f} {flag}")
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the hotel domain classes.")
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["small", "medium"])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per operation; the best is kept")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f_old, open(args.compare[1], encoding="utf-8") as f_new:
+            sys.exit(1 if compare(json.load(f_old), json.load(f_new), args.threshold) else 0)
+    results = run(args.scales, args.repeat, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,287 @@
+"""Fixed-width binary files for the room inventory and reservation history.
+
+Each file starts with a 4096-byte header: magic, version, record kind, record
+size, then the room type and amenity names that the codes in the records refer
+to. Records follow back to back, so record i sits at HEADER_SIZE + i * size.
+Readers mmap the file and hand out memoryviews (or NumPy arrays) over the
+mapping, so every process reading the same file shares one copy in the page
+cache. Appenders add records at the end; readers call refresh() to see them.
+"""
+
+from datetime import date
+import json
+import mmap
+import os
+import pickle
+import random
+import struct
+import sys
+import tempfile
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; readers fall back to memoryviews
+    np = None
+
+from Room import Room
+from room_search import AmenityCodes
+
+MAGIC = b"HTLB"
+VERSION = 1
+HEADER_SIZE = 4096
+HEADER = struct.Struct("<4sHHII")   # magic, version, kind, record size, names length
+
+ROOMS = 1
+RESERVATIONS = 2
+RECORDS = {
+    ROOMS: struct.Struct("<iB3xdQ"),        # room number, type code, price, amenity bitset
+    RESERVATIONS: struct.Struct("<iIii"),   # room number, guest id, check-in, check-out (day ordinals)
+}
+NUMPY_TYPES = {
+    ROOMS: [("room_number", "<i4"), ("room_type", "u1"), ("pad", "V3"), ("price", "<f8"), ("amenities", "<u8")],
+    RESERVATIONS: [("room_number", "<i4"), ("guest_id", "<u4"), ("check_in", "<i4"), ("check_out", "<i4")],
+}
+
+
+def _read_header(data, path):
+    # Return (kind, record size, room type names, AmenityCodes) from a file's first bytes
+    magic, version, kind, size, length = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} hotel binary file.")
+    names = json.loads(bytes(data[HEADER.size:HEADER.size + length]).decode("utf-8"))
+    return kind, size, names["room_types"], AmenityCodes(names["amenities"])
+
+
+# ---------------------- Readers ----------------------
+
+class BinaryFile:
+    """Read-only memory-mapped view of a rooms or reservations file."""
+
+    def __init__(self, path, kind=None):
+        # Map the file; kind, if given, must match the file's record kind
+        self.__path = path
+        self.__file = open(path, "rb")
+        self.__map = None
+        self.refresh()
+        if kind is not None and self.__kind != kind:
+            raise ValueError(f"{path} holds record kind {self.__kind}, not {kind}.")
+
+    def refresh(self):
+        # Remap the file to pick up records appended since it was opened
+        if self.__map is not None:
+            self.__map.close()
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__kind, size, self.__room_types, self.__amenity_codes = _read_header(self.__map, self.__path)
+        self.__record = RECORDS[self.__kind]
+        self.__count = (len(self.__map) - HEADER_SIZE) // size    # A torn last record is ignored
+
+    def get_kind(self): return self.__kind                      # Return ROOMS or RESERVATIONS
+    def get_room_types(self): return list(self.__room_types)    # Return room type names by code
+    def get_amenity_codes(self): return self.__amenity_codes    # Return the amenity bit assignments
+    def __len__(self): return self.__count                      # Number of complete records
+
+    def get_bytes(self):
+        # Return a memoryview of the records, without copying
+        return memoryview(self.__map)[HEADER_SIZE:HEADER_SIZE + self.__count * self.__record.size]
+
+    def __getitem__(self, index):
+        # Return record index as a tuple
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("Record index out of range.")
+        return self.__record.unpack_from(self.__map, HEADER_SIZE + index * self.__record.size)
+
+    def __iter__(self):
+        # Yield every record as a tuple, decoded straight from the mapping
+        view = self.get_bytes()
+        try:
+            yield from self.__record.iter_unpack(view)
+        finally:
+            view.release()
+
+    def get_array(self):
+        # Return the records as a NumPy structured array over the mapping (no copy)
+        if np is None:
+            raise RuntimeError("NumPy is not installed; use get_bytes() or iterate instead.")
+        return np.frombuffer(self.__map, dtype=np.dtype(NUMPY_TYPES[self.__kind]),
+                             count=self.__count, offset=HEADER_SIZE)
+
+    def close(self):
+        # Unmap and close the file; memoryviews from get_bytes() must be released first
+        self.__map.close()
+        self.__file.close()
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+
+class RoomFile(BinaryFile):
+    """Memory-mapped room inventory."""
+
+    def __init__(self, path):
+        # Open a rooms file
+        super().__init__(path, ROOMS)
+
+    def rooms(self):
+        # Yield Room objects for every record
+        types = self.get_room_types()
+        codes = self.get_amenity_codes()
+        for number, type_code, price, amenities in self:
+            yield Room(number, types[type_code], codes.names(amenities),
+                       int(price) if price.is_integer() else price)
+
+
+class ReservationFile(BinaryFile):
+    """Memory-mapped reservation history."""
+
+    def __init__(self, path):
+        # Open a reservations file
+        super().__init__(path, RESERVATIONS)
+
+    def get_matrix(self):
+        # Return the records as a (count, 4) unsigned int grid: room, guest id, check-in, check-out.
+        # NumPy array if available, otherwise a 2-D memoryview indexed as m[row, column].
+        # Read as unsigned so guest ids of 2**31 and up stay positive; room numbers
+        # and day ordinals are never negative, so they read the same either way
+        if np is not None:
+            return np.frombuffer(self.get_bytes(), dtype="<u4").reshape(len(self), 4)
+        return self.get_bytes().cast("I", (len(self), 4))
+
+
+# ---------------------- Appender ----------------------
+
+class Appender:
+    """Adds records to the end of a rooms or reservations file, creating it if needed."""
+
+    def __init__(self, path, kind, buffer_size=1 << 20):
+        # Open (or create) the file and load its room type and amenity names
+        self.__path = path
+        self.__kind = kind
+        self.__record = RECORDS[kind]
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                header_kind, _, self.__room_types, self.__codes = _read_header(f.read(HEADER_SIZE), path)
+            if header_kind != kind:
+                raise ValueError(f"{path} holds record kind {header_kind}, not {kind}.")
+            size = os.path.getsize(path)
+            whole = HEADER_SIZE + (size - HEADER_SIZE) // self.__record.size * self.__record.size
+            if whole != size:
+                os.truncate(path, whole)    # Drop a torn last record
+        else:
+            self.__room_types, self.__codes = [], AmenityCodes()
+            with open(path, "wb") as f:
+                f.write(bytes(HEADER_SIZE))
+            self.__write_header()
+        self.__names = (len(self.__room_types), len(self.__codes.get_names()))
+        self.__file = open(path, "ab", buffering=buffer_size)
+
+    def __write_header(self):
+        # Rewrite the header with the current names
+        names = json.dumps({"room_types": self.__room_types, "amenities": self.__codes.get_names()}).encode("utf-8")
+        if HEADER.size + len(names) > HEADER_SIZE:
+            raise ValueError("Too many room type and amenity names for the header.")
+        with open(self.__path, "r+b") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.__kind, self.__record.size, len(names)) + names)
+
+    def __type_code(self, room_type):
+        # Return the code for a room type, adding it if new
+        if room_type not in self.__room_types:
+            self.__room_types.append(room_type)
+        return self.__room_types.index(room_type)
+
+    def append_room(self, room):
+        # Append one Room
+        self.__file.write(self.__record.pack(room.get_room_number(), self.__type_code(room.get_room_type()),
+                                             room.get_price_per_night(), self.__codes.mask(room.get_amenities())))
+
+    def append_reservation(self, room_number, guest_id, check_in, check_out):
+        # Append one reservation; dates may be date objects or day ordinals
+        if isinstance(check_in, date):
+            check_in, check_out = check_in.toordinal(), check_out.toordinal()
+        self.__file.write(self.__record.pack(room_number, guest_id, check_in, check_out))
+
+    def extend(self, rows):
+        # Append many reservation tuples (room number, guest id, check-in ordinal, check-out ordinal)
+        pack = self.__record.pack
+        self.__file.write(b"".join(pack(*row) for row in rows))
+
+    def flush(self):
+        # Write buffered records, and the header first if new names were added
+        if self.__names != (len(self.__room_types), len(self.__codes.get_names())):
+            self.__write_header()
+            self.__names = (len(self.__room_types), len(self.__codes.get_names()))
+        self.__file.flush()
+
+    def close(self):
+        # Flush and close
+        self.flush()
+        self.__file.close()
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+
+def write_rooms(path, rooms):
+    """Write a rooms file from Room objects, replacing any existing file."""
+    if os.path.exists(path):
+        os.remove(path)
+    with Appender(path, ROOMS) as appender:
+        for room in rooms:
+            appender.append_room(room)
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(reservations=10000000, rooms=5000):
+    """Time appending a reservation history, then opening it and summing nights, against unpickling."""
+    rng = random.Random(22)
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "reservations.bin")
+    start = date(2020, 1, 1).toordinal()
+    rows = []
+    for i in range(reservations):
+        check_in = start + rng.randrange(2000)
+        rows.append((100 + rng.randrange(rooms), rng.randrange(1000000), check_in, check_in + 1 + rng.randrange(7)))
+
+    began = time.perf_counter()
+    with Appender(path, RESERVATIONS) as appender:
+        for i in range(0, len(rows), 100000):
+            appender.extend(rows[i:i + 100000])
+    print(f"appended {reservations:,} reservations ({os.path.getsize(path) / 1e6:.0f} MB) "
+          f"in {time.perf_counter() - began:.1f}s")
+
+    pickled = os.path.join(folder, "reservations.pickle")
+    with open(pickled, "wb") as f:
+        pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+    del rows
+
+    began = time.perf_counter()
+    with open(pickled, "rb") as f:
+        loaded = pickle.load(f)
+    nights = sum(check_out - check_in for _, _, check_in, check_out in loaded)
+    print(f"unpickle + sum nights: {time.perf_counter() - began:.2f}s ({nights:,} nights)")
+    del loaded
+
+    began = time.perf_counter()
+    with ReservationFile(path) as history:
+        opened = time.perf_counter() - began
+        matrix = history.get_matrix()
+        if np is not None:
+            nights = int((matrix[:, 3] - matrix[:, 2]).sum())
+            label = "NumPy"
+        else:
+            nights = sum(check_out - check_in for _, _, check_in, check_out in history)
+            label = "iter_unpack"
+        del matrix
+    print(f"mmap open: {opened * 1000:.2f} ms; open + sum nights ({label}): "
+          f"{time.perf_counter() - began:.2f}s ({nights:,} nights)")
+
+    for name in os.listdir(folder):
+        os.remove(os.path.join(folder, name))
+    os.rmdir(folder)
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000000)
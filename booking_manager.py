@@ -0,0 +1,183 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+from Room import Room
+from guest import Guest
+from reservation import Reservation
+from availability import AvailabilityIndex
+from storage import BOOKED_NIGHTS_SCHEMA, claim_nights
+
+
+class ReservationManager:
+    """Books rooms for many threads at once; each room has its own lock so the check and the booking are one step."""
+
+    def __init__(self, rooms):
+        # Initialize the availability index and one lock per room
+        self.__availability = AvailabilityIndex(rooms)
+        self.__locks = {room.get_room_number(): threading.Lock() for room in rooms}
+        self.__guest_lock = threading.Lock()    # Guest objects are shared between threads too
+
+    def get_availability(self): return self.__availability  # Return the availability index
+
+    def book(self, guest, room_number, check_in, check_out):
+        # Book one room; return the Reservation, or None if the room is taken or unknown
+        return (self.book_many(guest, [room_number], check_in, check_out) or [None])[0]
+
+    def book_many(self, guest, room_numbers, check_in, check_out):
+        # Book several rooms for the same dates, all or nothing; return the Reservations or []
+        if check_out <= check_in:
+            raise ValueError("Check-out must be after check-in.")
+        numbers = sorted(set(room_numbers))
+        if any(n not in self.__locks for n in numbers):
+            return []
+        # Locks are always taken in room-number order, so two callers can never deadlock
+        locks = [self.__locks[n] for n in numbers]
+        for lock in locks:
+            lock.acquire()
+        try:
+            if not all(self.__availability.is_free(n, check_in, check_out) for n in numbers):
+                return []
+            reservations = [Reservation(guest, self.__availability.get_room(n), check_in, check_out)
+                            for n in numbers]
+            for reservation in reservations:
+                self.__availability.book(reservation)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+        with self.__guest_lock:
+            for reservation in reservations:
+                guest.add_reservation(reservation)
+        return reservations
+
+    def cancel(self, reservation):
+        # Free a reservation's dates
+        with self.__locks[reservation.get_room().get_room_number()]:
+            return self.__availability.release(reservation)
+
+
+class SharedBookingStore:
+    """Booking store shared by several processes through one SQLite file.
+
+    Every booked night is a row keyed by (room, night), so two overlapping
+    bookings cannot both commit: the second insert fails and is rolled back.
+    No read-then-write check is needed.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        # Open the shared file; each process opens its own store
+        self.__db = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.__db.execute("PRAGMA journal_mode=WAL")
+        self.__db.execute(BOOKED_NIGHTS_SCHEMA)
+
+    def close(self): self.__db.close()  # Close the connection
+
+    def book(self, guest, room_numbers, check_in, check_out):
+        # Book rooms for [check_in, check_out), all or nothing; return True on success
+        if check_out <= check_in:
+            raise ValueError("Check-out must be after check-in.")
+        try:
+            self.__db.execute("BEGIN IMMEDIATE")
+            claim_nights(self.__db, room_numbers, check_in, check_out, guest.get_email())
+            self.__db.execute("COMMIT")
+            return True
+        except BaseException as e:
+            # Never leave the transaction open, or every later book() would fail too
+            if self.__db.in_transaction:
+                self.__db.execute("ROLLBACK")
+            if isinstance(e, sqlite3.IntegrityError):
+                return False
+            raise
+
+    def count_nights(self):
+        # Return how many room-nights are booked
+        return self.__db.execute("SELECT COUNT(*) FROM booked_nights").fetchone()[0]
+
+
+# ---------------------- Stress Test ----------------------
+
+def _random_stays(count, rooms, seed):
+    # Return (room number, check_in, check_out) tuples that often collide
+    rng = random.Random(seed)
+    start = date(2026, 12, 1)
+    stays = []
+    for _ in range(count):
+        check_in = start + timedelta(days=rng.randrange(60))
+        stays.append((100 + rng.randrange(rooms), check_in, check_in + timedelta(days=1 + rng.randrange(5))))
+    return stays
+
+
+def _overlaps(bookings):
+    # Count pairs of overlapping bookings on the same room
+    by_room = {}
+    for room_number, check_in, check_out in bookings:
+        by_room.setdefault(room_number, []).append((check_in, check_out))
+    clashes = 0
+    for stays in by_room.values():
+        stays.sort()
+        for (_, previous_out), (next_in, _) in zip(stays, stays[1:]):
+            if next_in < previous_out:
+                clashes += 1
+    return clashes
+
+
+def _process_worker(job):
+    # Book a share of the stays into the shared store; return the successful ones
+    path, stays = job
+    store = SharedBookingStore(path)
+    guest = Guest("Worker", f"worker{os.getpid()}@example.com", "0500000000")
+    booked = [stay for stay in stays if store.book(guest, [stay[0]], stay[1], stay[2])]
+    store.close()
+    return booked
+
+
+def stress_test(attempts=20000, rooms=200, levels=(1, 2, 4, 8)):
+    """Book colliding stays from threads and from processes; return the number of double-bookings found."""
+    from multiprocessing import Pool
+
+    stays = _random_stays(attempts, rooms, seed=42)
+    room_list = [Room(100 + i, "Double", ["Wi-Fi"], 450) for i in range(rooms)]
+    clashes = 0
+
+    print("Threads sharing one ReservationManager:")
+    for workers in levels:
+        manager = ReservationManager(room_list)
+        guest = Guest("Stress Test", "stress@example.com", "0500000000")
+        began = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            results = list(pool.map(lambda s: manager.book(guest, *s), stays))
+        elapsed = time.perf_counter() - began
+        booked = [(r.get_room().get_room_number(), r.get_check_in(), r.get_check_out()) for r in results if r]
+        clashes += _overlaps(booked)
+        print(f"  {workers} workers: {len(booked)} booked, {_overlaps(booked)} double-bookings, "
+              f"{attempts / elapsed:,.0f} attempts/s")
+
+    print("Processes sharing one SQLite file:")
+    for workers in levels:
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, "bookings.db")
+        SharedBookingStore(path).close()
+        shares = [(path, stays[i::workers]) for i in range(workers)]
+        began = time.perf_counter()
+        with Pool(workers) as pool:
+            booked = [stay for share in pool.map(_process_worker, shares) for stay in share]
+        elapsed = time.perf_counter() - began
+        clashes += _overlaps(booked)
+        print(f"  {workers} workers: {len(booked)} booked, {_overlaps(booked)} double-bookings, "
+              f"{attempts / elapsed:,.0f} attempts/s")
+        for name in os.listdir(folder):
+            os.remove(os.path.join(folder, name))
+        os.rmdir(folder)
+    return clashes
+
+
+if __name__ == '__main__':
+    if stress_test():
+        print("❌ Double-bookings found.")
+        sys.exit(1)
@@ -0,0 +1,104 @@
+from datetime import date, timedelta
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to plain Python loops
+    np = None
+
+from Room import Room
+from invoice import Invoice
+from reservation import Reservation
+
+
+# ---------------------- Columnar Input ----------------------
+
+def invoice_columns(invoices):
+    """Split invoices into check-in, check-out, rate, charges, discount and room charge columns.
+
+    The room charge column is None unless some invoice has a pricing engine; then
+    it holds every row's room charge, the engine's quote for priced invoices and
+    nights * rate for the rest, so calculate_totals matches calculate_total.
+    """
+    check_ins, check_outs, rates, charges, discounts, room_charges = [], [], [], [], [], []
+    priced = False
+    for invoice in invoices:
+        reservation = invoice.get_reservation()
+        room, check_in, check_out = reservation.get_room(), reservation.get_check_in(), reservation.get_check_out()
+        check_ins.append(check_in)
+        check_outs.append(check_out)
+        rates.append(room.get_price_per_night())
+        charges.append(invoice.get_charges())
+        discounts.append(invoice.get_discount())
+        pricing = invoice.get_pricing()
+        if pricing is not None:
+            priced = True
+            room_charges.append(pricing.quote(room, check_in, check_out))
+        else:
+            room_charges.append((check_out - check_in).days * room.get_price_per_night())
+    if not priced:
+        room_charges = None     # Nothing priced: calculate_totals works from nights * rate
+    if np is not None:
+        return (np.array(check_ins, dtype="datetime64[D]"), np.array(check_outs, dtype="datetime64[D]"),
+                np.array(rates), np.array(charges), np.array(discounts),
+                None if room_charges is None else np.array(room_charges))
+    return check_ins, check_outs, rates, charges, discounts, room_charges
+
+
+# ---------------------- Batch Totals ----------------------
+
+def calculate_totals(check_ins, check_outs, rates, charges=50, discount=20, room_charges=None):
+    """Return nights * rate + charges - discount for every row, same as Invoice.calculate_total.
+
+    With a room_charges column (see invoice_columns) each row's room charge is
+    taken from it instead of nights * rate, as for invoices priced by a PricingEngine.
+    """
+    if np is not None:
+        # One vectorized pass; charges and discount may be scalars or columns
+        if room_charges is not None:
+            return np.asarray(room_charges) + np.asarray(charges) - np.asarray(discount)
+        nights = (np.asarray(check_outs, dtype="datetime64[D]")
+                  - np.asarray(check_ins, dtype="datetime64[D]")).astype(np.int64)
+        return nights * np.asarray(rates) + np.asarray(charges) - np.asarray(discount)
+
+    # Plain Python fallback
+    count = len(rates)
+    if not isinstance(charges, (list, tuple)):
+        charges = [charges] * count
+    if not isinstance(discount, (list, tuple)):
+        discount = [discount] * count
+    if room_charges is not None:
+        return [room + c - d for room, c, d in zip(room_charges, charges, discount)]
+    return [(co - ci).days * rate + c - d
+            for ci, co, rate, c, d in zip(check_ins, check_outs, rates, charges, discount)]
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(count=200000):
+    """Time Invoice.calculate_total one by one against calculate_totals."""
+    rooms = [Room(100 + i, "Single", [], price) for i, price in enumerate((300, 450, 800, 612.5))]
+    start = date(2026, 1, 1)
+    invoices = []
+    for i in range(count):
+        check_in = start + timedelta(days=i % 365)
+        reservation = Reservation(None, rooms[i % len(rooms)], check_in, check_in + timedelta(days=1 + i % 14))
+        invoices.append(Invoice(reservation, 50 + i % 3, 20 * (i % 2)))
+
+    began = time.perf_counter()
+    expected = [invoice.calculate_total() for invoice in invoices]
+    single = time.perf_counter() - began
+
+    columns = invoice_columns(invoices)
+    began = time.perf_counter()
+    totals = calculate_totals(*columns)
+    batch = time.perf_counter() - began
+
+    assert list(totals) == expected, "Batch totals differ from Invoice.calculate_total"
+    print(f"{count} invoices ({'NumPy' if np is not None else 'pure Python'})")
+    print(f"  calculate_total loop: {single:.4f}s")
+    print(f"  calculate_totals:     {batch:.4f}s  ({single / batch:.1f}x)")
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,223 @@
+from array import array
+from datetime import date, timedelta
+import tracemalloc
+
+from Room import Room
+from guest import Guest
+from reservation import Reservation
+
+
+# ---------------------- Slotted Domain Classes ----------------------
+
+class SlotRoom:
+    """Represents a room in the hotel, without a per-instance dict."""
+
+    __slots__ = ("__room_number", "__room_type", "__amenities", "__price_per_night", "__is_available")
+
+    def __init__(self, room_number, room_type, amenities, price_per_night):
+        # Initialize room details
+        self.__room_number = room_number        # Unique room number
+        self.__room_type = room_type            # Type: Single, Double, Suite
+        self.__amenities = amenities            # List of amenities
+        self.__price_per_night = price_per_night  # Cost per night
+        self.__is_available = True              # Availability status
+
+    def get_room_number(self): return self.__room_number  # Return room number
+    def get_room_type(self): return self.__room_type      # Return room type
+    def get_amenities(self): return self.__amenities      # Return amenities
+    def get_price_per_night(self): return self.__price_per_night  # Return price
+    def is_available(self): return self.__is_available    # Return availability
+    def set_availability(self, status): self.__is_available = status  # Set availability
+
+    def __str__(self):
+        # Return a string summary of the room
+        return f"Room {self.__room_number} - {self.__room_type} - AED{self.__price_per_night} - Available: {self.__is_available}"
+
+
+class SlotGuest:
+    """Represents a hotel guest, without a per-instance dict."""
+
+    __slots__ = ("__name", "__email", "__contact", "__reservations", "__loyalty_points")
+
+    def __init__(self, name, email, contact):
+        # Initialize guest details; the reservation list is created on first use
+        self.__name = name                      # Guest name
+        self.__email = email                    # Guest email
+        self.__contact = contact                # Guest contact number
+        self.__reservations = None              # List of reservations
+        self.__loyalty_points = 0               # Loyalty points
+
+    def get_name(self): return self.__name              # Get name
+    def get_email(self): return self.__email            # Get email
+    def get_contact(self): return self.__contact        # Get contact number
+    def get_loyalty_points(self): return self.__loyalty_points  # Get loyalty points
+
+    def set_name(self, name): self.__name = name        # Set name
+    def set_email(self, email): self.__email = email    # Set email
+    def set_contact(self, contact): self.__contact = contact  # Set contact
+
+    def add_reservation(self, reservation, points=10):
+        # Add a reservation and increase loyalty points
+        if self.__reservations is None:
+            self.__reservations = []
+        self.__reservations.append(reservation)
+        self.__loyalty_points += points
+
+    def add_loyalty_points(self, points): self.__loyalty_points += points  # Adjust loyalty points
+
+    def get_reservation_history(self): return self.__reservations or []  # Get all reservations
+
+
+class SlotReservation:
+    """Represents a reservation, without a per-instance dict."""
+
+    __slots__ = ("_guest", "_room", "_check_in", "_check_out")
+
+    def __init__(self, guest, room, check_in, check_out):
+        # Initialize reservation details
+        self._guest = guest            # Guest who made the reservation
+        self._room = room              # Room reserved
+        self._check_in = check_in      # Check-in date
+        self._check_out = check_out    # Check-out date
+
+    def get_guest(self): return self._guest        # Return guest
+    def get_room(self): return self._room          # Return room
+    def get_check_in(self): return self._check_in  # Return check-in
+    def get_check_out(self): return self._check_out  # Return check-out
+
+    def __str__(self):
+        # Return reservation summary
+        return f"Reservation: {self._guest.get_name()} in Room {self._room.get_room_number()} from {self._check_in} to {self._check_out}"
+
+
+# ---------------------- Columnar Store ----------------------
+
+class ReservationView:
+    """Read-only view of one row of a ReservationStore."""
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index):
+        # Point the view at a row of the store
+        self._store = store
+        self._index = index
+
+    def get_guest(self): return self._store.guest_at(self._index)          # Return guest
+    def get_room(self): return self._store.room_at(self._index)            # Return room
+    def get_check_in(self): return self._store.check_in_at(self._index)    # Return check-in
+    def get_check_out(self): return self._store.check_out_at(self._index)  # Return check-out
+
+    def __str__(self):
+        # Return reservation summary
+        return f"Reservation: {self.get_guest().get_name()} in Room {self.get_room().get_room_number()} from {self.get_check_in()} to {self.get_check_out()}"
+
+
+class ReservationStore:
+    """Keeps reservations as typed columns; guests and rooms are stored once each."""
+
+    def __init__(self):
+        # Initialize empty columns
+        self.__guests = []              # Distinct guests
+        self.__guest_ids = {}           # id(guest) -> position in guests
+        self.__rooms = []               # Distinct rooms
+        self.__room_ids = {}            # id(room) -> position in rooms
+        self.__guest_col = array("l")   # Guest position per reservation
+        self.__room_col = array("l")    # Room position per reservation
+        self.__check_in_col = array("l")   # Check-in date ordinal per reservation
+        self.__check_out_col = array("l")  # Check-out date ordinal per reservation
+
+    def __intern(self, obj, items, ids):
+        # Return the position of obj, storing it on first sight
+        key = id(obj)
+        pos = ids.get(key)
+        if pos is None:
+            pos = ids[key] = len(items)
+            items.append(obj)
+        return pos
+
+    def add(self, guest, room, check_in, check_out):
+        # Append a reservation and return a view of it
+        self.__guest_col.append(self.__intern(guest, self.__guests, self.__guest_ids))
+        self.__room_col.append(self.__intern(room, self.__rooms, self.__room_ids))
+        self.__check_in_col.append(check_in.toordinal())
+        self.__check_out_col.append(check_out.toordinal())
+        return ReservationView(self, len(self.__guest_col) - 1)
+
+    def add_reservation(self, reservation):
+        # Copy an existing Reservation into the store
+        return self.add(reservation.get_guest(), reservation.get_room(),
+                        reservation.get_check_in(), reservation.get_check_out())
+
+    def guest_at(self, index): return self.__guests[self.__guest_col[index]]   # Guest of a row
+    def room_at(self, index): return self.__rooms[self.__room_col[index]]      # Room of a row
+    def check_in_at(self, index): return date.fromordinal(self.__check_in_col[index])    # Check-in of a row
+    def check_out_at(self, index): return date.fromordinal(self.__check_out_col[index])  # Check-out of a row
+
+    def get_check_in_ordinals(self): return self.__check_in_col    # Raw check-in column
+    def get_check_out_ordinals(self): return self.__check_out_col  # Raw check-out column
+
+    def __len__(self): return len(self.__guest_col)
+
+    def __getitem__(self, index):
+        # Return a view of a row, supporting negative indexes
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Reservation index out of range.")
+        return ReservationView(self, index)
+
+    def __iter__(self):
+        # Yield a view per row
+        for index in range(len(self)):
+            yield ReservationView(self, index)
+
+
+# ---------------------- Memory Benchmark ----------------------
+
+def _measure(build):
+    # Return the bytes still allocated by build() once it finishes
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def benchmark(guests=10000, rooms=500, reservations=200000):
+    """Compare memory of the dict-backed classes, the slotted classes and the store."""
+    start = date(2026, 1, 1)
+    stays = [(i % guests, i % rooms, start + timedelta(days=i % 365)) for i in range(reservations)]
+
+    def build(room_cls, guest_cls, reservation_cls):
+        room_list = [room_cls(100 + r, "Double", ["Wi-Fi"], 450) for r in range(rooms)]
+        guest_list = [guest_cls(f"Guest {g}", f"guest{g}@example.com", f"05{g:08d}") for g in range(guests)]
+        for g, r, check_in in stays:
+            reservation = reservation_cls(guest_list[g], room_list[r], check_in, check_in + timedelta(days=3))
+            guest_list[g].add_reservation(reservation)
+        return room_list, guest_list
+
+    def build_store():
+        room_list = [SlotRoom(100 + r, "Double", ["Wi-Fi"], 450) for r in range(rooms)]
+        guest_list = [SlotGuest(f"Guest {g}", f"guest{g}@example.com", f"05{g:08d}") for g in range(guests)]
+        store = ReservationStore()
+        # Each guest's history is kept too, as row positions, so all three variants hold the same data
+        history = [array("l") for _ in guest_list]
+        for g, r, check_in in stays:
+            store.add(guest_list[g], room_list[r], check_in, check_in + timedelta(days=3))
+            history[g].append(len(store) - 1)
+            guest_list[g].add_loyalty_points(10)
+        return store, history
+
+    results = [
+        ("Room/Guest/Reservation", _measure(lambda: build(Room, Guest, Reservation))),
+        ("Slot classes", _measure(lambda: build(SlotRoom, SlotGuest, SlotReservation))),
+        ("ReservationStore", _measure(build_store)),     # Histories as row positions per guest
+    ]
+    print(f"{reservations} reservations, {guests} guests, {rooms} rooms")
+    for label, size in results:
+        print(f"  {label:<24}{size / 1024 / 1024:8.1f} MiB")
+
+
+if __name__ == '__main__':
+    benchmark()
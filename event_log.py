@@ -0,0 +1,469 @@
+from array import array
+from datetime import date
+import mmap
+import os
+import pickle
+import random
+import struct
+import sys
+import tempfile
+import time
+
+from Room import Room
+from guest import Guest
+from reservation import Reservation
+from service import ServiceRequest
+from feedback import Feedback
+
+# Event types and the fixed-width fields each one carries; text fields follow them
+ROOM_ADDED = 1              # room number, price | room type, amenities...
+ROOM_AVAILABILITY = 2       # room number, status
+GUEST_ADDED = 3             # guest id | name, email, contact
+RESERVATION_ADDED = 4       # reservation id, guest id, room number, check-in, check-out (day ordinals)
+RESERVATION_CANCELLED = 5   # reservation id
+SERVICE_REQUESTED = 6       # request id, guest id | service type
+SERVICE_COMPLETED = 7       # request id
+FEEDBACK_ADDED = 8          # guest id, rating | comments
+
+FIELDS = {
+    ROOM_ADDED: struct.Struct("<id"),
+    ROOM_AVAILABILITY: struct.Struct("<i?"),
+    GUEST_ADDED: struct.Struct("<q"),
+    RESERVATION_ADDED: struct.Struct("<qqiii"),
+    RESERVATION_CANCELLED: struct.Struct("<q"),
+    SERVICE_REQUESTED: struct.Struct("<qq"),
+    SERVICE_COMPLETED: struct.Struct("<q"),
+    FEEDBACK_ADDED: struct.Struct("<qb"),
+}
+
+# Event types whose fixed-width fields are followed by text fields
+TEXT_KINDS = frozenset((ROOM_ADDED, GUEST_ADDED, SERVICE_REQUESTED, FEEDBACK_ADDED))
+
+# Every event is framed as: payload length, event type, then the payload
+HEADER = struct.Struct("<IB")
+SEPARATOR = "\x00"          # Joins an event's text fields
+
+
+def encode_event(kind, values, texts=()):
+    """Return the framed bytes of one event.
+
+    Raises ValueError if a text field contains the separator, which would split
+    it in two on replay.
+    """
+    payload = FIELDS[kind].pack(*values)
+    if any(SEPARATOR in text for text in texts):
+        raise ValueError("Text fields cannot contain NUL characters.")
+    if texts:
+        payload += SEPARATOR.join(texts).encode("utf-8")
+    return HEADER.pack(len(payload), kind) + payload
+
+
+def read_events(path, start=0):
+    """Yield (end offset, event type, fixed values, text fields) for every complete event after start.
+
+    The file is memory-mapped, so the tail is read straight from the page cache.
+    A partly written last event (e.g. after a crash) is ignored.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) <= start:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        size = len(data)
+        offset = start
+        unpack_header = HEADER.unpack_from
+        while offset + HEADER.size <= size:
+            length, kind = unpack_header(data, offset)
+            body = offset + HEADER.size
+            end = body + length
+            if end > size:
+                break
+            fields = FIELDS[kind]
+            values = fields.unpack_from(data, body)
+            # An empty text section is still one (empty) text field for the kinds that carry text
+            texts = data[body + fields.size:end].decode("utf-8").split(SEPARATOR) if kind in TEXT_KINDS else ()
+            yield end, kind, values, texts
+            offset = end
+
+
+# ---------------------- State ----------------------
+
+class HotelState:
+    """Rooms, guests, reservations, service requests and feedback rebuilt from events."""
+
+    def __init__(self):
+        # Initialize empty state
+        self.rooms = {}             # Room number -> Room
+        self.guests = {}            # Guest id -> Guest
+        self.guest_ids = {}         # Guest -> guest id
+        self.reservations = {}      # Reservation id -> Reservation
+        self.service_requests = {}  # Request id -> ServiceRequest
+        self.feedback = []          # Feedback in arrival order
+        self.events = 0             # Events applied so far
+        # Next id of each kind; ids are never reused, even after a cancellation
+        self.next_ids = {"guest": 1, "reservation": 1, "service": 1}
+
+    def apply(self, kind, values, texts):
+        # Apply one event; an event naming an unknown room, guest or request raises
+        # KeyError and leaves the state unchanged
+        if kind == ROOM_AVAILABILITY:
+            self.rooms[values[0]].set_availability(values[1])
+        elif kind == RESERVATION_ADDED:
+            reservation_id, guest_id, room_number, check_in, check_out = values
+            guest = self.guests[guest_id]
+            reservation = Reservation(guest, self.rooms[room_number],
+                                      date.fromordinal(check_in), date.fromordinal(check_out))
+            guest.add_reservation(reservation)
+            self.reservations[reservation_id] = reservation
+            self.next_ids["reservation"] = max(self.next_ids["reservation"], reservation_id + 1)
+        elif kind == RESERVATION_CANCELLED:
+            self.reservations.pop(values[0], None)
+        elif kind == SERVICE_REQUESTED:
+            self.service_requests[values[0]] = ServiceRequest(self.guests[values[1]], texts[0])
+            self.next_ids["service"] = max(self.next_ids["service"], values[0] + 1)
+        elif kind == SERVICE_COMPLETED:
+            self.service_requests[values[0]].mark_completed()
+        elif kind == FEEDBACK_ADDED:
+            self.feedback.append(Feedback(self.guests[values[0]], values[1], texts[0]))
+        elif kind == GUEST_ADDED:
+            guest = self.guests[values[0]] = Guest(*texts)
+            self.guest_ids[guest] = values[0]
+            self.next_ids["guest"] = max(self.next_ids["guest"], values[0] + 1)
+        elif kind == ROOM_ADDED:
+            price = values[1]       # Stored as a double; whole prices come back as ints
+            self.rooms[values[0]] = Room(values[0], texts[0], list(texts[1:]),
+                                         int(price) if float(price).is_integer() else price)
+        else:
+            raise ValueError(f"Unknown event type {kind}.")
+        self.events += 1
+
+    def to_columns(self):
+        # Return the state as plain columns (arrays and lists of strings), which pickle
+        # far faster than the objects themselves
+        active = {id(reservation): rid for rid, reservation in self.reservations.items()}
+        request_guests = array("q", (self.guest_ids[r.get_guest()] for r in self.service_requests.values()))
+        history = (array("q"), array("q"), array("l"), array("l"), array("l"))  # id (0 = cancelled), guest, room, in, out
+        for guest_id, guest in self.guests.items():
+            for reservation in guest.get_reservation_history():
+                for column, value in zip(history, (active.get(id(reservation), 0), guest_id,
+                                                   reservation.get_room().get_room_number(),
+                                                   reservation.get_check_in().toordinal(),
+                                                   reservation.get_check_out().toordinal())):
+                    column.append(value)
+        return {
+            "rooms": [(n, r.get_room_type(), r.get_amenities(), r.get_price_per_night(), r.is_available())
+                      for n, r in self.rooms.items()],
+            "guests": [(i, g.get_name(), g.get_email(), g.get_contact()) for i, g in self.guests.items()],
+            "reservations": history,
+            "service_requests": (array("q", self.service_requests), request_guests,
+                                 [r.get_service_type() for r in self.service_requests.values()],
+                                 array("b", (r.get_status() == "Completed" for r in self.service_requests.values()))),
+            "feedback": (array("q", (self.guest_ids[f.get_guest()] for f in self.feedback)),
+                         array("b", (f.get_rating() for f in self.feedback)),
+                         [f.get_comments() for f in self.feedback]),
+            "events": self.events,
+            "next_ids": dict(self.next_ids),
+        }
+
+    @classmethod
+    def from_columns(cls, columns):
+        # Rebuild the state from to_columns() output
+        state = cls()
+        for number, room_type, amenities, price, available in columns["rooms"]:
+            room = state.rooms[number] = Room(number, room_type, amenities, price)
+            room.set_availability(available)
+        for guest_id, name, email, contact in columns["guests"]:
+            guest = state.guests[guest_id] = Guest(name, email, contact)
+            state.guest_ids[guest] = guest_id
+        rooms, guests, fromordinal = state.rooms, state.guests, date.fromordinal
+        for reservation_id, guest_id, room_number, check_in, check_out in zip(*columns["reservations"]):
+            guest = guests[guest_id]
+            reservation = Reservation(guest, rooms[room_number], fromordinal(check_in), fromordinal(check_out))
+            guest.add_reservation(reservation)
+            if reservation_id:
+                state.reservations[reservation_id] = reservation
+        for request_id, guest_id, service_type, completed in zip(*columns["service_requests"]):
+            request = state.service_requests[request_id] = ServiceRequest(guests[guest_id], service_type)
+            if completed:
+                request.mark_completed()
+        state.feedback = [Feedback(guests[g], rating, comments) for g, rating, comments in zip(*columns["feedback"])]
+        state.events = columns["events"]
+        state.next_ids = dict(columns["next_ids"])
+        return state
+
+
+# ---------------------- Writer ----------------------
+
+class EventLog:
+    """Append-only event file written through a buffer and fsynced in batches."""
+
+    def __init__(self, path, sync_every=1000, buffer_size=1 << 20):
+        # Open the log for appending; sync_every events share one fsync
+        self.__file = open(path, "ab", buffering=buffer_size)
+        self.__offset = self.__file.tell()  # Bytes in the log, including buffered ones
+        self.__sync_every = sync_every
+        self.__pending = 0                  # Events written since the last fsync
+
+    def get_offset(self): return self.__offset  # Return the end of the last appended event
+
+    def append(self, kind, values, texts=()):
+        # Append one event; return the offset just after it
+        return self.append_frame(encode_event(kind, values, texts))
+
+    def append_frame(self, frame):
+        # Append one event already framed by encode_event(); return the offset just after it
+        self.__file.write(frame)
+        self.__offset += len(frame)
+        self.__pending += 1
+        if self.__pending >= self.__sync_every:
+            self.sync()
+        return self.__offset
+
+    def sync(self):
+        # Flush the buffer and make every appended event durable
+        if self.__pending:
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__pending = 0
+
+    def close(self):
+        # Sync and close the file
+        self.sync()
+        self.__file.close()
+
+
+class EventStore:
+    """Records domain changes as events and rebuilds state from the latest snapshot plus the log tail.
+
+    The snapshot sits next to the log (path + ".snapshot") and stores the log
+    offset it covers, so opening a store only replays the events written after it.
+    """
+
+    def __init__(self, path, sync_every=1000, snapshot_every=1000000):
+        # Load the latest snapshot, replay the rest of the log and open it for appending
+        self.__path = path
+        self.__snapshot_path = path + ".snapshot"
+        self.__snapshot_every = snapshot_every  # Events between automatic snapshots, None for never
+        self.__state, offset = HotelState(), 0
+        if os.path.exists(self.__snapshot_path):
+            with open(self.__snapshot_path, "rb") as f:
+                offset, columns = pickle.load(f)
+            self.__state = HotelState.from_columns(columns)
+        self.__replayed = 0
+        apply = self.__state.apply
+        for offset, kind, values, texts in read_events(path, offset):
+            apply(kind, values, texts)
+            self.__replayed += 1
+        if os.path.exists(path) and os.path.getsize(path) > offset:
+            os.truncate(path, offset)       # Drop a partly written last event
+        self.__log = EventLog(path, sync_every)
+        self.__since_snapshot = self.__replayed
+
+    def get_state(self): return self.__state        # Return the current HotelState
+    def get_replayed(self): return self.__replayed  # Return events replayed on open
+
+    def __record(self, kind, values, texts=()):
+        # Apply an event, append it and snapshot when due. Applying first means an
+        # event that fails (e.g. an unknown guest id) never reaches the log
+        frame = encode_event(kind, values, texts)
+        self.__state.apply(kind, values, texts)
+        self.__log.append_frame(frame)
+        self.__since_snapshot += 1
+        if self.__snapshot_every and self.__since_snapshot >= self.__snapshot_every:
+            self.snapshot()
+
+    def __next_id(self, name):
+        # Return the id the next guest, reservation or service request will get;
+        # applying its event moves the counter on
+        return self.__state.next_ids[name]
+
+    # ---------------------- Domain Changes ----------------------
+
+    def add_room(self, room_number, room_type, amenities, price_per_night):
+        # Add a room; return it
+        self.__record(ROOM_ADDED, (room_number, price_per_night), [room_type] + list(amenities))
+        return self.__state.rooms[room_number]
+
+    def set_availability(self, room_number, status):
+        # Record a room's availability flag
+        self.__record(ROOM_AVAILABILITY, (room_number, status))
+
+    def add_guest(self, name, email, contact):
+        # Add a guest; return the guest id
+        guest_id = self.__next_id("guest")
+        self.__record(GUEST_ADDED, (guest_id,), (name, email, contact))
+        return guest_id
+
+    def add_reservation(self, guest_id, room_number, check_in, check_out):
+        # Book a stay and add it to the guest's history; return the reservation id
+        reservation_id = self.__next_id("reservation")
+        self.__record(RESERVATION_ADDED, (reservation_id, guest_id, room_number,
+                                          check_in.toordinal(), check_out.toordinal()))
+        return reservation_id
+
+    def cancel_reservation(self, reservation_id):
+        # Cancel a reservation
+        self.__record(RESERVATION_CANCELLED, (reservation_id,))
+
+    def request_service(self, guest_id, service_type):
+        # Open a service request; return its id
+        request_id = self.__next_id("service")
+        self.__record(SERVICE_REQUESTED, (request_id, guest_id), (service_type,))
+        return request_id
+
+    def mark_completed(self, request_id):
+        # Mark a service request completed
+        self.__record(SERVICE_COMPLETED, (request_id,))
+
+    def add_feedback(self, guest_id, rating, comments):
+        # Record a guest's feedback
+        self.__record(FEEDBACK_ADDED, (guest_id, rating), (comments,))
+
+    # ---------------------- Durability ----------------------
+
+    def sync(self): self.__log.sync()  # Make every recorded event durable
+
+    def snapshot(self):
+        # Save the state and the log offset it covers; the log is synced first
+        self.__log.sync()
+        with open(self.__snapshot_path + ".tmp", "wb") as f:
+            pickle.dump((self.__log.get_offset(), self.__state.to_columns()), f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(self.__snapshot_path + ".tmp", self.__snapshot_path)
+        self.__since_snapshot = 0
+
+    def close(self):
+        # Sync and close the log
+        self.__log.close()
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+
+# ---------------------- Benchmark ----------------------
+
+def _summary(state):
+    # Return the state as plain values, for comparing two replays
+    return (sorted((n, str(r)) for n, r in state.rooms.items()),
+            sorted((i, g.get_name(), g.get_email(), g.get_contact(), len(g.get_reservation_history()))
+                   for i, g in state.guests.items()),
+            sorted((i, str(r)) for i, r in state.reservations.items()),
+            sorted((i, r.get_service_type(), r.get_status()) for i, r in state.service_requests.items()),
+            [(f.get_rating(), f.get_comments()) for f in state.feedback],
+            state.next_ids)
+
+
+def check_replay():
+    """Write events, reopen the store from the log alone and from a snapshot, and check the state survives."""
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "hotel.log")
+    try:
+        with EventStore(path) as store:
+            store.add_room(101, "Single", [], 300)
+            store.add_room(201, "Suite", ["Wi-Fi", "Jacuzzi"], 812.5)
+            ann = store.add_guest("Ann", "ann@example.com", "0501234567")
+            store.add_reservation(ann, 101, date(2026, 7, 1), date(2026, 7, 4))
+            newest = store.add_reservation(ann, 201, date(2026, 7, 5), date(2026, 7, 6))
+            store.cancel_reservation(newest)
+            store.mark_completed(store.request_service(ann, ""))
+            store.add_feedback(ann, 5, "")      # Empty text fields must replay too
+            store.set_availability(101, False)
+            store.add_room(201, "Suite", ["Wi-Fi"], 900)    # Re-added: older stays keep their room number
+            try:
+                store.add_guest("Bob\x00", "bob@example.com", "0507654321")
+            except ValueError:
+                pass                            # A NUL would split the name in two on replay
+            else:
+                raise AssertionError("A text field with a NUL was accepted")
+            try:
+                store.add_reservation(99, 101, date(2026, 8, 1), date(2026, 8, 2))
+            except KeyError:
+                pass                            # Unknown guest: rejected before it is logged
+            else:
+                raise AssertionError("A reservation for an unknown guest was accepted")
+            expected = _summary(store.get_state())
+        with EventStore(path) as store:
+            assert _summary(store.get_state()) == expected, "Replay from the log differs"
+            assert store.add_reservation(ann, 201, date(2026, 9, 1), date(2026, 9, 2)) == newest + 1, \
+                "A cancelled reservation id was handed out again"
+            store.snapshot()
+            expected = _summary(store.get_state())
+        with EventStore(path) as store:
+            assert store.get_replayed() == 0 and _summary(store.get_state()) == expected, "Replay from the snapshot differs"
+        print("replay check passed")
+    finally:
+        for name in os.listdir(folder):
+            os.remove(os.path.join(folder, name))
+        os.rmdir(folder)
+
+
+def benchmark(events=10000000, rooms=2000, guests=100000):
+    """Write a log of mixed events, then time raw reads, full replay and snapshot + tail startup."""
+    check_replay()
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "hotel.log")
+    rng = random.Random(20)
+    start = date(2026, 1, 1).toordinal()
+    types = (("Single", 300), ("Double", 450), ("Suite", 800))
+    services = ("Housekeeping", "Room Service", "Laundry")
+
+    began = time.perf_counter()
+    with EventStore(path, sync_every=10000, snapshot_every=None) as store:
+        for i in range(rooms):
+            room_type, price = types[i % 3]
+            store.add_room(100 + i, room_type, ["Wi-Fi", "TV"], price)
+        for i in range(guests):
+            store.add_guest(f"Guest {i}", f"guest{i}@example.com", f"05{i:08d}")
+        written = rooms + guests
+        reservation_id = request_id = 0
+        while written < events:
+            roll = rng.random()
+            if roll < 0.5:
+                store.set_availability(100 + rng.randrange(rooms), roll < 0.25)
+            elif roll < 0.7:
+                check_in = start + rng.randrange(365)
+                store.add_reservation(1 + rng.randrange(guests), 100 + rng.randrange(rooms),
+                                      date.fromordinal(check_in), date.fromordinal(check_in + rng.randint(1, 7)))
+                reservation_id += 1
+            elif roll < 0.75 and reservation_id:
+                store.cancel_reservation(1 + rng.randrange(reservation_id))
+            elif roll < 0.85:
+                store.request_service(1 + rng.randrange(guests), services[rng.randrange(3)])
+                request_id += 1
+            elif roll < 0.95 and request_id:
+                store.mark_completed(1 + rng.randrange(request_id))
+            else:
+                store.add_feedback(1 + rng.randrange(guests), rng.randint(1, 5), "Lovely stay")
+            written += 1
+    elapsed = time.perf_counter() - began
+    size = os.path.getsize(path)
+    print(f"wrote {events:,} events ({size / 1e6:.0f} MB) in {elapsed:.1f}s = {events / elapsed:,.0f} events/s")
+
+    began = time.perf_counter()
+    count = sum(1 for _ in read_events(path))
+    elapsed = time.perf_counter() - began
+    print(f"read (mmap + decode): {count:,} events in {elapsed:.1f}s = {count / elapsed:,.0f} events/s")
+
+    began = time.perf_counter()
+    store = EventStore(path, snapshot_every=None)
+    elapsed = time.perf_counter() - began
+    print(f"full replay: {store.get_replayed():,} events in {elapsed:.1f}s = {store.get_replayed() / elapsed:,.0f} events/s")
+
+    began = time.perf_counter()
+    store.snapshot()
+    print(f"snapshot: {time.perf_counter() - began:.1f}s")
+    for i in range(100000):
+        store.set_availability(100 + i % rooms, i % 2 == 0)
+    store.close()
+    del store
+
+    began = time.perf_counter()
+    store = EventStore(path, snapshot_every=None)
+    print(f"startup from snapshot + {store.get_replayed():,} tail events: {time.perf_counter() - began:.1f}s")
+    store.close()
+    for name in os.listdir(folder):
+        os.remove(os.path.join(folder, name))
+    os.rmdir(folder)
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000000)
@@ -7,6 +7,10 @@ class Feedback:
         self.__rating = rating          # Rating out of 5
         self.__comments = comments      # Feedback comment
 
+    def get_guest(self): return self._guest         # Return guest
+    def get_rating(self): return self.__rating      # Return rating
+    def get_comments(self): return self.__comments  # Return comments
+
     def __str__(self):
         # Return feedback summary
         return f"Feedback from {self._guest.get_name()}: {self.__rating}/5 - {self.__comments}"
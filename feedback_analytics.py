@@ -0,0 +1,223 @@
+from collections import deque
+from datetime import date, timedelta
+import json
+import os
+import random
+import time
+
+from validation import is_valid_rating
+
+_STARS = frozenset(range(1, 6))     # Ratings a histogram can hold
+
+class RatingStats:
+    """Count, mean and 1-5 histogram of ratings, updated in O(1)."""
+
+    def __init__(self, count=0, total=0, histogram=None):
+        # Initialize from saved values or empty
+        self.__count = count                            # Number of ratings
+        self.__total = total                            # Sum of ratings
+        self.__histogram = list(histogram or [0] * 5)   # Ratings per star, 1 to 5
+
+    def add(self, rating, sign=1):
+        # Add one rating (or remove it with sign=-1)
+        if rating not in _STARS:
+            raise ValueError(f"Rating must be between 1 and 5, got {rating!r}.")
+        self.__count += sign
+        self.__total += sign * rating
+        self.__histogram[rating - 1] += sign
+
+    def merge(self, other, sign=1):
+        # Add (or remove) all ratings of another RatingStats
+        self.__count += sign * other.get_count()
+        self.__total += sign * other.get_total()
+        for i, n in enumerate(other.get_histogram()):
+            self.__histogram[i] += sign * n
+
+    def get_count(self): return self.__count                # Return count
+    def get_total(self): return self.__total                # Return sum
+    def get_histogram(self): return list(self.__histogram)  # Return histogram
+    def get_mean(self): return self.__total / self.__count if self.__count else 0.0  # Return mean
+
+    def to_dict(self): return {"count": self.__count, "total": self.__total, "histogram": list(self.__histogram)}
+
+    def __str__(self):
+        # Return a one-line summary
+        return f"{self.__count} ratings, mean {self.get_mean():.2f}/5, histogram {self.__histogram}"
+
+
+class FeedbackAggregator:
+    """Keeps per-room, per-room-type, per-day and rolling-window rating stats as feedback arrives."""
+
+    def __init__(self, window_days=7):
+        # Initialize empty aggregates
+        self.__window_days = window_days
+        self.__overall = RatingStats()
+        self.__by_room = {}         # Room number -> RatingStats
+        self.__by_type = {}         # Room type -> RatingStats
+        self.__by_day = {}          # ISO date -> RatingStats
+        self.__window = deque()     # Days in the rolling window, oldest first
+        self.__window_stats = RatingStats()
+        self.__latest_day = None    # Newest day seen
+        self.__offsets = {}         # JSONL path -> bytes already ingested
+        self.__rejected = 0         # JSONL lines skipped as invalid
+
+    # ---------------------- Ingest ----------------------
+
+    def add(self, rating, room_number=None, room_type=None, day=None):
+        # Add one rating, a whole number from 1 to 5; day defaults to today
+        if isinstance(rating, bool) or not isinstance(rating, int) or not is_valid_rating(str(rating)):
+            raise ValueError(f"Rating must be between 1 and 5, got {rating!r}.")
+        # Check the keys too before anything is counted, so a bad one leaves no partial update
+        if room_number is not None and (isinstance(room_number, bool) or not isinstance(room_number, (int, str))):
+            raise TypeError(f"Room number must be an int or str, got {room_number!r}.")
+        if room_type is not None and not isinstance(room_type, str):
+            raise TypeError(f"Room type must be a str, got {room_type!r}.")
+        if day is not None and not isinstance(day, date):
+            raise TypeError(f"Day must be a date, got {day!r}.")
+        day = day or date.today()
+        self.__overall.add(rating)
+        if room_number is not None:
+            self.__by_room.setdefault(room_number, RatingStats()).add(rating)
+        if room_type is not None:
+            self.__by_type.setdefault(room_type, RatingStats()).add(rating)
+        key = day.isoformat()
+        if key not in self.__by_day:
+            self.__by_day[key] = RatingStats()
+        self.__by_day[key].add(rating)
+        self.__advance_window(day, rating)
+
+    def __advance_window(self, day, rating):
+        # Slide the rolling window forward to day and count the rating if it falls inside
+        if self.__latest_day is None or day > self.__latest_day:
+            self.__latest_day = day
+            oldest = day - timedelta(days=self.__window_days - 1)
+            while self.__window and self.__window[0] < oldest:
+                self.__window_stats.merge(self.__by_day[self.__window.popleft().isoformat()], -1)
+            self.__window.append(day)
+            self.__window_stats.add(rating)
+        elif day > self.__latest_day - timedelta(days=self.__window_days):
+            # Late rating for a day still inside the window
+            if day not in self.__window:
+                self.__window = deque(sorted(self.__window + deque([day])))
+            self.__window_stats.add(rating)
+
+    def ingest(self, feedback, room=None, day=None):
+        # Add a Feedback object; the room defaults to the guest's latest reservation
+        if room is None:
+            history = feedback.get_guest().get_reservation_history()
+            room = history[-1].get_room() if history else None
+        self.add(feedback.get_rating(),
+                 room.get_room_number() if room is not None else None,
+                 room.get_room_type() if room is not None else None, day)
+
+    def ingest_jsonl(self, path):
+        # Add every {"rating", "room", "room_type", "date"} line not ingested yet; return how many.
+        # Invalid lines are skipped and counted in get_rejected()
+        added = 0
+        with open(path, "rb") as f:
+            f.seek(self.__offsets.get(path, 0))
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break       # Partial last line; pick it up on the next call
+                if line.strip():
+                    try:
+                        event = json.loads(line)
+                        self.add(event["rating"], event.get("room"), event.get("room_type"),
+                                 date.fromisoformat(event["date"]) if event.get("date") else None)
+                        added += 1
+                    except (ValueError, TypeError, KeyError):
+                        self.__rejected += 1
+                self.__offsets[path] = self.__offsets.get(path, 0) + len(line)
+        return added
+
+    # ---------------------- Queries ----------------------
+
+    def get_overall(self): return self.__overall                         # All ratings
+    def get_room(self, room_number): return self.__by_room.get(room_number, RatingStats())  # One room
+    def get_room_type(self, room_type): return self.__by_type.get(room_type, RatingStats())  # One room type
+    def get_day(self, day): return self.__by_day.get(day.isoformat(), RatingStats())        # One day
+    def get_rolling(self): return self.__window_stats                    # Last window_days days
+    def get_rejected(self): return self.__rejected                       # Invalid JSONL lines skipped
+
+    def dashboard(self):
+        # Return the current aggregates as plain dicts
+        return {
+            "overall": self.__overall.to_dict(),
+            "rolling": dict(self.__window_stats.to_dict(), days=self.__window_days),
+            "by_room": {str(k): v.to_dict() for k, v in self.__by_room.items()},
+            "by_room_type": {k: v.to_dict() for k, v in self.__by_type.items()},
+        }
+
+    # ---------------------- Snapshot ----------------------
+
+    def snapshot(self, path):
+        # Save the aggregates (and JSONL read positions) atomically to path
+        state = {
+            "window_days": self.__window_days,
+            "overall": self.__overall.to_dict(),
+            "by_room": [[k, v.to_dict()] for k, v in self.__by_room.items()],
+            "by_type": {k: v.to_dict() for k, v in self.__by_type.items()},
+            "by_day": {k: v.to_dict() for k, v in self.__by_day.items()},
+            "window": [d.isoformat() for d in self.__window],
+            "window_stats": self.__window_stats.to_dict(),
+            "latest_day": self.__latest_day.isoformat() if self.__latest_day else None,
+            "offsets": self.__offsets,
+            "rejected": self.__rejected,
+        }
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def restore(cls, path):
+        # Rebuild an aggregator from a snapshot file
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        aggregator = cls(state["window_days"])
+        aggregator.__overall = RatingStats(**state["overall"])
+        aggregator.__by_room = {k: RatingStats(**v) for k, v in state["by_room"]}
+        aggregator.__by_type = {k: RatingStats(**v) for k, v in state["by_type"].items()}
+        aggregator.__by_day = {k: RatingStats(**v) for k, v in state["by_day"].items()}
+        aggregator.__window = deque(date.fromisoformat(d) for d in state["window"])
+        aggregator.__window_stats = RatingStats(**state["window_stats"])
+        aggregator.__latest_day = date.fromisoformat(state["latest_day"]) if state["latest_day"] else None
+        aggregator.__offsets = state["offsets"]
+        aggregator.__rejected = state.get("rejected", 0)
+        return aggregator
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(events=1000000):
+    """Time ingesting a feedback stream and restoring from a snapshot."""
+    import tempfile
+
+    rng = random.Random(7)
+    start = date(2026, 1, 1)
+    types = ("Single", "Double", "Suite")
+    folder = tempfile.mkdtemp()
+    stream = os.path.join(folder, "feedback.jsonl")
+    with open(stream, "w", encoding="utf-8") as f:
+        for i in range(events):
+            room = 100 + rng.randrange(500)
+            f.write(json.dumps({"rating": rng.randint(1, 5), "room": room, "room_type": types[room % 3],
+                                "date": (start + timedelta(days=i * 365 // events)).isoformat()}) + "\n")
+
+    aggregator = FeedbackAggregator()
+    began = time.perf_counter()
+    aggregator.ingest_jsonl(stream)
+    elapsed = time.perf_counter() - began
+    print(f"ingested {events} events in {elapsed:.2f}s = {events / elapsed:,.0f} events/s")
+
+    snapshot = os.path.join(folder, "feedback.snapshot.json")
+    aggregator.snapshot(snapshot)
+    began = time.perf_counter()
+    restored = FeedbackAggregator.restore(snapshot)
+    print(f"restored snapshot in {(time.perf_counter() - began) * 1000:.1f} ms; "
+          f"{restored.ingest_jsonl(stream)} events left to replay")
+    print("overall:", restored.get_overall())
+    print("rolling:", restored.get_rolling())
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,191 @@
+from datetime import date, timedelta
+import random
+import sys
+import time
+
+from Room import Room
+from guest import Guest
+from reservation import Reservation
+from invoice import Invoice
+from availability import AvailabilityIndex
+from bulk_invoice import invoice_columns, calculate_totals
+
+
+class BlockRequest:
+    """A group's request for a block of rooms: rooms wanted per type, shared dates and a rooming list."""
+
+    def __init__(self, group_name, room_counts, check_in, check_out, rooming_list):
+        # Initialize request details; rooming_list holds one Guest per room, filling
+        # the room types in the order room_counts lists them
+        if check_out <= check_in:
+            raise ValueError("Check-out must be after check-in.")
+        if any(count < 0 for count in room_counts.values()):
+            raise ValueError("Room counts cannot be negative.")
+        if len(rooming_list) != sum(room_counts.values()):
+            raise ValueError(f"Rooming list has {len(rooming_list)} guests for {sum(room_counts.values())} rooms.")
+        self.__group_name = group_name
+        self.__room_counts = dict(room_counts)
+        self.__check_in = check_in
+        self.__check_out = check_out
+        self.__rooming_list = list(rooming_list)
+
+    def get_group_name(self): return self.__group_name          # Return group name
+    def get_room_counts(self): return dict(self.__room_counts)  # Return {room type: rooms wanted}
+    def get_check_in(self): return self.__check_in              # Return check-in
+    def get_check_out(self): return self.__check_out            # Return check-out
+    def get_rooming_list(self): return list(self.__rooming_list)  # Return guests, one per room
+    def get_room_count(self): return len(self.__rooming_list)   # Return total rooms wanted
+
+    def __str__(self):
+        # Return request summary
+        counts = ", ".join(f"{count} {name}" for name, count in self.__room_counts.items())
+        return f"Block for {self.__group_name}: {counts} from {self.__check_in} to {self.__check_out}"
+
+
+class GroupInvoice:
+    """One invoice for a whole block, made of the per-room invoices."""
+
+    def __init__(self, group_name, invoices):
+        # Initialize with the block's per-room invoices
+        self.__group_name = group_name
+        self.__invoices = list(invoices)
+
+    def get_group_name(self): return self.__group_name    # Return group name
+    def get_invoices(self): return list(self.__invoices)  # Return per-room invoices
+
+    def calculate_totals(self):
+        # Return every room's total, same as Invoice.calculate_total, in one batch
+        return calculate_totals(*invoice_columns(self.__invoices))
+
+    def calculate_total(self):
+        # Return the total for the whole block
+        total = sum(self.calculate_totals())
+        return total.item() if hasattr(total, "item") else total    # Plain number, not a NumPy scalar
+
+    def __str__(self):
+        # Return invoice summary
+        return f"Group invoice for {self.__group_name}: {len(self.__invoices)} rooms, AED{self.calculate_total()}"
+
+
+class GroupBooker:
+    """Books whole room blocks, all or nothing, with one pass over the availability index.
+
+    The free rooms of every type are found in a single scan of the index for
+    the block's dates; the block is booked only if every type has enough of
+    them, so a failed request leaves nothing behind. Rooms are taken in room
+    number order, which keeps a group on neighbouring rooms.
+    """
+
+    def __init__(self, rooms, availability=None):
+        # Initialize with the rooms to book, sharing an existing availability index if given
+        self.__availability = availability if availability is not None else AvailabilityIndex(rooms)
+
+    def get_availability(self): return self.__availability  # Return availability index
+
+    def __free_by_type(self, request):
+        # Return {room type: free rooms, up to the number wanted} from one pass over the index
+        wanted = request.get_room_counts()
+        free = {name: [] for name in wanted}
+        for room in self.__availability.free_rooms(request.get_check_in(), request.get_check_out()):
+            rooms = free.get(room.get_room_type())
+            if rooms is not None and len(rooms) < wanted[room.get_room_type()]:
+                rooms.append(room)
+        return free
+
+    def shortfall(self, request):
+        # Return {room type: rooms missing} for a request; empty if the block fits
+        free = self.__free_by_type(request)
+        return {name: count - len(free[name]) for name, count in request.get_room_counts().items()
+                if len(free[name]) < count}
+
+    def book(self, request, charges=50, discount=20, pricing=None):
+        # Book the block; return (reservations, GroupInvoice), or None if any room type is short.
+        # pricing is an optional PricingEngine for the per-room invoices
+        free = self.__free_by_type(request)
+        if any(len(free[name]) < count for name, count in request.get_room_counts().items()):
+            return None
+        check_in, check_out = request.get_check_in(), request.get_check_out()
+        rooms = [room for name in request.get_room_counts() for room in free[name]]
+        reservations = [Reservation(guest, room, check_in, check_out)
+                        for guest, room in zip(request.get_rooming_list(), rooms)]
+        for reservation in reservations:
+            self.__availability.book(reservation)
+            reservation.get_guest().add_reservation(reservation)
+        invoices = [Invoice(reservation, charges, discount, pricing) for reservation in reservations]
+        return reservations, GroupInvoice(request.get_group_name(), invoices)
+
+
+def book_one_by_one(availability, request):
+    """Reference: book each room of the block with its own lookup, undoing them all if one fails."""
+    check_in, check_out = request.get_check_in(), request.get_check_out()
+    guests = iter(request.get_rooming_list())
+    reservations = []
+    for name, count in request.get_room_counts().items():
+        for _ in range(count):
+            room = next((r for r in availability.get_rooms()
+                         if r.get_room_type() == name and availability.is_free(r.get_room_number(), check_in, check_out)),
+                        None)
+            if room is None:
+                for reservation in reservations:
+                    availability.release(reservation)
+                return None
+            reservation = Reservation(next(guests), room, check_in, check_out)
+            availability.book(reservation)
+            reservations.append(reservation)
+    for reservation in reservations:
+        reservation.get_guest().add_reservation(reservation)
+    return reservations, GroupInvoice(request.get_group_name(), [Invoice(r) for r in reservations])
+
+
+# ---------------------- Benchmark ----------------------
+
+def _hotel(rooms, seed):
+    # Return (rooms, availability) with some stays already booked
+    rng = random.Random(seed)
+    types = (("Single", 300), ("Double", 450), ("Suite", 800))
+    room_list = [Room(100 + i, types[i % 3][0], ["Wi-Fi"], types[i % 3][1]) for i in range(rooms)]
+    availability = AvailabilityIndex(room_list)
+    start = date(2026, 9, 1)
+    for room in room_list:
+        for _ in range(3):
+            check_in = start + timedelta(days=rng.randrange(60))
+            availability.get_schedule(room.get_room_number()).book(check_in, check_in + timedelta(days=rng.randint(1, 4)))
+    return room_list, availability
+
+
+def benchmark(rooms=3000, blocks=20):
+    """Time booking blocks of 50-300 rooms with GroupBooker against one lookup per room."""
+    rng = random.Random(24)
+    start = date(2026, 9, 1)
+    requests = []
+    for b in range(blocks):
+        size = rng.randint(50, 300)
+        suites = size // 10
+        doubles = size // 3
+        check_in = start + timedelta(days=rng.randrange(55))
+        guests = [Guest(f"Delegate {b}-{i}", f"delegate{b}.{i}@example.com", f"05{i:08d}") for i in range(size)]
+        requests.append(BlockRequest(f"Conference {b}", {"Single": size - suites - doubles, "Double": doubles,
+                                                         "Suite": suites},
+                                     check_in, check_in + timedelta(days=rng.randint(2, 4)), guests))
+    print(f"{rooms} rooms, {blocks} blocks of 50-300 rooms ({sum(r.get_room_count() for r in requests)} rooms)")
+
+    _, availability = _hotel(rooms, seed=1)
+    began = time.perf_counter()
+    expected = [book_one_by_one(availability, request) for request in requests]
+    single = time.perf_counter() - began
+
+    room_list, availability = _hotel(rooms, seed=1)
+    booker = GroupBooker(room_list, availability)
+    began = time.perf_counter()
+    results = [booker.book(request) for request in requests]
+    batch = time.perf_counter() - began
+
+    summary = lambda result: None if result is None else [r.get_room().get_room_number() for r in result[0]]
+    assert list(map(summary, results)) == list(map(summary, expected)), "Group booking differs from one by one"
+    booked = sum(result is not None for result in results)
+    print(f"  one by one:   {single / blocks * 1000:8.2f} ms/block  ({booked} of {blocks} blocks booked)")
+    print(f"  GroupBooker:  {batch / blocks * 1000:8.2f} ms/block  ({single / batch:.0f}x)")
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
@@ -18,9 +18,11 @@ class Guest:
     def set_email(self, email): self.__email = email    # Set email
     def set_contact(self, contact): self.__contact = contact  # Set contact
 
-    def add_reservation(self, reservation):
+    def add_reservation(self, reservation, points=10):
         # Add a reservation and increase loyalty points
         self.__reservations.append(reservation)
-        self.__loyalty_points += 10
+        self.__loyalty_points += points
+
+    def add_loyalty_points(self, points): self.__loyalty_points += points  # Adjust loyalty points
 
     def get_reservation_history(self): return self.__reservations  # Get all reservations
@@ -0,0 +1,137 @@
+import random
+import time
+
+from guest import Guest
+
+
+def normalize_email(email):
+    """Return the lookup key for an email: trimmed and lower-case."""
+    return email.strip().lower()
+
+
+def normalize_phone(phone):
+    """Return the lookup key for a phone number: its digits only."""
+    return "".join(c for c in str(phone) if c.isdigit())
+
+
+class GuestDirectory:
+    """Finds existing guests by email or phone so each person keeps one profile."""
+
+    def __init__(self):
+        # Initialize empty hash indexes
+        self.__by_email = {}    # Normalized email -> Guest
+        self.__by_phone = {}    # Normalized phone -> Guest
+        self.__guests = {}      # id(guest) -> Guest, one entry per profile
+        self.__keys = {}        # id(guest) -> (emails, phones) that lead to it, merged ones included
+
+    def __len__(self): return len(self.__guests)
+    def __iter__(self): return iter(list(self.__guests.values()))
+
+    def find_by_email(self, email): return self.__by_email.get(normalize_email(email))  # Lookup by email
+    def find_by_phone(self, phone): return self.__by_phone.get(normalize_phone(phone))  # Lookup by phone
+
+    def __index(self, guest, emails=(), phones=()):
+        # Point the indexes at the guest's current email and phone, plus any extra keys
+        self.__guests[id(guest)] = guest
+        own_emails, own_phones = self.__keys.setdefault(id(guest), (set(), set()))
+        for index, keys, extra, key in ((self.__by_email, own_emails, emails, normalize_email(guest.get_email())),
+                                        (self.__by_phone, own_phones, phones, normalize_phone(guest.get_contact()))):
+            for k in (key, *extra):
+                if k:
+                    index[k] = guest
+                    keys.add(k)
+
+    def __unindex(self, guest):
+        # Drop every index entry that points at the guest; return its (emails, phones)
+        self.__guests.pop(id(guest), None)
+        emails, phones = self.__keys.pop(id(guest), (set(), set()))
+        for index, keys in ((self.__by_email, emails), (self.__by_phone, phones)):
+            for key in keys:
+                if index.get(key) is guest:
+                    del index[key]
+        return emails, phones
+
+    def add(self, guest):
+        # Register a guest; if it matches an existing profile the two are merged
+        by_email = self.find_by_email(guest.get_email())
+        by_phone = self.find_by_phone(guest.get_contact())
+        primary = by_email or by_phone
+        if primary is None:
+            self.__index(guest)
+            return guest
+        if by_email is not None and by_phone is not None and by_email is not by_phone:
+            self.merge(by_email, by_phone)
+        if guest is not primary:
+            self.merge(primary, guest)
+        return primary
+
+    def upsert(self, name, email, contact):
+        # Return the existing guest for this email or phone, updated, or a new one
+        by_email = self.find_by_email(email)
+        by_phone = self.find_by_phone(contact)
+        primary = by_email or by_phone
+        if primary is None:
+            return self.add(Guest(name, email, contact))
+        if by_phone is not None and by_phone is not primary:
+            self.merge(primary, by_phone)
+        emails, phones = self.__unindex(primary)
+        # Keys merged in from duplicates still lead here; the replaced email and phone do not
+        emails.discard(normalize_email(primary.get_email()))
+        phones.discard(normalize_phone(primary.get_contact()))
+        primary.set_name(name)
+        primary.set_email(email)
+        primary.set_contact(contact)
+        self.__index(primary, emails, phones)
+        return primary
+
+    def merge(self, primary, duplicate):
+        # Move the duplicate's reservations (and so its loyalty points) onto primary
+        if primary is duplicate:
+            return primary
+        emails, phones = self.__unindex(duplicate)
+        # A duplicate that was never added (as from add()) has no keys indexed yet
+        emails.add(normalize_email(duplicate.get_email()))
+        phones.add(normalize_phone(duplicate.get_contact()))
+        for reservation in duplicate.get_reservation_history():
+            primary.add_reservation(reservation, points=0)
+        primary.add_loyalty_points(duplicate.get_loyalty_points())
+        if not primary.get_email():
+            primary.set_email(duplicate.get_email())
+        if not primary.get_contact():
+            primary.set_contact(duplicate.get_contact())
+        # Every key of the duplicate, including ones it had merged in, now leads to primary
+        self.__index(primary, emails, phones)
+        return primary
+
+    def bulk_load(self, records):
+        # Upsert every (name, email, contact) record from an iterable; return the count read
+        count = 0
+        for name, email, contact in records:
+            self.upsert(name, email, contact)
+            count += 1
+        return count
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(sizes=(10000, 100000, 1000000), lookups=100000):
+    """Show that lookup latency stays flat as the directory grows."""
+    directory = GuestDirectory()
+    loaded = 0
+    for size in sizes:
+        records = ((f"Guest {i}", f"Guest{i}@Example.com", f"05{i:08d}") for i in range(loaded, size))
+        began = time.perf_counter()
+        directory.bulk_load(records)
+        load_time = time.perf_counter() - began
+        loaded = size
+
+        keys = [f"guest{random.randrange(size)}@example.com" for _ in range(lookups)]
+        began = time.perf_counter()
+        for key in keys:
+            directory.find_by_email(key)
+        per_lookup = (time.perf_counter() - began) / lookups
+        print(f"{len(directory):>9} guests: loaded in {load_time:.2f}s, lookup {per_lookup * 1e9:.0f} ns")
+
+
+if __name__ == '__main__':
+    benchmark()
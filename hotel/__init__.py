@@ -0,0 +1,6 @@
+"""Command-line booking tools for Royal Stay Hotel.
+
+Run ``python -m hotel <command>`` from the repository root (or with it on
+PYTHONPATH). Each command imports only the modules it needs, so the short-lived
+commands run from cron and shell pipelines start quickly.
+"""
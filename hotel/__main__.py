@@ -0,0 +1,5 @@
+import sys
+
+from hotel.cli import main
+
+sys.exit(main())
@@ -0,0 +1,186 @@
+"""One entry point for the booking tools: search, book, invoice and report.
+
+    python -m hotel search --check-in 2026-07-01 --check-out 2026-07-04
+    python -m hotel book --name Ann --email ann@example.com --phone 0501234567 \\
+        --room 101 --check-in 2026-07-01 --check-out 2026-07-04 --payment "Credit Card"
+    python -m hotel invoice --email ann@example.com
+    python -m hotel report --start 2026-07-01 --end 2026-08-01
+
+Bookings are kept in a SQLite file (--db, or HOTEL_DB, default hotel.db). It is
+seeded from the cached room inventory on first use. Modules are imported inside
+the command that needs them, never at the top of this file.
+"""
+
+import os
+
+DEFAULT_DB = "hotel.db"
+
+
+def _date(text):
+    # Parse a YYYY-MM-DD argument
+    from datetime import datetime
+
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError("Invalid date format. Please use YYYY-MM-DD.") from None
+
+
+def _open_store(path):
+    # Open the booking database, seeding it with the room inventory if it is new
+    from storage import HotelStore
+    from hotel.data import load_rooms
+
+    store = HotelStore(path)
+    if next(store.rooms(), None) is None:
+        store.add_rooms(load_rooms())
+    return store
+
+
+def _dates(args):
+    # Return (check_in, check_out) from the arguments, refusing empty ranges
+    check_in, check_out = _date(args.check_in), _date(args.check_out)
+    if check_out <= check_in:
+        raise ValueError("Check-out must be after check-in.")
+    return check_in, check_out
+
+
+# ---------------------- Commands ----------------------
+
+def search(args):
+    """Print the rooms free for the dates, optionally of one type."""
+    check_in, check_out = _dates(args)
+    with _open_store(args.db) as store:
+        free = [room for room in store.available_rooms(check_in, check_out)
+                if args.type is None or room.get_room_type() == args.type]
+    if not free:
+        print("❌ No rooms are available for those dates.")
+        return 1
+    for room in free:
+        print(room)
+    return 0
+
+
+def book(args):
+    """Validate the guest, book the room if it is still free, and print the reservation and invoice."""
+    from validation import is_valid_name, is_valid_email, is_valid_phone
+
+    errors = []
+    if not is_valid_name(args.name):
+        errors.append("Name must contain only letters.")
+    if not is_valid_email(args.email):
+        errors.append("Invalid email format.")
+    if not is_valid_phone(args.phone):
+        errors.append("Phone must be at least 10 digits.")
+    if not args.payment.strip():
+        errors.append("Payment method cannot be empty.")
+    if errors:
+        for message in errors:
+            print("❌", message)
+        return 1
+    check_in, check_out = _dates(args)
+
+    from guest import Guest
+    from reservation import Reservation
+    from invoice import Invoice
+    from payment import Payment
+
+    with _open_store(args.db) as store:
+        room = store.get_room(args.room)
+        if room is None:
+            print("❌ Selected room is not available or does not exist.")
+            return 1
+        guest = store.find_guest_by_email(args.email) or Guest(args.name, args.email, args.phone)
+        reservation = Reservation(guest, room, check_in, check_out)
+        if not store.add_reservation_if_free(reservation):
+            print("❌ Selected room is not available or does not exist.")
+            return 1
+        guest.add_reservation(reservation)
+        invoice = Invoice(reservation)
+        store.add_invoices([invoice])
+    print("✅ Reservation Confirmed:")
+    print(reservation)
+    print("🧾", invoice)
+    Payment(args.payment.strip()).process_payment(invoice.calculate_total())
+    return 0
+
+
+def invoice(args):
+    """Print every invoice of the guest with this email."""
+    with _open_store(args.db) as store:
+        guest = store.find_guest_by_email(args.email)
+        invoices = list(store.invoices(guest)) if guest is not None else []
+    if not invoices:
+        print(f"❌ No invoices found for {args.email}.")
+        return 1
+    for item in invoices:
+        print(item.get_reservation())
+        print("🧾", item)
+    return 0
+
+
+def report(args):
+    """Print monthly and per-room-type occupancy, ADR and RevPAR for [start, end)."""
+    from reporting import OccupancyReport
+
+    start, end = _date(args.start), _date(args.end)
+    if end <= start:
+        raise ValueError("End must be after start.")
+    with _open_store(args.db) as store:
+        occupancy = OccupancyReport(list(store.rooms()), start, end)
+        occupancy.rebuild(store.reservations_between(start, end))
+    groups = [("month", occupancy.monthly())]
+    groups.append(("room type", occupancy.by_room_type()))
+    for title, rows in groups:
+        print(f"{title:<10}{'occupancy':>10}{'ADR':>10}{'RevPAR':>10}{'revenue':>12}")
+        for key, figures in rows.items():
+            print(f"{key:<10}{figures['occupancy']:>10.1%}{figures['adr']:>10.2f}"
+                  f"{figures['revpar']:>10.2f}{figures['revenue']:>12.2f}")
+    return 0
+
+
+# ---------------------- Entry Point ----------------------
+
+def _parser():
+    # Build the argument parser
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m hotel", description="Royal Stay Hotel booking tools.")
+    parser.add_argument("--db", default=os.environ.get("HOTEL_DB", DEFAULT_DB), help="booking database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("search", help="list free rooms for a date range")
+    command.add_argument("--check-in", required=True)
+    command.add_argument("--check-out", required=True)
+    command.add_argument("--type", help="only rooms of this type, e.g. Suite")
+    command.set_defaults(run=search)
+
+    command = commands.add_parser("book", help="book a room")
+    command.add_argument("--name", required=True)
+    command.add_argument("--email", required=True)
+    command.add_argument("--phone", required=True)
+    command.add_argument("--room", required=True, type=int)
+    command.add_argument("--check-in", required=True)
+    command.add_argument("--check-out", required=True)
+    command.add_argument("--payment", default="Credit Card")
+    command.set_defaults(run=book)
+
+    command = commands.add_parser("invoice", help="show a guest's invoices")
+    command.add_argument("--email", required=True)
+    command.set_defaults(run=invoice)
+
+    command = commands.add_parser("report", help="occupancy and revenue for a period")
+    command.add_argument("--start", required=True)
+    command.add_argument("--end", required=True)
+    command.set_defaults(run=report)
+    return parser
+
+
+def main(argv=None):
+    """Run one command; return the exit status."""
+    args = _parser().parse_args(argv)
+    try:
+        return args.run(args)
+    except ValueError as e:
+        print("❌", e)
+        return 1
@@ -0,0 +1,46 @@
+import marshal
+import os
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(HERE, "rooms.csv")                     # Room inventory and nightly rates
+CACHE = os.path.join(HERE, "__pycache__", "rooms.cache")    # Compiled copy of SOURCE
+FORMAT = 1                                                  # Bumped when the cached layout changes
+
+
+def _parse(path):
+    # Return (room number, type, amenities, price) tuples from the CSV source
+    import csv
+
+    with open(path, newline="", encoding="utf-8") as f:
+        return tuple((int(row["room_number"]), row["room_type"],
+                      tuple(a for a in row["amenities"].split(";") if a), int(row["price_per_night"]))
+                     for row in csv.DictReader(f))
+
+
+def load_room_rows(source=SOURCE, cache=CACHE):
+    """Return the room inventory as tuples, from the binary cache when it is newer than the source."""
+    try:
+        if os.stat(cache).st_mtime >= os.stat(source).st_mtime:
+            with open(cache, "rb") as f:
+                version, rows = marshal.load(f)
+            if version == FORMAT:
+                return rows
+    except (OSError, ValueError, EOFError, TypeError):
+        pass        # Missing, stale or unreadable cache; rebuild it
+    rows = _parse(source)
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        with open(cache + ".tmp", "wb") as f:
+            marshal.dump((FORMAT, rows), f)
+        os.replace(cache + ".tmp", cache)
+    except OSError:
+        pass        # Read-only install; parse the source each time
+    return rows
+
+
+def load_rooms(source=SOURCE):
+    """Return the room inventory as Room objects."""
+    from Room import Room
+
+    return [Room(number, room_type, list(amenities), price)
+            for number, room_type, amenities, price in load_room_rows(source)]
@@ -0,0 +1,55 @@
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+TARGET_MS = 50
+
+COMMANDS = {
+    "search": ["search", "--check-in", "2026-07-01", "--check-out", "2026-07-04"],
+    "book": ["book", "--name", "Ann", "--email", "ann@example.com", "--phone", "0501234567",
+             "--room", "101", "--check-in", "{day}", "--check-out", "{next_day}"],
+    "invoice": ["invoice", "--email", "ann@example.com"],
+    "report": ["report", "--start", "2026-07-01", "--end", "2026-08-01"],
+}
+
+
+def _first_output_ms(argv, env):
+    # Start a process and return the milliseconds until its first line of output
+    began = time.perf_counter()
+    process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=ROOT, env=env)
+    process.stdout.readline()
+    elapsed = (time.perf_counter() - began) * 1000
+    process.stdout.read()
+    process.wait()
+    return elapsed
+
+
+def benchmark(runs=20):
+    """Print the median time to first output of each command against TARGET_MS."""
+    folder = tempfile.mkdtemp()
+    env = dict(os.environ, HOTEL_DB=os.path.join(folder, "hotel.db"), PYTHONPATH=ROOT)
+    try:
+        baseline = statistics.median(_first_output_ms([sys.executable, "-c", "print()"], env) for _ in range(runs))
+        print(f"{'python -c print()':<18}{baseline:>8.1f} ms  (interpreter start alone)")
+        for name, args in COMMANDS.items():
+            times = []
+            for run in range(runs):
+                # Each booking uses new dates so every run really books
+                day, next_day = f"2027-{1 + run // 28:02d}-{1 + run % 28:02d}", f"2027-{1 + run // 28:02d}-{2 + run % 28:02d}"
+                argv = [sys.executable, "-m", "hotel"] + [a.format(day=day, next_day=next_day) for a in args]
+                times.append(_first_output_ms(argv, env))
+            median = statistics.median(times)
+            flag = "✅" if median < TARGET_MS else "❌"
+            print(f"{name:<18}{median:>8.1f} ms  {flag} target {TARGET_MS} ms")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    benchmark()
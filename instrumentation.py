@@ -0,0 +1,218 @@
+from bisect import bisect_left
+from functools import wraps
+import os
+import time
+
+# Set HOTEL_INSTRUMENT=1 to collect timings, "profile" to add a cProfile capture,
+# or "memory" to add a tracemalloc capture. Unset, every hook is a no-op.
+MODE = os.environ.get("HOTEL_INSTRUMENT", "").strip().lower()
+ENABLED = MODE not in ("", "0", "off")
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0, 10.0)
+
+
+class Histogram:
+    """Count, sum and bucket counts of durations."""
+
+    def __init__(self):
+        # Initialize empty buckets; the last one catches everything slower
+        self.__counts = [0] * (len(BUCKETS) + 1)
+        self.__count = 0
+        self.__total = 0.0
+        self.__max = 0.0
+
+    def observe(self, seconds):
+        # Record one duration
+        self.__counts[bisect_left(BUCKETS, seconds)] += 1
+        self.__count += 1
+        self.__total += seconds
+        if seconds > self.__max:
+            self.__max = seconds
+
+    def get_count(self): return self.__count    # Return number of observations
+    def get_total(self): return self.__total    # Return summed seconds
+    def get_max(self): return self.__max        # Return slowest observation
+    def get_buckets(self): return list(self.__counts)  # Return per-bucket counts
+
+
+class _Timer:
+    """Context manager that records its elapsed time into a histogram."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class _NullTimer:
+    """Shared do-nothing context manager used while instrumentation is off."""
+
+    __slots__ = ()
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): return None
+
+
+_NULL = _NullTimer()
+_timers = {}        # Stage name -> Histogram
+_counters = {}      # Counter name -> int
+_constructors = {}  # Class -> its own __init__ before instrument_constructors() wrapped it
+
+
+# ---------------------- Hooks ----------------------
+
+def enable(on=True):
+    """Turn instrumentation on or off for this run."""
+    global ENABLED
+    ENABLED = on
+
+
+def reset():
+    """Forget every recorded timing and count."""
+    _timers.clear()
+    _counters.clear()
+
+
+def stage(name):
+    """Return a context manager that times a block under name."""
+    if not ENABLED:
+        return _NULL
+    histogram = _timers.get(name)
+    if histogram is None:
+        histogram = _timers[name] = Histogram()
+    return _Timer(histogram)
+
+
+def count(name, amount=1):
+    """Add to a named counter."""
+    if ENABLED:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def timed(name=None):
+    """Decorator that times every call of a function."""
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            with stage(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def instrument_constructors(*classes):
+    """Time and count construction of the given classes; does nothing while disabled.
+
+    This replaces __init__ on the classes themselves, for every caller in the
+    process, until uninstrument_constructors() puts the originals back.
+    """
+    if not ENABLED:
+        return
+    for cls in classes:
+        if cls in _constructors:
+            continue
+        _constructors[cls] = cls.__dict__.get("__init__")
+        cls.__init__ = timed(f"{cls.__name__}.__init__")(cls.__init__)
+
+
+def uninstrument_constructors(*classes):
+    """Undo instrument_constructors() for the given classes, or for every class if none are given."""
+    for cls in classes or list(_constructors):
+        if cls not in _constructors:
+            continue
+        original = _constructors.pop(cls)
+        if original is None:
+            del cls.__init__        # The class had inherited its __init__
+        else:
+            cls.__init__ = original
+
+
+# ---------------------- Reports ----------------------
+
+def report():
+    """Return a text table of every stage's timings and every counter."""
+    lines = [f"{'stage':<28}{'calls':>8}{'total ms':>12}{'mean ms':>10}{'max ms':>10}"]
+    for name, h in sorted(_timers.items(), key=lambda item: -item[1].get_total()):
+        mean = h.get_total() / h.get_count() * 1000 if h.get_count() else 0.0
+        lines.append(f"{name:<28}{h.get_count():>8}{h.get_total() * 1000:>12.3f}{mean:>10.3f}{h.get_max() * 1000:>10.3f}")
+    for name, value in sorted(_counters.items()):
+        lines.append(f"{name:<28}{value:>8}")
+    return "\n".join(lines)
+
+
+def prometheus_text(prefix="hotel"):
+    """Return the timings and counters in Prometheus text exposition format."""
+    lines = [f"# TYPE {prefix}_stage_seconds histogram"]
+    for name, h in sorted(_timers.items()):
+        cumulative = 0
+        for bound, n in zip(BUCKETS + (float("inf"),), h.get_buckets()):
+            cumulative += n
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+        lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {h.get_total()}')
+        lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {h.get_count()}')
+    if _counters:
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in sorted(_counters.items()):
+            lines.append(f'{prefix}_events_total{{name="{name}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------- Capture Modes ----------------------
+
+class Capture:
+    """Context manager for a cProfile ("profile") or tracemalloc ("memory") capture of a run.
+
+    With mode None the mode comes from HOTEL_INSTRUMENT. The result is printed on
+    exit, or written to path if given.
+    """
+
+    def __init__(self, mode=None, path=None, top=15):
+        # Initialize the capture settings
+        self.__mode = MODE if mode is None else mode
+        self.__path = path
+        self.__top = top
+        self.__profiler = None
+
+    def __enter__(self):
+        if self.__mode == "profile":
+            import cProfile
+            self.__profiler = cProfile.Profile()
+            self.__profiler.enable()
+        elif self.__mode == "memory":
+            import tracemalloc
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self.__mode == "profile":
+            import io
+            import pstats
+            self.__profiler.disable()
+            if self.__path:
+                self.__profiler.dump_stats(self.__path)
+            else:
+                out = io.StringIO()
+                pstats.Stats(self.__profiler, stream=out).sort_stats("cumulative").print_stats(self.__top)
+                print(out.getvalue())
+        elif self.__mode == "memory":
+            import tracemalloc
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            if self.__path:
+                snapshot.dump(self.__path)
+            else:
+                for stat in snapshot.statistics("lineno")[:self.__top]:
+                    print(stat)
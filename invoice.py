@@ -1,14 +1,24 @@
 class Invoice:
     """Generates an invoice for a reservation."""
 
-    def __init__(self, reservation, charges=50, discount=20):
+    def __init__(self, reservation, charges=50, discount=20, pricing=None):
         # Initialize invoice with charges and discounts
         self.__reservation = reservation  # Reservation to bill
         self.__charges = charges          # Extra charges
         self.__discount = discount        # Discount applied
+        self.__pricing = pricing          # Optional PricingEngine for per-date rates
+
+    def get_reservation(self): return self.__reservation  # Return reservation
+    def get_charges(self): return self.__charges          # Return extra charges
+    def get_discount(self): return self.__discount        # Return discount
+    def get_pricing(self): return self.__pricing          # Return the pricing engine, or None
 
     def calculate_total(self):
         # Calculate total cost: nights * rate + charges - discount
+        if self.__pricing is not None:
+            room_charge = self.__pricing.quote(self.__reservation.get_room(), self.__reservation.get_check_in(),
+                                               self.__reservation.get_check_out())
+            return room_charge + self.__charges - self.__discount
         nights = (self.__reservation.get_check_out() - self.__reservation.get_check_in()).days
         return nights * self.__reservation.get_room().get_price_per_night() + self.__charges - self.__discount
 
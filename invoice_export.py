@@ -0,0 +1,196 @@
+from datetime import date, timedelta
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from Room import Room
+from guest import Guest
+from reservation import Reservation
+from invoice import Invoice
+
+FORMATS = ("text", "csv", "jsonl")
+COLUMNS = ("guest", "room", "check_in", "check_out", "nights", "rate", "rate_varies", "room_charge", "charges", "discount", "total")
+
+
+def invoice_row(invoice):
+    """Read everything an export needs from an invoice in one pass, as a tuple in COLUMNS order."""
+    reservation = invoice.get_reservation()
+    room = reservation.get_room()
+    check_in = reservation.get_check_in()
+    check_out = reservation.get_check_out()
+    charges = invoice.get_charges()
+    discount = invoice.get_discount()
+    total = invoice.calculate_total()
+    nights = (check_out - check_in).days
+    room_charge = total - charges + discount
+    rate = room.get_price_per_night()
+    varies = False
+    pricing = invoice.get_pricing()
+    if pricing is not None and nights:
+        # A priced stay can have a different rate each night; rate is then their average
+        rates = pricing.nightly_rates(room, check_in, check_out)
+        varies = len(set(rates)) > 1
+        rate = round(room_charge / nights, 2) if varies else rates[0]
+    return (reservation.get_guest().get_name(), room.get_room_number(), check_in.isoformat(),
+            check_out.isoformat(), nights, rate, varies, room_charge, charges, discount, total)
+
+
+# ---------------------- Renderers ----------------------
+
+def _render_text(rows):
+    # Return the receipts for a list of rows as one string
+    return "".join(
+        f"Invoice for {guest}: AED{total}\n"
+        f"  Room {room}, {check_in} to {check_out}\n"
+        f"  {nights} night(s) x {'avg ' if varies else ''}AED{rate} = AED{room_charge}\n"
+        f"  Charges: AED{charges}\n"
+        f"  Discount: -AED{discount}\n"
+        f"  Total: AED{total}\n\n"
+        for guest, room, check_in, check_out, nights, rate, varies, room_charge, charges, discount, total in rows)
+
+
+def _render_csv(rows):
+    # Return the rows as CSV lines
+    out = io.StringIO()
+    csv.writer(out, lineterminator="\n").writerows(rows)
+    return out.getvalue()
+
+
+def _render_jsonl(rows):
+    # Return the rows as JSON lines
+    dumps = json.dumps
+    return "".join(dumps(dict(zip(COLUMNS, row)), ensure_ascii=False) + "\n" for row in rows)
+
+
+RENDERERS = {"text": _render_text, "csv": _render_csv, "jsonl": _render_jsonl}
+
+
+# ---------------------- Exporter ----------------------
+
+class InvoiceExporter:
+    """Streams rendered invoices to a file-like object in batches."""
+
+    def __init__(self, out, fmt="text", batch_size=5000):
+        # Initialize the exporter; out must be a text stream
+        if fmt not in RENDERERS:
+            raise ValueError(f"Unknown format {fmt!r}; use one of {', '.join(FORMATS)}.")
+        self.__out = out
+        self.__render = RENDERERS[fmt]
+        self.__batch_size = batch_size  # Invoices rendered per write
+        self.__count = 0
+        if fmt == "csv":
+            out.write(",".join(COLUMNS) + "\n")
+
+    def get_count(self): return self.__count  # Return invoices written so far
+
+    def write_rows(self, rows):
+        # Render and write rows from invoice_row(), batch by batch
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.__batch_size:
+                self.__flush(batch)
+                batch = []
+        if batch:
+            self.__flush(batch)
+
+    def write(self, invoices):
+        # Render and write Invoice objects
+        self.write_rows(invoice_row(invoice) for invoice in invoices)
+
+    def __flush(self, batch):
+        # Write one rendered batch
+        self.__out.write(self.__render(batch))
+        self.__count += len(batch)
+
+
+def export(invoices, path=None, fmt="text", buffer_size=1 << 20):
+    """Write invoices to path (stdout if None); return the number written."""
+    if path is None:
+        exporter = InvoiceExporter(sys.stdout, fmt)
+        exporter.write(invoices)
+        return exporter.get_count()
+    with open(path, "w", encoding="utf-8", newline="", buffering=buffer_size) as out:
+        exporter = InvoiceExporter(out, fmt)
+        exporter.write(invoices)
+        return exporter.get_count()
+
+
+def _render_shard(job):
+    # Worker entry point: render one shard of rows into its own file
+    rows, fmt, path = job
+    with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as out:
+        out.write(RENDERERS[fmt](rows))
+    return len(rows)
+
+
+def export_parallel(invoices, path, fmt="text", processes=None, shard_size=50000):
+    """Render invoices in worker processes, one shard file each, then join the shards in order into path."""
+    from multiprocessing import Pool
+
+    folder = tempfile.mkdtemp(prefix="invoices-")
+    shards = []
+
+    def jobs():
+        # Rows are read in this process; workers only render
+        rows = []
+        for invoice in invoices:
+            rows.append(invoice_row(invoice))
+            if len(rows) >= shard_size:
+                shards.append(os.path.join(folder, f"{len(shards):06d}"))
+                yield rows, fmt, shards[-1]
+                rows = []
+        if rows:
+            shards.append(os.path.join(folder, f"{len(shards):06d}"))
+            yield rows, fmt, shards[-1]
+
+    try:
+        with Pool(processes) as pool:
+            written = sum(pool.imap(_render_shard, jobs()))
+        with open(path, "w", encoding="utf-8", newline="") as out:
+            if fmt == "csv":
+                out.write(",".join(COLUMNS) + "\n")
+            for shard in shards:
+                with open(shard, encoding="utf-8", newline="") as f:
+                    shutil.copyfileobj(f, out, 1 << 20)
+        return written
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(count=200000):
+    """Print invoices/second for each format, single-process and parallel."""
+    rooms = [Room(100 + i, "Double", ["Wi-Fi"], 300 + 50 * (i % 10)) for i in range(100)]
+    guests = [Guest(f"Guest {i}", f"guest{i}@example.com", f"05{i:08d}") for i in range(1000)]
+    start = date(2026, 1, 1)
+    invoices = []
+    for i in range(count):
+        check_in = start + timedelta(days=i % 365)
+        reservation = Reservation(guests[i % len(guests)], rooms[i % len(rooms)], check_in,
+                                  check_in + timedelta(days=1 + i % 6))
+        invoices.append(Invoice(reservation))
+
+    folder = tempfile.mkdtemp()
+    try:
+        for fmt in FORMATS:
+            path = os.path.join(folder, f"invoices.{fmt}")
+            began = time.perf_counter()
+            export(invoices, path, fmt)
+            single = time.perf_counter() - began
+            began = time.perf_counter()
+            export_parallel(invoices, path + ".parallel", fmt)
+            parallel = time.perf_counter() - began
+            print(f"{fmt:<6}{count / single:>12,.0f} invoices/s single  {count / parallel:>12,.0f} invoices/s parallel")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,212 @@
+from array import array
+from datetime import date
+import random
+import sys
+import time
+
+# Activity kinds recorded in the ledger
+STAY = 0
+SPEND = 1
+ADJUSTMENT = 2
+
+
+class LoyaltyRules:
+    """How many points stays and spending earn, when they expire, and the tier thresholds."""
+
+    def __init__(self, points_per_stay=10, points_per_aed=0.0, expiry_days=None,
+                 tiers=((100, "Gold"), (50, "Silver"), (0, "Standard"))):
+        # Initialize the program rules
+        self.__points_per_stay = points_per_stay    # Points for each reservation
+        self.__points_per_aed = points_per_aed      # Points for each AED invoiced
+        self.__expiry_days = expiry_days            # Days until points expire, None for never
+        self.__tiers = sorted(tiers, reverse=True)  # (minimum points, tier name), highest first
+
+    def get_points_per_stay(self): return self.__points_per_stay  # Return points per stay
+    def get_expiry_days(self): return self.__expiry_days          # Return expiry in days
+
+    def points(self, kind, amount):
+        # Return the points one activity earns
+        if kind == STAY:
+            return self.__points_per_stay
+        if kind == SPEND:
+            return round(amount * self.__points_per_aed)
+        return 0
+
+    def tier(self, points):
+        # Return the tier name for a balance
+        return self.__tiers[-1 - self.rank(points)][1]
+
+    def rank(self, points):
+        # Return the tier's position counted from the lowest: 0 for the lowest tier
+        for i, (minimum, _) in enumerate(self.__tiers):
+            if points >= minimum:
+                return len(self.__tiers) - 1 - i
+        return 0
+
+
+class LoyaltyLedger:
+    """Append-only record of loyalty activity and the points it earned.
+
+    Stays and invoice amounts are kept as typed columns, so balances can be
+    recomputed from scratch whenever the rules change. A recompute never edits
+    past entries; it appends ADJUSTMENT entries for the differences and applies
+    them to the Guest objects the ledger has seen, so their points stay in step.
+    """
+
+    def __init__(self, rules=None):
+        # Initialize empty columns
+        self.__rules = rules or LoyaltyRules()
+        self.__keys = {}                # Guest key (e.g. email) -> guest number
+        self.__guest_col = array("q")   # Guest number per entry
+        self.__day_col = array("l")     # Day ordinal per entry
+        self.__kind_col = array("b")    # STAY, SPEND or ADJUSTMENT
+        self.__amount_col = array("d")  # AED for SPEND entries
+        self.__points_col = array("q")  # Points the entry earned when recorded
+        self.__balances = {}            # Guest number -> current balance
+        self.__guests = {}              # Guest number -> Guest object to keep in step
+
+    def get_rules(self): return self.__rules               # Return rules
+    def __len__(self): return len(self.__guest_col)         # Number of entries
+
+    def __guest_number(self, guest_key):
+        # Return the number for a guest key, assigning one if new
+        number = self.__keys.get(guest_key)
+        if number is None:
+            number = self.__keys[guest_key] = len(self.__keys)
+        return number
+
+    def __append(self, number, day, kind, amount, points):
+        # Append one entry and update the balance
+        self.__guest_col.append(number)
+        self.__day_col.append(day.toordinal() if isinstance(day, date) else day)
+        self.__kind_col.append(kind)
+        self.__amount_col.append(amount)
+        self.__points_col.append(points)
+        self.__balances[number] = self.__balances.get(number, 0) + points
+        return points
+
+    # ---------------------- Incremental Updates ----------------------
+
+    def record_stay(self, guest_key, day):
+        # Award points for one stay; return the points
+        return self.__append(self.__guest_number(guest_key), day, STAY, 0.0, self.__rules.points(STAY, 0))
+
+    def record_spend(self, guest_key, day, amount):
+        # Award points for an amount spent; return the points
+        return self.__append(self.__guest_number(guest_key), day, SPEND, float(amount),
+                             self.__rules.points(SPEND, amount))
+
+    def register(self, guest):
+        # Keep a Guest's loyalty points in step with its balance from now on
+        self.__guests[self.__guest_number(guest.get_email())] = guest
+
+    def record_reservation(self, guest, reservation):
+        # Award stay points for a reservation and add it to the guest's history
+        self.register(guest)
+        points = self.record_stay(guest.get_email(), reservation.get_check_in())
+        guest.add_reservation(reservation, points)
+        return points
+
+    def record_invoice(self, guest, invoice):
+        # Award spend points for an invoice total
+        self.register(guest)
+        points = self.record_spend(guest.get_email(), invoice.get_reservation().get_check_out(),
+                                   invoice.calculate_total())
+        guest.add_loyalty_points(points)
+        return points
+
+    # ---------------------- Queries ----------------------
+
+    def balance(self, guest_key):
+        # Return a guest's current balance
+        number = self.__keys.get(guest_key)
+        return self.__balances.get(number, 0) if number is not None else 0
+
+    def tier(self, guest_key): return self.__rules.tier(self.balance(guest_key))  # Return a guest's tier
+
+    # ---------------------- Batch Recompute ----------------------
+
+    def recompute(self, rules=None, as_of=None, processes=1, chunk_entries=2000000):
+        # Re-derive every balance under rules (expiring points before as_of) and append
+        # ADJUSTMENT entries for the differences; return how many guests changed
+        rules = rules or self.__rules
+        as_of = (as_of or date.today()).toordinal()
+        if processes == 1:
+            totals = _compute_chunk((rules, as_of, self.__guest_col, self.__day_col,
+                                     self.__kind_col, self.__amount_col))
+        else:
+            # Workers get slices of the columns (copied at C speed) and sum their share;
+            # the per-guest sums are then added up here
+            from multiprocessing import Pool
+            jobs = ((rules, as_of, self.__guest_col[i:i + chunk_entries], self.__day_col[i:i + chunk_entries],
+                     self.__kind_col[i:i + chunk_entries], self.__amount_col[i:i + chunk_entries])
+                    for i in range(0, len(self), chunk_entries))
+            totals = None
+            with Pool(processes) as pool:
+                for chunk in pool.imap_unordered(_compute_chunk, jobs):
+                    if totals is None:
+                        totals = chunk
+                        continue
+                    for number, points in chunk.items():
+                        totals[number] = totals.get(number, 0) + points
+            totals = totals or {}
+
+        self.__rules = rules
+        changed = 0
+        for number, balance in list(self.__balances.items()):
+            difference = totals.get(number, 0) - balance
+            if difference:
+                self.__append(number, as_of, ADJUSTMENT, 0.0, difference)
+                guest = self.__guests.get(number)
+                if guest is not None:
+                    guest.add_loyalty_points(difference)
+                changed += 1
+        return changed
+
+
+def _compute_chunk(job):
+    # Worker entry point: sum the points each guest still holds from a run of entries
+    rules, as_of, guests, days, kinds, amounts = job
+    expiry = rules.get_expiry_days()
+    earliest = as_of - expiry + 1 if expiry is not None else None
+    stay_points = rules.points(STAY, 0)
+    totals = {}
+    get = totals.get
+    for guest, day, kind, amount in zip(guests, days, kinds, amounts):
+        if kind == ADJUSTMENT or (earliest is not None and day < earliest):
+            continue
+        totals[guest] = get(guest, 0) + (stay_points if kind == STAY else rules.points(kind, amount))
+    return totals
+
+
+# ---------------------- Benchmark ----------------------
+
+def _fill(ledger, guests, seed=5):
+    # Record the same synthetic activity for guests into a ledger
+    rng = random.Random(seed)
+    start = date(2025, 1, 1).toordinal()
+    for g in range(guests):
+        key = f"guest{g}@example.com"
+        for _ in range(1 + g % 3):
+            day = start + rng.randrange(600)
+            ledger.record_stay(key, day)
+            ledger.record_spend(key, day, rng.randrange(300, 3000))
+
+
+def benchmark(guests=5000000, processes=(1, 2, 4)):
+    """Time loading activity and the nightly recompute for each process count, on a fresh ledger each time."""
+    new_rules = LoyaltyRules(points_per_stay=15, points_per_aed=0.05, expiry_days=365)
+    for workers in processes:
+        ledger = LoyaltyLedger()
+        began = time.perf_counter()
+        _fill(ledger, guests)
+        loaded = time.perf_counter() - began
+        began = time.perf_counter()
+        changed = ledger.recompute(new_rules, as_of=date(2026, 9, 1), processes=workers)
+        print(f"{guests} guests, {len(ledger)} entries (loaded in {loaded:.1f}s): recompute with "
+              f"{workers} process(es) {time.perf_counter() - began:.1f}s, {changed} balances adjusted")
+        del ledger
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000000)
@@ -0,0 +1,199 @@
+from collections import OrderedDict
+from datetime import date, timedelta
+import time
+
+from Room import Room
+
+
+# ---------------------- Rules ----------------------
+
+class PricingRule:
+    """Base class for a rate rule: a multiplier applied on certain dates and room types."""
+
+    def __init__(self, multiplier, start=None, end=None, room_types=None):
+        # start/end bound the dates the rule can touch ([start, end)); None means open-ended
+        self._multiplier = multiplier
+        self._start = start
+        self._end = end
+        self._room_types = set(room_types) if room_types else None  # None means every type
+
+    def get_start(self): return self._start            # Return first affected date
+    def get_end(self): return self._end                # Return end of affected dates
+    def get_room_types(self): return self._room_types  # Return affected room types
+
+    def covers(self, room_type, day):
+        # Check whether the rule's date range and room types include this night
+        return ((self._room_types is None or room_type in self._room_types)
+                and (self._start is None or day >= self._start)
+                and (self._end is None or day < self._end))
+
+    def factor(self, room_type, day, occupancy):
+        # Return the multiplier for one night
+        return self._multiplier if self.covers(room_type, day) and self.applies(day, occupancy) else 1.0
+
+    def applies(self, day, occupancy):
+        # Extra condition checked by subclasses
+        return True
+
+
+class SeasonRule(PricingRule):
+    """Multiplier for a season, e.g. 1.4 over the winter holidays."""
+
+
+class RoomTypeRule(PricingRule):
+    """Multiplier for a room type on every date, e.g. 1.1 for Suites."""
+
+    def __init__(self, room_type, multiplier):
+        super().__init__(multiplier, room_types=[room_type])
+
+
+class WeekdayRule(PricingRule):
+    """Multiplier for certain weekdays (Monday is 0), e.g. weekends."""
+
+    def __init__(self, weekdays, multiplier, start=None, end=None, room_types=None):
+        super().__init__(multiplier, start, end, room_types)
+        self.__weekdays = set(weekdays)
+
+    def applies(self, day, occupancy):
+        return day.weekday() in self.__weekdays
+
+
+class OccupancyRule(PricingRule):
+    """Surcharge multiplier once occupancy for a night reaches a threshold (0 to 1)."""
+
+    def __init__(self, threshold, multiplier, start=None, end=None, room_types=None):
+        super().__init__(multiplier, start, end, room_types)
+        self.__threshold = threshold
+
+    def applies(self, day, occupancy):
+        return occupancy is not None and occupancy(day) >= self.__threshold
+
+
+# ---------------------- Engine ----------------------
+
+class PricingEngine:
+    """Prices stays from a per-room-type rate calendar, with an LRU cache of quotes.
+
+    The calendar holds the combined rule multiplier for each (room type, night).
+    Adding or removing a rule, or calling invalidate() when occupancy changes,
+    only drops the calendar nights and cached quotes that overlap the change.
+    """
+
+    def __init__(self, rules=(), occupancy=None, cache_size=10000):
+        # occupancy is an optional callable(day) -> share of rooms booked that night
+        self.__rules = list(rules)
+        self.__occupancy = occupancy
+        self.__calendar = {}                # (room type, night) -> multiplier
+        self.__quotes = OrderedDict()       # (room number, price, room type, check_in, check_out) -> total
+        self.__cache_size = cache_size
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_rules(self): return list(self.__rules)  # Return rules
+    def get_cache_stats(self): return {"hits": self.__hits, "misses": self.__misses, "size": len(self.__quotes)}
+
+    def factor(self, room_type, day):
+        # Return the calendar multiplier for one night, computing it on first use
+        key = (room_type, day)
+        value = self.__calendar.get(key)
+        if value is None:
+            value = 1.0
+            for rule in self.__rules:
+                value *= rule.factor(room_type, day, self.__occupancy)
+            self.__calendar[key] = value
+        return value
+
+    def precompute(self, room_types, start, end):
+        # Fill the calendar for every night in [start, end)
+        for room_type in room_types:
+            day = start
+            while day < end:
+                self.factor(room_type, day)
+                day += timedelta(days=1)
+
+    def nightly_rates(self, room, check_in, check_out):
+        # Return the rate for each night of the stay; whole rates stay ints, so an
+        # invoice with no rule applied still reads AED930, not AED930.0
+        base = room.get_price_per_night()
+        room_type = room.get_room_type()
+        nights = (check_out - check_in).days
+        rates = [round(base * self.factor(room_type, check_in + timedelta(days=n)), 2) for n in range(nights)]
+        return [int(rate) if float(rate).is_integer() else rate for rate in rates]
+
+    def quote(self, room, check_in, check_out):
+        # Return the room charge for the stay, from cache when possible
+        key = (room.get_room_number(), room.get_price_per_night(), room.get_room_type(), check_in, check_out)
+        total = self.__quotes.get(key)
+        if total is not None:
+            self.__quotes.move_to_end(key)
+            self.__hits += 1
+            return total
+        self.__misses += 1
+        rates = self.nightly_rates(room, check_in, check_out)
+        total = sum(rates) if all(isinstance(rate, int) for rate in rates) else round(sum(rates), 2)
+        self.__quotes[key] = total
+        if len(self.__quotes) > self.__cache_size:
+            self.__quotes.popitem(last=False)
+        return total
+
+    def add_rule(self, rule):
+        # Add a rule and drop the prices it changes
+        self.__rules.append(rule)
+        self.invalidate(rule.get_start(), rule.get_end(), rule.get_room_types())
+
+    def remove_rule(self, rule):
+        # Remove a rule and drop the prices it changed
+        self.__rules.remove(rule)
+        self.invalidate(rule.get_start(), rule.get_end(), rule.get_room_types())
+
+    def invalidate(self, start=None, end=None, room_types=None):
+        # Drop calendar nights in [start, end) and quotes overlapping them; None bounds are open
+        def hit(room_type, first, last):
+            # True if [first, last) overlaps the invalidated range for this room type
+            return ((room_types is None or room_type in room_types)
+                    and (start is None or last > start) and (end is None or first < end))
+
+        if start is not None and end is not None:
+            # Bounded change: visit only the affected nights
+            types = room_types if room_types is not None else {k[0] for k in self.__calendar}
+            for room_type in types:
+                day = start
+                while day < end:
+                    self.__calendar.pop((room_type, day), None)
+                    day += timedelta(days=1)
+        else:
+            for key in [k for k in self.__calendar if hit(k[0], k[1], k[1] + timedelta(days=1))]:
+                del self.__calendar[key]
+        for key in [k for k in self.__quotes if hit(k[2], k[3], k[4])]:
+            del self.__quotes[key]
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(quotes=200000, distinct_ranges=500):
+    """Time repeated quotes with and without the quote cache."""
+    rooms = [Room(100 + i, ("Single", "Double", "Suite")[i % 3], [], (300, 450, 800)[i % 3]) for i in range(30)]
+    rules = [SeasonRule(1.4, date(2026, 12, 15), date(2027, 1, 5)), WeekdayRule((4, 5), 1.2),
+             RoomTypeRule("Suite", 1.1)]
+    start = date(2026, 11, 1)
+    ranges = [(start + timedelta(days=i % 90), start + timedelta(days=i % 90 + 1 + i % 7))
+              for i in range(distinct_ranges)]
+    requests = [(rooms[i % len(rooms)], *ranges[i % len(ranges)]) for i in range(quotes)]
+
+    for label, cache_size in (("no quote cache", 0), ("quote cache", 20000)):
+        engine = PricingEngine(rules, cache_size=cache_size)
+        engine.precompute(("Single", "Double", "Suite"), start, start + timedelta(days=100))
+        began = time.perf_counter()
+        for room, check_in, check_out in requests:
+            engine.quote(room, check_in, check_out)
+        elapsed = time.perf_counter() - began
+        print(f"{label:<15}{quotes / elapsed:>12,.0f} quotes/s  {engine.get_cache_stats()}")
+
+    began = time.perf_counter()
+    engine.add_rule(SeasonRule(0.9, date(2026, 11, 10), date(2026, 11, 12), room_types=["Single"]))
+    print(f"rule change invalidated in {(time.perf_counter() - began) * 1000:.1f} ms, "
+          f"{engine.get_cache_stats()['size']} quotes still cached")
+
+
+if __name__ == '__main__':
+    benchmark()
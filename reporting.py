@@ -0,0 +1,219 @@
+from array import array
+from datetime import date, timedelta
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the matrix is also available as a memoryview
+    np = None
+
+from Room import Room
+from reservation import Reservation
+
+
+class OccupancyReport:
+    """Night-by-room occupancy matrix with daily, monthly and per-room-type revenue figures.
+
+    The matrix is one byte per (room, night) for the nights in [start, end).
+    Daily sold-room and revenue totals, overall and per room type, are kept
+    alongside it, so adding or removing a reservation touches only its own nights.
+    """
+
+    def __init__(self, rooms, start, end, pricing=None):
+        # Initialize an empty report over [start, end); pricing is an optional PricingEngine
+        self.__rooms = list(rooms)
+        self.__start = start.toordinal()
+        self.__nights = (end - start).days
+        self.__pricing = pricing
+        self.__row = {room.get_room_number(): i for i, room in enumerate(self.__rooms)}
+        self.__types = sorted({room.get_room_type() for room in self.__rooms})
+        self.__type_index = {name: i for i, name in enumerate(self.__types)}
+        self.__type_rooms = [0] * len(self.__types)       # Rooms of each type
+        for room in self.__rooms:
+            self.__type_rooms[self.__type_index[room.get_room_type()]] += 1
+        self.__clear()
+
+    def __clear(self):
+        # Reset the matrix and every running total
+        self.__matrix = bytearray(len(self.__rooms) * self.__nights)
+        self.__sold = array("l", [0]) * self.__nights          # Rooms sold per night
+        self.__revenue = array("d", [0.0]) * self.__nights     # Revenue per night
+        self.__type_sold = [array("l", [0]) * self.__nights for _ in self.__types]
+        self.__type_revenue = [array("d", [0.0]) * self.__nights for _ in self.__types]
+
+    def __span(self, reservation):
+        # Return (row, first night, last night + 1) clipped to the report, or None
+        row = self.__row.get(reservation.get_room().get_room_number())
+        first = max(reservation.get_check_in().toordinal() - self.__start, 0)
+        last = min(reservation.get_check_out().toordinal() - self.__start, self.__nights)
+        return (row, first, last) if row is not None and first < last else None
+
+    def __rates(self, reservation, first, last):
+        # Return the nightly rates for report nights [first, last) of a reservation
+        room = reservation.get_room()
+        if self.__pricing is None:
+            return [room.get_price_per_night()] * (last - first)
+        day = date.fromordinal(self.__start + first)
+        return self.__pricing.nightly_rates(room, day, day + timedelta(days=last - first))
+
+    def __apply(self, reservation, sign):
+        # Mark (sign 1) or clear (sign -1) a reservation's nights
+        span = self.__span(reservation)
+        if span is None:
+            return 0
+        row, first, last = span
+        t = self.__type_index[reservation.get_room().get_room_type()]
+        base = row * self.__nights
+        flag = 1 if sign > 0 else 0
+        changed = 0
+        for night, rate in zip(range(first, last), self.__rates(reservation, first, last)):
+            if self.__matrix[base + night] == flag:
+                continue        # Night already in the requested state
+            self.__matrix[base + night] = flag
+            self.__sold[night] += sign
+            self.__revenue[night] += sign * rate
+            self.__type_sold[t][night] += sign
+            self.__type_revenue[t][night] += sign * rate
+            changed += 1
+        return changed
+
+    def add_reservation(self, reservation): return self.__apply(reservation, 1)       # Mark a stay's nights
+    def remove_reservation(self, reservation): return self.__apply(reservation, -1)   # Clear a stay's nights
+
+    def rebuild(self, reservations):
+        # Recompute everything from a full list of (non-overlapping) reservations
+        self.__clear()
+        nights = self.__nights
+        start = self.__start
+        matrix = self.__matrix
+        # Per room type, each stay adds one step up at its first night and one down after its last
+        sold_diff = [[0] * (nights + 1) for _ in self.__types]
+        revenue_diff = [[0.0] * (nights + 1) for _ in self.__types]
+        rooms = {}      # Room number -> (row offset, sold diff, revenue diff)
+        for number, row in self.__row.items():
+            t = self.__type_index[self.__rooms[row].get_room_type()]
+            rooms[number] = (row * nights, sold_diff[t], revenue_diff[t])
+
+        for reservation in reservations:
+            room = reservation.get_room()
+            info = rooms.get(room.get_room_number())
+            if info is None:
+                continue
+            first = max(reservation.get_check_in().toordinal() - start, 0)
+            last = min(reservation.get_check_out().toordinal() - start, nights)
+            if first >= last:
+                continue
+            offset, sold, revenue = info
+            matrix[offset + first:offset + last] = b"\x01" * (last - first)
+            if self.__pricing is None:
+                rate = room.get_price_per_night()
+                sold[first] += 1
+                sold[last] -= 1
+                revenue[first] += rate
+                revenue[last] -= rate
+            else:
+                for night, rate in zip(range(first, last), self.__rates(reservation, first, last)):
+                    sold[night] += 1
+                    sold[night + 1] -= 1
+                    revenue[night] += rate
+                    revenue[night + 1] -= rate
+
+        for t in range(len(self.__types)):
+            sold_total = 0
+            revenue_total = 0.0
+            type_sold = self.__type_sold[t]
+            type_revenue = self.__type_revenue[t]
+            for night in range(nights):
+                sold_total += sold_diff[t][night]
+                revenue_total += revenue_diff[t][night]
+                type_sold[night] = sold_total
+                type_revenue[night] = revenue_total
+                self.__sold[night] += sold_total
+                self.__revenue[night] += revenue_total
+
+    # ---------------------- Queries ----------------------
+
+    def get_matrix(self):
+        # Return the rooms x nights matrix without copying (NumPy array if available)
+        if np is not None:
+            return np.frombuffer(self.__matrix, dtype=np.uint8).reshape(len(self.__rooms), self.__nights)
+        return memoryview(self.__matrix).cast("B", (len(self.__rooms), self.__nights))
+
+    def is_occupied(self, room_number, day):
+        # Check one room on one night
+        row = self.__row.get(room_number)
+        if row is None:
+            raise KeyError(f"Room {room_number} is not in the report.")
+        night = day.toordinal() - self.__start
+        if not 0 <= night < self.__nights:
+            raise ValueError(f"{day} is outside the report period.")
+        return bool(self.__matrix[row * self.__nights + night])
+
+    @staticmethod
+    def _figures(rooms, sold, revenue):
+        # Return occupancy, ADR and RevPAR for totals over some nights
+        return {"rooms_available": rooms, "rooms_sold": sold, "revenue": round(revenue, 2),
+                "occupancy": sold / rooms if rooms else 0.0,
+                "adr": round(revenue / sold, 2) if sold else 0.0,
+                "revpar": round(revenue / rooms, 2) if rooms else 0.0}
+
+    def daily(self):
+        # Return {date: figures} for every night
+        rooms = len(self.__rooms)
+        return {date.fromordinal(self.__start + n): self._figures(rooms, self.__sold[n], self.__revenue[n])
+                for n in range(self.__nights)}
+
+    def monthly(self):
+        # Return {"YYYY-MM": figures} summed over each month's nights
+        months = {}
+        for n in range(self.__nights):
+            key = date.fromordinal(self.__start + n).strftime("%Y-%m")
+            totals = months.setdefault(key, [0, 0, 0.0])
+            totals[0] += len(self.__rooms)
+            totals[1] += self.__sold[n]
+            totals[2] += self.__revenue[n]
+        return {key: self._figures(*totals) for key, totals in months.items()}
+
+    def by_room_type(self, start=None, end=None):
+        # Return {room type: figures} over [start, end), defaulting to the whole report
+        first = 0 if start is None else max(start.toordinal() - self.__start, 0)
+        last = self.__nights if end is None else min(end.toordinal() - self.__start, self.__nights)
+        nights = max(last - first, 0)
+        return {name: self._figures(self.__type_rooms[t] * nights, sum(self.__type_sold[t][first:last]),
+                                    sum(self.__type_revenue[t][first:last]))
+                for t, name in enumerate(self.__types)}
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(rooms=5000, year=2026):
+    """Time a full rebuild over a year of data and single incremental updates."""
+    rng = random.Random(11)
+    room_list = [Room(1000 + i, ("Single", "Double", "Suite")[i % 3], [], (300, 450, 800)[i % 3]) for i in range(rooms)]
+    start, end = date(year, 1, 1), date(year + 1, 1, 1)
+    reservations = []
+    for room in room_list:
+        day = start + timedelta(days=rng.randrange(3))
+        while day < end:
+            stay = rng.randint(1, 6)
+            reservations.append(Reservation(None, room, day, day + timedelta(days=stay)))
+            day += timedelta(days=stay + rng.randrange(4))
+
+    report = OccupancyReport(room_list, start, end)
+    began = time.perf_counter()
+    report.rebuild(reservations)
+    print(f"rebuild: {len(reservations)} reservations, {rooms} rooms x {(end - start).days} nights "
+          f"in {time.perf_counter() - began:.3f}s")
+
+    sample = reservations[::len(reservations) // 1000][:1000]
+    began = time.perf_counter()
+    for reservation in sample:
+        report.remove_reservation(reservation)
+        report.add_reservation(reservation)
+    print(f"incremental: {(time.perf_counter() - began) / len(sample) * 1e6:.1f} us per remove + add")
+    print("June 2026:", report.monthly()[f"{year}-06"])
+
+
+if __name__ == '__main__':
+    benchmark()
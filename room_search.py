@@ -0,0 +1,158 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+import random
+import time
+
+from Room import Room
+from availability import AvailabilityIndex
+
+
+class AmenityCodes:
+    """Assigns each amenity name a bit so a set of amenities fits in one int."""
+
+    def __init__(self, names=()):
+        # Initialize with optional amenity names in a fixed order
+        self.__bits = {}        # Amenity name -> bit value
+        for name in names:
+            self.code(name)
+
+    def code(self, name):
+        # Return the bit for an amenity, adding it if new
+        bit = self.__bits.get(name)
+        if bit is None:
+            bit = self.__bits[name] = 1 << len(self.__bits)
+        return bit
+
+    def mask(self, names):
+        # Return the bitset of several amenities
+        value = 0
+        for name in names:
+            value |= self.code(name)
+        return value
+
+    def lookup(self, names):
+        # Return the bitset of several amenities, or None if one is unknown
+        value = 0
+        for name in names:
+            bit = self.__bits.get(name)
+            if bit is None:
+                return None
+            value |= bit
+        return value
+
+    def names(self, mask):
+        # Return the amenity names in a bitset
+        return [name for name, bit in self.__bits.items() if mask & bit]
+
+    def get_names(self): return list(self.__bits)  # Return all amenity names in bit order
+
+
+class RoomSearchIndex:
+    """Filters rooms by type, amenities, price band and dates.
+
+    Rooms are grouped by type and sorted by price within each group, so a
+    price band is two bisects. Amenities are compared as bitsets, and the
+    availability index is only asked about the rooms that pass every other filter.
+    """
+
+    def __init__(self, rooms, availability=None, amenity_codes=None):
+        # Build the per-type buckets; availability defaults to a fresh index over the rooms
+        self.__codes = amenity_codes or AmenityCodes()
+        self.__availability = availability or AvailabilityIndex(rooms)
+        self.__buckets = {}     # Room type -> (prices, masks, rooms), sorted by price
+        for room in rooms:
+            self.add_room(room)
+
+    def get_amenity_codes(self): return self.__codes         # Return amenity codes
+    def get_availability(self): return self.__availability  # Return availability index
+
+    def add_room(self, room):
+        # Insert a room into its type bucket, keeping price order
+        prices, masks, rooms = self.__buckets.setdefault(room.get_room_type(), ([], [], []))
+        price = room.get_price_per_night()
+        i = bisect_right(prices, price)
+        prices.insert(i, price)
+        masks.insert(i, self.__codes.mask(room.get_amenities()))
+        rooms.insert(i, room)
+        if self.__availability.get_room(room.get_room_number()) is None:
+            self.__availability.add_room(room)
+
+    def search(self, room_type=None, amenities=(), min_price=None, max_price=None,
+               check_in=None, check_out=None):
+        # Return rooms matching every given criterion, cheapest first
+        wanted = self.__codes.lookup(amenities)
+        if wanted is None:
+            return []       # No room has an amenity that was never seen
+        types = [room_type] if room_type is not None else list(self.__buckets)
+        found = []
+        for name in types:
+            bucket = self.__buckets.get(name)
+            if bucket is None:
+                continue
+            prices, masks, rooms = bucket
+            lo = 0 if min_price is None else bisect_left(prices, min_price)
+            hi = len(prices) if max_price is None else bisect_right(prices, max_price)
+            for i in range(lo, hi):
+                if masks[i] & wanted == wanted:
+                    found.append(rooms[i])
+        if check_in is not None and check_out is not None:
+            is_free = self.__availability.is_free
+            found = [room for room in found if is_free(room.get_room_number(), check_in, check_out)]
+        if room_type is None:
+            found.sort(key=lambda room: room.get_price_per_night())
+        return found
+
+
+def scan(rooms, availability, room_type=None, amenities=(), min_price=None, max_price=None,
+         check_in=None, check_out=None):
+    """Reference linear scan over the room list, for comparison."""
+    found = [room for room in rooms
+             if (room_type is None or room.get_room_type() == room_type)
+             and all(a in room.get_amenities() for a in amenities)
+             and (min_price is None or room.get_price_per_night() >= min_price)
+             and (max_price is None or room.get_price_per_night() <= max_price)
+             and (check_in is None or availability.is_free(room.get_room_number(), check_in, check_out))]
+    found.sort(key=lambda room: room.get_price_per_night())
+    return found
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(rooms=20000, queries=2000):
+    """Time combined searches against the linear scan."""
+    rng = random.Random(3)
+    amenities = ["Wi-Fi", "TV", "Mini-Bar", "Jacuzzi", "Balcony", "Sea View", "Kitchenette", "Bathtub"]
+    types = ["Single", "Double", "Suite", "Family", "Penthouse"]
+    room_list = [Room(1000 + i, rng.choice(types), rng.sample(amenities, rng.randint(1, 5)),
+                      rng.randrange(200, 2000, 10)) for i in range(rooms)]
+    index = RoomSearchIndex(room_list)
+    availability = index.get_availability()
+    start = date(2026, 12, 1)
+    for room in room_list:
+        for _ in range(rng.randrange(4)):
+            check_in = start + timedelta(days=rng.randrange(60))
+            availability.get_schedule(room.get_room_number()).book(check_in, check_in + timedelta(days=rng.randint(1, 6)))
+
+    criteria = []
+    for _ in range(queries):
+        check_in = start + timedelta(days=rng.randrange(55))
+        criteria.append(dict(room_type=rng.choice(types), amenities=rng.sample(amenities, rng.randint(1, 2)),
+                             max_price=rng.randrange(400, 1200, 50),
+                             check_in=check_in, check_out=check_in + timedelta(days=rng.randint(1, 7))))
+
+    began = time.perf_counter()
+    expected = [scan(room_list, availability, **c) for c in criteria]
+    scan_time = time.perf_counter() - began
+    began = time.perf_counter()
+    results = [index.search(**c) for c in criteria]
+    index_time = time.perf_counter() - began
+
+    assert [[r.get_room_number() for r in found] for found in results] == \
+           [[r.get_room_number() for r in found] for found in expected]
+    print(f"{rooms} rooms, {queries} queries such as Suite + Jacuzzi under AED900 for a date range")
+    print(f"  list scan:    {scan_time / queries * 1000:.3f} ms/query")
+    print(f"  search index: {index_time / queries * 1000:.3f} ms/query ({scan_time / index_time:.0f}x)")
+
+
+if __name__ == '__main__':
+    benchmark()
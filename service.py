@@ -7,6 +7,10 @@ class ServiceRequest:
         self.__service_type = service_type  # e.g., Housekeeping
         self.__status = "Pending"           # Default status
 
+    def get_guest(self): return self._guest                 # Return guest
+    def get_service_type(self): return self.__service_type  # Return service type
+    def get_status(self): return self.__status              # Return status
+
     def mark_completed(self):
         # Mark the request as completed
         self.__status = "Completed"
@@ -0,0 +1,166 @@
+from collections import deque
+import heapq
+import itertools
+import threading
+import time
+
+from guest import Guest
+from service import ServiceRequest
+from loyalty import LoyaltyRules
+
+# Lower number is served first; unknown service types go last
+SERVICE_PRIORITY = {"Emergency": 0, "Maintenance": 1, "Room Service": 2, "Housekeeping": 3, "Laundry": 4}
+DEFAULT_PRIORITY = 9
+
+# Tier thresholds come from the loyalty program
+DEFAULT_RULES = LoyaltyRules()
+
+
+def guest_tier(guest, rules=DEFAULT_RULES):
+    """Return the guest's loyalty tier rank, 0 for the lowest (Standard) tier."""
+    return rules.rank(guest.get_loyalty_points())
+
+
+class ServiceDispatcher:
+    """Queues service requests by priority and hands them to a pool of staff worker threads."""
+
+    def __init__(self, handlers=None, workers=4, rules=None):
+        # handlers maps a service type to a callable(request); "*" handles everything else.
+        # rules is the LoyaltyRules whose tiers rank guests (e.g. a ledger's get_rules())
+        self.__handlers = dict(handlers or {})
+        self.__rules = rules or DEFAULT_RULES
+        self.__queue = []                       # Heap of (priority, -tier, seq, queued_at, request)
+        self.__seq = itertools.count()          # Keeps equal priorities first-in first-out
+        self.__ready = threading.Condition()
+        self.__workers = [threading.Thread(target=self.__work, daemon=True) for _ in range(workers)]
+        self.__running = False
+        self.__busy = 0                         # Requests being handled right now
+        self.__submitted = 0
+        self.__completed = 0
+        self.__failed = 0
+        self.__errors = deque(maxlen=1000)      # (request, exception) for the latest failed requests
+        self.__wait_total = 0.0                 # Seconds spent queued, summed over served requests
+        self.__wait_max = 0.0
+        self.__started_at = None
+
+    def start(self):
+        # Start the worker threads
+        self.__running = True
+        self.__started_at = time.perf_counter()
+        for worker in self.__workers:
+            worker.start()
+        return self
+
+    def get_errors(self):
+        # Return (request, exception) for the latest failed requests, oldest first
+        with self.__ready:
+            return list(self.__errors)
+
+    def __enter__(self): return self.start()
+    def __exit__(self, *exc): self.shutdown()
+
+    def submit(self, request):
+        # Queue a request; higher tiers go first within the same service priority
+        priority = SERVICE_PRIORITY.get(request.get_service_type(), DEFAULT_PRIORITY)
+        entry = (priority, -guest_tier(request.get_guest(), self.__rules), next(self.__seq), time.perf_counter(), request)
+        with self.__ready:
+            heapq.heappush(self.__queue, entry)
+            self.__submitted += 1
+            self.__ready.notify()
+
+    def __work(self):
+        # Worker loop: take the most urgent request and run its handler
+        while True:
+            with self.__ready:
+                while not self.__queue and self.__running:
+                    self.__ready.wait()
+                if not self.__queue:
+                    return
+                entry = heapq.heappop(self.__queue)
+                self.__busy += 1
+            waited = time.perf_counter() - entry[3]
+            request = entry[4]
+            handler = self.__handlers.get(request.get_service_type(), self.__handlers.get("*"))
+            error = None
+            try:
+                if handler is None:
+                    raise LookupError(f"No handler for service type {request.get_service_type()!r}.")
+                handler(request)
+                request.mark_completed()
+            except Exception as e:
+                error = e       # Left pending, counted as failed and kept for get_errors()
+            with self.__ready:
+                self.__busy -= 1
+                self.__wait_total += waited
+                self.__wait_max = max(self.__wait_max, waited)
+                if error is None:
+                    self.__completed += 1
+                else:
+                    self.__failed += 1
+                    self.__errors.append((request, error))
+                self.__ready.notify_all()
+
+    def join(self):
+        # Block until every queued request has been handled
+        with self.__ready:
+            while self.__queue or self.__busy:
+                self.__ready.wait()
+
+    def shutdown(self):
+        # Finish queued requests, then stop the workers
+        with self.__ready:
+            self.__running = False
+            self.__ready.notify_all()
+        for worker in self.__workers:
+            worker.join()
+
+    def metrics(self):
+        # Return queue depth, wait times and throughput
+        with self.__ready:
+            served = self.__completed + self.__failed
+            elapsed = time.perf_counter() - self.__started_at if self.__started_at else 0.0
+            return {
+                "queue_depth": len(self.__queue),
+                "in_progress": self.__busy,
+                "submitted": self.__submitted,
+                "completed": self.__completed,
+                "failed": self.__failed,
+                "avg_wait_ms": self.__wait_total / served * 1000 if served else 0.0,
+                "max_wait_ms": self.__wait_max * 1000,
+                "throughput_per_s": served / elapsed if elapsed else 0.0,
+            }
+
+
+# ---------------------- Load Test ----------------------
+
+def load_test(requests=20000, rate=5000, workers=8, work_ms=0.5):
+    """Replay requests at a fixed rate per second and print the dispatcher metrics."""
+    guests = []
+    for i in range(100):
+        guest = Guest(f"Guest {i}", f"guest{i}@example.com", f"05{i:08d}")
+        for _ in range(i % 12):
+            guest.add_reservation(None)
+        guests.append(guest)
+    types = list(SERVICE_PRIORITY) + ["Spa"]
+
+    def staff(request):
+        time.sleep(work_ms / 1000)
+
+    with ServiceDispatcher({"*": staff}, workers) as dispatcher:
+        began = time.perf_counter()
+        for i in range(requests):
+            # Pace submissions to the target rate
+            due = began + i / rate
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            dispatcher.submit(ServiceRequest(guests[i % len(guests)], types[i % len(types)]))
+        dispatcher.join()
+        metrics = dispatcher.metrics()
+    print(f"{requests} requests at {rate}/s with {workers} workers:")
+    for name, value in metrics.items():
+        print(f"  {name:<17}{value:,.2f}" if isinstance(value, float) else f"  {name:<17}{value}")
+
+
+if __name__ == '__main__':
+    load_test()
@@ -0,0 +1,284 @@
+from datetime import date, timedelta
+from heapq import merge
+from itertools import islice
+import os
+import random
+import sys
+import time
+
+from Room import Room
+from reservation import Reservation
+from room_search import RoomSearchIndex
+from invoice import Invoice
+from bulk_invoice import invoice_columns, calculate_totals
+from reporting import OccupancyReport
+
+
+class PropertyShard:
+    """Rooms and reservations of one property, with its own search index."""
+
+    def __init__(self, property_id, rooms=()):
+        # Initialize the shard with an optional list of rooms
+        self.__property_id = property_id    # Property this shard holds
+        self.__search = RoomSearchIndex(rooms)
+        self.__reservations = []            # Reservations in booking order
+
+    def get_property_id(self): return self.__property_id                      # Return property id
+    def get_rooms(self): return self.__search.get_availability().get_rooms()  # Return rooms by number
+    def get_reservations(self): return list(self.__reservations)             # Return reservations
+
+    def add_room(self, room):
+        # Add a room to the property
+        self.__search.add_room(room)
+
+    def book(self, guest, room_number, check_in, check_out):
+        # Book a room; return the Reservation, or None if it is taken or unknown
+        availability = self.__search.get_availability()
+        room = availability.get_room(room_number)
+        if room is None:
+            return None
+        reservation = Reservation(guest, room, check_in, check_out)
+        if not availability.book(reservation):
+            return None
+        if guest is not None:
+            guest.add_reservation(reservation)
+        self.__reservations.append(reservation)
+        return reservation
+
+    # ---------------------- Queries ----------------------
+
+    def search(self, limit=None, **criteria):
+        # Return up to limit rooms matching RoomSearchIndex.search criteria, cheapest first
+        found = self.__search.search(**criteria)
+        return found if limit is None else found[:limit]
+
+    def invoice_total(self, charges=50, discount=20, pricing=None):
+        # Return the sum of every reservation's invoice total, priced by an optional PricingEngine
+        if not self.__reservations:
+            return 0
+        totals = calculate_totals(*invoice_columns(Invoice(r, charges, discount, pricing) for r in self.__reservations))
+        total = sum(totals)
+        return total.item() if hasattr(total, "item") else total    # Plain number, not a NumPy scalar
+
+    def occupancy(self, start, end):
+        # Return {room type: figures} for [start, end), as OccupancyReport.by_room_type
+        report = OccupancyReport(self.get_rooms(), start, end)
+        report.rebuild(self.__reservations)
+        return report.by_room_type()
+
+
+class ShardedInventory:
+    """Every property's rooms and reservations, one PropertyShard per property id."""
+
+    def __init__(self):
+        # Initialize with no properties
+        self.__shards = {}      # Property id -> PropertyShard
+        self.__version = 0      # Bumped by every property added and booking made here
+
+    def __len__(self): return len(self.__shards)
+    def get_shard(self, property_id): return self.__shards.get(property_id)  # Return a shard, or None
+    def get_shards(self): return dict(self.__shards)                         # Return property id -> shard
+    def get_property_ids(self): return list(self.__shards)                   # Return property ids
+    def get_version(self): return self.__version                             # Return the change counter
+
+    def add_property(self, property_id, rooms=()):
+        # Add a property; return its shard
+        if property_id in self.__shards:
+            raise ValueError(f"Property {property_id} already exists.")
+        shard = self.__shards[property_id] = PropertyShard(property_id, rooms)
+        self.__version += 1
+        return shard
+
+    def book(self, property_id, guest, room_number, check_in, check_out):
+        # Book a room at a property; return the Reservation, or None
+        shard = self.__shards.get(property_id)
+        if shard is None:
+            raise KeyError(f"Property {property_id} does not exist.")
+        reservation = shard.book(guest, room_number, check_in, check_out)
+        if reservation is not None:
+            self.__version += 1
+        return reservation
+
+
+# ---------------------- Scatter-Gather ----------------------
+
+def _serve(connection, shards):
+    # Worker loop: apply bookings to the shards this process owns and answer queries on them
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        kind, payload = message
+        if kind == "book":
+            property_id, room_number, check_in, check_out = payload
+            shards[property_id].book(None, room_number, check_in, check_out)
+            continue
+        method, args, kwargs = payload
+        try:
+            connection.send([(pid, getattr(shard, method)(*args, **kwargs)) for pid, shard in shards.items()])
+        except Exception as e:
+            connection.send(e)
+    connection.close()
+
+
+class QueryExecutor:
+    """Fans read queries out across shards in local worker processes and merges the results.
+
+    Each worker owns a fixed share of the properties and keeps its own copy of
+    their shards, so a query only sends its arguments out and its results
+    back. Bookings made through book() are applied here and sent to the
+    worker that owns the property, ahead of any later query, so searches never
+    offer a room booked after the workers started. Changes made to the
+    inventory any other way restart the workers before the next query. With
+    processes=1 queries run in this process, on the live shards.
+    """
+
+    def __init__(self, inventory, processes=None):
+        # Start the workers; processes defaults to the number of cores
+        self.__inventory = inventory
+        self.__processes = processes or os.cpu_count() or 1
+        self.__workers = []     # (process, connection) per worker
+        self.__owner = {}       # Property id -> connection of the worker that owns it
+        self.__version = None   # Inventory version the workers hold
+        self.refresh()
+
+    def get_processes(self): return self.__processes  # Return the number of worker processes
+
+    def refresh(self):
+        # Restart the workers with the inventory's current shards
+        from multiprocessing import Pipe, Process
+
+        self.close()
+        self.__version = self.__inventory.get_version()
+        if self.__processes == 1:
+            return
+        shards = self.__inventory.get_shards()
+        ids = list(shards)
+        for w in range(min(self.__processes, len(ids))):
+            owned = {pid: shards[pid] for pid in ids[w::self.__processes]}
+            connection, child = Pipe()
+            process = Process(target=_serve, args=(child, owned), daemon=True)
+            process.start()
+            child.close()
+            self.__workers.append((process, connection))
+            for pid in owned:
+                self.__owner[pid] = connection
+
+    def book(self, property_id, guest, room_number, check_in, check_out):
+        # Book a room at a property; return the Reservation, or None if it is taken or unknown
+        if self.__inventory.get_version() != self.__version:
+            self.refresh()
+        reservation = self.__inventory.book(property_id, guest, room_number, check_in, check_out)
+        if reservation is not None:
+            self.__version = self.__inventory.get_version()
+            owner = self.__owner.get(property_id)
+            if owner is not None:
+                owner.send(("book", (property_id, room_number, check_in, check_out)))
+        return reservation
+
+    def scatter(self, method, *args, **kwargs):
+        # Call a PropertyShard method on every shard; return {property id: result}
+        if self.__inventory.get_version() != self.__version:
+            self.refresh()      # The inventory changed behind the workers' backs
+        ids = self.__inventory.get_property_ids()
+        if not self.__workers:
+            shards = self.__inventory.get_shards()
+            return {pid: getattr(shards[pid], method)(*args, **kwargs) for pid in ids}
+        for _, connection in self.__workers:
+            connection.send(("query", (method, args, kwargs)))
+        results = {}
+        failure = None
+        for _, connection in self.__workers:
+            part = connection.recv()
+            if isinstance(part, Exception):
+                failure = part
+            else:
+                results.update(part)
+        if failure is not None:
+            raise failure
+        return {pid: results[pid] for pid in ids}   # Property order, whatever order the workers finished in
+
+    def search(self, limit=None, **criteria):
+        # Return (property id, Room) pairs matching the criteria across the chain, cheapest first
+        found = self.scatter("search", limit, **criteria)
+        pairs = merge(*([(pid, room) for room in rooms] for pid, rooms in found.items()),
+                      key=lambda pair: pair[1].get_price_per_night())
+        return list(islice(pairs, limit))
+
+    def invoice_totals(self, charges=50, discount=20, pricing=None):
+        # Return {property id: sum of invoice totals}; a pricing engine is copied to each worker
+        return self.scatter("invoice_total", charges, discount, pricing)
+
+    def occupancy(self, start, end):
+        # Return chain-wide {room type: figures} for [start, end)
+        totals = {}     # Room type -> [rooms available, rooms sold, revenue]
+        for by_type in self.scatter("occupancy", start, end).values():
+            for name, figures in by_type.items():
+                row = totals.setdefault(name, [0, 0, 0.0])
+                row[0] += figures["rooms_available"]
+                row[1] += figures["rooms_sold"]
+                row[2] += figures["revenue"]
+        return {name: OccupancyReport._figures(*row) for name, row in sorted(totals.items())}
+
+    def close(self):
+        # Stop the worker processes
+        for process, connection in self.__workers:
+            connection.send(None)
+            connection.close()
+            process.join()
+        self.__workers = []
+        self.__owner = {}
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(properties=64, rooms=1500, queries=20):
+    """Time chain-wide "free Suites next weekend" searches with 1, 2, 4, ... worker processes."""
+    rng = random.Random(23)
+    types = (("Single", 300), ("Double", 450), ("Suite", 800))
+    amenities = ["Wi-Fi", "TV", "Mini-Bar", "Jacuzzi", "Balcony", "Sea View"]
+    start = date(2026, 11, 1)
+    inventory = ShardedInventory()
+    for p in range(properties):
+        shard = inventory.add_property(f"P{p:03d}")
+        for i in range(rooms):
+            room_type, price = types[i % 3]
+            shard.add_room(Room(100 + i, room_type, rng.sample(amenities, 3), price + rng.randrange(0, 200, 10)))
+        for i in range(rooms * 4):
+            check_in = start + timedelta(days=rng.randrange(60))
+            shard.book(None, 100 + rng.randrange(rooms), check_in, check_in + timedelta(days=rng.randint(1, 4)))
+
+    friday = start + timedelta(days=(4 - start.weekday()) % 7 + 7)
+    criteria = dict(room_type="Suite", check_in=friday, check_out=friday + timedelta(days=2), limit=50)
+    print(f"{properties} properties x {rooms} rooms, {queries} searches for the 50 cheapest free Suites "
+          f"{friday} to {friday + timedelta(days=2)} ({os.cpu_count()} cores)")
+
+    counts = []
+    processes = 1
+    while processes <= (os.cpu_count() or 1):
+        counts.append(processes)
+        processes *= 2
+    if counts[-1] != (os.cpu_count() or 1):
+        counts.append(os.cpu_count() or 1)
+
+    expected = None
+    baseline = None
+    for processes in counts:
+        with QueryExecutor(inventory, processes) as executor:
+            executor.search(**criteria)     # Warm up the workers
+            began = time.perf_counter()
+            for _ in range(queries):
+                found = executor.search(**criteria)
+            elapsed = (time.perf_counter() - began) / queries
+        found = [(pid, room.get_room_number()) for pid, room in found]
+        if expected is None:
+            expected, baseline = found, elapsed
+        assert found == expected, "Parallel results differ from the single-process search"
+        print(f"  {processes:>3} processes: {elapsed * 1000:8.2f} ms/query  ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 64)
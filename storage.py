@@ -0,0 +1,386 @@
+from datetime import date, timedelta
+from itertools import islice
+import json
+import sqlite3
+import sys
+import time
+import weakref
+
+from Room import Room
+from guest import Guest
+from reservation import Reservation
+from invoice import Invoice
+from service import ServiceRequest
+from feedback import Feedback
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rooms (
+    room_number INTEGER PRIMARY KEY,
+    room_type TEXT NOT NULL,
+    amenities TEXT NOT NULL,
+    price_per_night NUMERIC NOT NULL
+);
+CREATE TABLE IF NOT EXISTS guests (
+    guest_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    contact TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS guests_email ON guests (email);
+CREATE TABLE IF NOT EXISTS reservations (
+    reservation_id INTEGER PRIMARY KEY,
+    guest_id INTEGER NOT NULL REFERENCES guests,
+    room_number INTEGER NOT NULL REFERENCES rooms,
+    check_in INTEGER NOT NULL,
+    check_out INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reservations_room_dates ON reservations (room_number, check_out, check_in);
+CREATE INDEX IF NOT EXISTS reservations_check_in ON reservations (check_in);
+CREATE INDEX IF NOT EXISTS reservations_guest ON reservations (guest_id);
+CREATE TABLE IF NOT EXISTS invoices (
+    invoice_id INTEGER PRIMARY KEY,
+    reservation_id INTEGER NOT NULL REFERENCES reservations,
+    charges NUMERIC NOT NULL,
+    discount NUMERIC NOT NULL,
+    total NUMERIC NOT NULL
+);
+CREATE TABLE IF NOT EXISTS service_requests (
+    request_id INTEGER PRIMARY KEY,
+    guest_id INTEGER NOT NULL REFERENCES guests,
+    service_type TEXT NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS feedback (
+    feedback_id INTEGER PRIMARY KEY,
+    guest_id INTEGER NOT NULL REFERENCES guests,
+    rating INTEGER NOT NULL,
+    comments TEXT NOT NULL
+);
+"""
+
+BOOKED_NIGHTS_SCHEMA = """CREATE TABLE IF NOT EXISTS booked_nights (
+                              room_number INTEGER NOT NULL,
+                              night INTEGER NOT NULL,
+                              guest_email TEXT NOT NULL,
+                              PRIMARY KEY (room_number, night)) WITHOUT ROWID"""
+
+_MISSING = object()     # Marks a cache key that was not set before
+
+
+def claim_nights(db, room_numbers, check_in, check_out, guest_email):
+    """Insert a booked_nights row for every room and night of [check_in, check_out).
+
+    Raises sqlite3.IntegrityError if any of those nights is already booked.
+    The caller owns the transaction and rolls it back on that error.
+    """
+    nights = range(check_in.toordinal(), check_out.toordinal())
+    db.executemany("INSERT INTO booked_nights VALUES (?, ?, ?)",
+                   [(n, night, guest_email) for n in room_numbers for night in nights])
+
+
+class HotelStore:
+    """SQLite persistence for rooms, guests, reservations, invoices, service requests and feedback.
+
+    Dates are stored as day ordinals. Objects read back are the usual domain
+    classes; each guest and room is loaded once per store and then reused.
+    """
+
+    def __init__(self, path=":memory:", batch_size=10000):
+        # Open (or create) the database in WAL mode
+        self.__db = sqlite3.connect(path)
+        self.__db.execute("PRAGMA journal_mode=WAL")
+        self.__db.execute("PRAGMA synchronous=NORMAL")
+        self.__db.executescript(SCHEMA)
+        self.__db.execute(BOOKED_NIGHTS_SCHEMA)
+        self.__batch_size = batch_size  # Rows per executemany call
+        self.__guest_ids = weakref.WeakKeyDictionary()        # Guest -> guest_id
+        self.__reservation_ids = weakref.WeakKeyDictionary()  # Reservation -> reservation_id
+        self.__guests = {}              # guest_id -> loaded Guest
+        self.__rooms = {}               # room_number -> loaded Room
+        self.__loaded_reservations = weakref.WeakValueDictionary()  # reservation_id -> Reservation in use
+        self.__pending = None           # Cache entries set by the open transaction, for rollback
+
+    def close(self): self.__db.close()  # Close the database
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+    # ---------------------- Writes ----------------------
+
+    def __insert(self, sql, rows):
+        # Insert rows in batches inside one transaction. A call made while another is
+        # running (e.g. saving a reservation's guest) joins the outer transaction, so
+        # either everything is saved or nothing is, and the id caches are undone too
+        if self.__pending is not None:
+            self.__insert_batches(sql, rows)
+            return
+        self.__pending = []
+        try:
+            with self.__db:
+                self.__insert_batches(sql, rows)
+        except BaseException:
+            for cache, key, previous in reversed(self.__pending):
+                if previous is _MISSING:
+                    cache.pop(key, None)
+                else:
+                    cache[key] = previous
+            raise
+        finally:
+            self.__pending = None
+
+    def __insert_batches(self, sql, rows):
+        # Run executemany over rows, batch_size rows at a time
+        rows = iter(rows)
+        batch = list(islice(rows, self.__batch_size))
+        while batch:
+            self.__db.executemany(sql, batch)
+            batch = list(islice(rows, self.__batch_size))
+
+    def __remember(self, cache, key, value):
+        # Set a cache entry, noting the old value in case the transaction rolls back
+        if self.__pending is not None:
+            self.__pending.append((cache, key, cache.get(key, _MISSING)))
+        cache[key] = value
+
+    def __next_id(self, table, column):
+        # Return the next free integer key of a table
+        return self.__db.execute(f"SELECT COALESCE(MAX({column}), 0) + 1 FROM {table}").fetchone()[0]
+
+    def add_rooms(self, rooms):
+        # Save rooms, replacing any with the same number
+        def rows():
+            for room in rooms:
+                self.__remember(self.__rooms, room.get_room_number(), room)
+                yield (room.get_room_number(), room.get_room_type(),
+                       json.dumps(room.get_amenities()), room.get_price_per_night())
+        self.__insert("INSERT OR REPLACE INTO rooms VALUES (?, ?, ?, ?)", rows())
+
+    def add_guests(self, guests):
+        # Save guests not saved yet
+        next_id = self.__next_id("guests", "guest_id")
+
+        def rows():
+            nonlocal next_id
+            for guest in guests:
+                if guest in self.__guest_ids:
+                    continue
+                self.__remember(self.__guest_ids, guest, next_id)
+                self.__remember(self.__guests, next_id, guest)
+                yield next_id, guest.get_name(), guest.get_email(), guest.get_contact()
+                next_id += 1
+        self.__insert("INSERT INTO guests VALUES (?, ?, ?, ?)", rows())
+
+    def get_guest_id(self, guest):
+        # Return the stored id of a guest, saving it first if needed
+        if guest not in self.__guest_ids:
+            self.add_guests([guest])
+        return self.__guest_ids[guest]
+
+    def add_reservations(self, reservations):
+        # Save reservations; their guests are saved on the way if needed
+        next_id = self.__next_id("reservations", "reservation_id")
+
+        def rows():
+            nonlocal next_id
+            for reservation in reservations:
+                self.__remember(self.__reservation_ids, reservation, next_id)
+                self.__remember(self.__loaded_reservations, next_id, reservation)
+                yield (next_id, self.get_guest_id(reservation.get_guest()),
+                       reservation.get_room().get_room_number(),
+                       reservation.get_check_in().toordinal(), reservation.get_check_out().toordinal())
+                next_id += 1
+        self.__insert("INSERT INTO reservations VALUES (?, ?, ?, ?, ?)", rows())
+
+    def add_reservation_if_free(self, reservation):
+        # Save a reservation only if its room is free for its dates; return True if saved.
+        # The room must have no overlapping saved reservation, and its nights are claimed
+        # in booked_nights, the table SharedBookingStore uses, in the same transaction as
+        # the insert, so two processes (or the two stores on one file) can never book the
+        # same room night. Reservations saved with add_reservations() are not claimed;
+        # that is the unchecked bulk import
+        room_number = reservation.get_room().get_room_number()
+        self.__db.commit()
+        self.__db.execute("BEGIN IMMEDIATE")
+        try:
+            free = self.__db.execute(
+                "SELECT 1 FROM reservations WHERE room_number = ? AND check_out > ? AND check_in < ? LIMIT 1",
+                (room_number, reservation.get_check_in().toordinal(),
+                 reservation.get_check_out().toordinal())).fetchone() is None
+            if free:
+                try:
+                    claim_nights(self.__db, [room_number], reservation.get_check_in(),
+                                 reservation.get_check_out(), reservation.get_guest().get_email())
+                except sqlite3.IntegrityError:
+                    free = False    # Another store claimed one of the nights
+            if not free:
+                self.__db.rollback()
+                return False
+            self.add_reservations([reservation])
+            return True
+        except BaseException:
+            if self.__db.in_transaction:
+                self.__db.rollback()
+            raise
+
+    def add_invoices(self, invoices):
+        # Save invoices for reservations already saved
+        self.__insert("INSERT INTO invoices (reservation_id, charges, discount, total) VALUES (?, ?, ?, ?)",
+                      ((self.__reservation_ids[i.get_reservation()], i.get_charges(),
+                        i.get_discount(), i.calculate_total()) for i in invoices))
+
+    def add_service_requests(self, requests):
+        # Save service requests
+        self.__insert("INSERT INTO service_requests (guest_id, service_type, status) VALUES (?, ?, ?)",
+                      ((self.get_guest_id(r.get_guest()), r.get_service_type(), r.get_status())
+                       for r in requests))
+
+    def add_feedback(self, feedback):
+        # Save feedback entries
+        self.__insert("INSERT INTO feedback (guest_id, rating, comments) VALUES (?, ?, ?)",
+                      ((self.get_guest_id(f.get_guest()), f.get_rating(), f.get_comments())
+                       for f in feedback))
+
+    # ---------------------- Reads ----------------------
+
+    def get_room(self, room_number):
+        # Return the room with this number, loading it on first use
+        room = self.__rooms.get(room_number)
+        if room is None:
+            row = self.__db.execute("SELECT * FROM rooms WHERE room_number = ?", (room_number,)).fetchone()
+            if row is None:
+                return None
+            room = self.__rooms[room_number] = Room(row[0], row[1], json.loads(row[2]), row[3])
+        return room
+
+    def get_guest(self, guest_id):
+        # Return the guest with this id, loading it on first use
+        guest = self.__guests.get(guest_id)
+        if guest is None:
+            row = self.__db.execute("SELECT name, email, contact FROM guests WHERE guest_id = ?",
+                                    (guest_id,)).fetchone()
+            if row is None:
+                return None
+            guest = self.__guests[guest_id] = Guest(*row)
+            self.__guest_ids[guest] = guest_id
+        return guest
+
+    def find_guest_by_email(self, email):
+        # Return the first guest saved with this email, or None
+        row = self.__db.execute("SELECT guest_id FROM guests WHERE email = ? LIMIT 1", (email,)).fetchone()
+        return self.get_guest(row[0]) if row else None
+
+    def rooms(self):
+        # Yield every room
+        for (number,) in self.__db.execute("SELECT room_number FROM rooms ORDER BY room_number"):
+            yield self.get_room(number)
+
+    def available_rooms(self, check_in, check_out):
+        # Yield rooms with no reservation overlapping [check_in, check_out) and no night
+        # in it claimed in booked_nights (e.g. by a SharedBookingStore on the same file)
+        sql = """SELECT room_number FROM rooms r WHERE NOT EXISTS (
+                     SELECT 1 FROM reservations x
+                     WHERE x.room_number = r.room_number AND x.check_out > ? AND x.check_in < ?)
+                 AND NOT EXISTS (
+                     SELECT 1 FROM booked_nights n
+                     WHERE n.room_number = r.room_number AND n.night >= ? AND n.night < ?)
+                 ORDER BY room_number"""
+        first, last = check_in.toordinal(), check_out.toordinal()
+        for (number,) in self.__db.execute(sql, (first, last, first, last)):
+            yield self.get_room(number)
+
+    def __reservation(self, reservation_id, guest_id, room_number, check_in, check_out):
+        # Return the Reservation for a row, reusing one still in use elsewhere. Loaded
+        # reservations are registered like saved ones, so they can be invoiced
+        reservation = self.__loaded_reservations.get(reservation_id)
+        if reservation is None:
+            reservation = Reservation(self.get_guest(guest_id), self.get_room(room_number),
+                                      date.fromordinal(check_in), date.fromordinal(check_out))
+            self.__loaded_reservations[reservation_id] = reservation
+            self.__reservation_ids[reservation] = reservation_id
+        return reservation
+
+    def __reservations(self, where, params):
+        # Yield Reservation objects for a query, one row at a time
+        sql = f"SELECT reservation_id, guest_id, room_number, check_in, check_out FROM reservations WHERE {where}"
+        for row in self.__db.execute(sql, params):
+            yield self.__reservation(*row)
+
+    def reservations_between(self, start, end):
+        # Yield reservations overlapping [start, end), by check-in date
+        return self.__reservations("check_in < ? AND check_out > ? ORDER BY check_in",
+                                   (end.toordinal(), start.toordinal()))
+
+    def room_reservations(self, room_number):
+        # Yield a room's reservations, by check-in date
+        return self.__reservations("room_number = ? ORDER BY check_in", (room_number,))
+
+    def guest_reservations(self, guest):
+        # Yield a guest's reservations, by check-in date
+        return self.__reservations("guest_id = ? ORDER BY check_in", (self.get_guest_id(guest),))
+
+    def invoices(self, guest, pricing=None):
+        # Yield a guest's invoices; pricing is the PricingEngine they were priced with, if any
+        sql = """SELECT x.reservation_id, x.guest_id, x.room_number, x.check_in, x.check_out, i.charges, i.discount
+                 FROM invoices i JOIN reservations x USING (reservation_id)
+                 WHERE x.guest_id = ? ORDER BY x.check_in"""
+        for row in self.__db.execute(sql, (self.get_guest_id(guest),)):
+            yield Invoice(self.__reservation(*row[:5]), row[5], row[6], pricing)
+
+    def service_requests(self, guest):
+        # Yield a guest's service requests
+        sql = "SELECT service_type, status FROM service_requests WHERE guest_id = ? ORDER BY request_id"
+        for service_type, status in self.__db.execute(sql, (self.get_guest_id(guest),)):
+            request = ServiceRequest(guest, service_type)
+            if status == "Completed":
+                request.mark_completed()
+            yield request
+
+    def feedback(self, guest):
+        # Yield a guest's feedback
+        sql = "SELECT rating, comments FROM feedback WHERE guest_id = ? ORDER BY feedback_id"
+        for rating, comments in self.__db.execute(sql, (self.get_guest_id(guest),)):
+            yield Feedback(guest, rating, comments)
+
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(path, rooms=10000, reservations=10000000, guests=100000):
+    """Time bulk inserts and the available-rooms query; use a file path, not :memory:, for WAL."""
+    store = HotelStore(path, batch_size=50000)
+    room_list = [Room(i, ("Single", "Double", "Suite")[i % 3], ["Wi-Fi"], 300 + i % 3 * 250) for i in range(1, rooms + 1)]
+    guest_list = [Guest(f"Guest {i}", f"guest{i}@example.com", f"05{i:08d}") for i in range(guests)]
+    start = date(2026, 1, 1)
+
+    began = time.perf_counter()
+    store.add_rooms(room_list)
+    store.add_guests(guest_list)
+    print(f"rooms + guests: {time.perf_counter() - began:.2f}s")
+
+    # Back-to-back stays per room, generated lazily
+    def stays():
+        for i in range(reservations):
+            room = room_list[i % rooms]
+            check_in = start + timedelta(days=(i // rooms) * 3)
+            yield Reservation(guest_list[i % guests], room, check_in, check_in + timedelta(days=2 + i % 2))
+
+    began = time.perf_counter()
+    store.add_reservations(stays())
+    elapsed = time.perf_counter() - began
+    print(f"{reservations} reservations: {elapsed:.2f}s = {reservations / elapsed:,.0f} rows/s")
+
+    last_day = start + timedelta(days=(reservations // rooms) * 3)
+    # Day 2 of each 3-day slot is free in rooms whose stay in that slot lasts 2 nights
+    for label, check_in in (("past", start + timedelta(days=32)), ("latest", last_day - timedelta(days=1))):
+        began = time.perf_counter()
+        free = sum(1 for _ in store.available_rooms(check_in, check_in + timedelta(days=1)))
+        print(f"available rooms ({label} dates): {free} in {(time.perf_counter() - began) * 1000:.1f} ms")
+    store.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 4):
+        print("Usage: python storage.py <benchmark.db> [rooms reservations]")
+        sys.exit(1)
+    if len(sys.argv) == 4:
+        benchmark(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]))
+    else:
+        benchmark(sys.argv[1])
@@ -0,0 +1,149 @@
+from itertools import islice
+import csv
+import json
+import re
+import time
+
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')  # Compiled once for every email check
+
+# ---------------------- Validation Helpers ----------------------
+
+def is_valid_name(name): return name.replace(" ", "").isalpha()
+def is_valid_email(email): return bool(EMAIL_PATTERN.match(email))
+def is_valid_phone(phone): return phone.isdigit() and len(phone) >= 10
+def is_valid_rating(r): return r.isdecimal() and 1 <= int(r) <= 5  # isdigit() also passes "²", which int() rejects
+
+# ---------------------- Batch Validation ----------------------
+
+# Error bits set in a record's mask; 0 means the record is valid
+INVALID_NAME = 1
+INVALID_EMAIL = 2
+INVALID_CONTACT = 4
+INVALID_RATING = 8
+INVALID_RECORD = 16     # The line could not be read as a record at all
+
+GUEST_FIELDS = ("name", "email", "contact", "rating")
+
+
+def _text(value):
+    # Return a field as text; null and other non-text values count as empty
+    return value if isinstance(value, str) else ""
+
+
+class GuestValidator:
+    """Checks guest records and returns an error bitmask per record."""
+
+    def __init__(self, fields=GUEST_FIELDS):
+        # Only the listed fields are checked
+        self.__check_name = "name" in fields
+        self.__check_email = "email" in fields
+        self.__check_contact = "contact" in fields
+        self.__check_rating = "rating" in fields
+
+    def validate(self, record):
+        # Return the error bitmask for one record (a dict of field -> value)
+        mask = 0
+        if self.__check_name and not is_valid_name(_text(record.get("name"))):
+            mask |= INVALID_NAME
+        if self.__check_email and not EMAIL_PATTERN.match(_text(record.get("email"))):
+            mask |= INVALID_EMAIL
+        if self.__check_contact and not is_valid_phone(_text(record.get("contact"))):
+            mask |= INVALID_CONTACT
+        if self.__check_rating:
+            rating = record.get("rating")
+            if isinstance(rating, int) and not isinstance(rating, bool):
+                rating = str(rating)        # JSON may give the rating as a number
+            if not is_valid_rating(_text(rating)):
+                mask |= INVALID_RATING
+        return mask
+
+    def validate_batch(self, records):
+        # Return the error bitmasks for a list of records, in order
+        validate = self.validate
+        return [validate(record) for record in records]
+
+    def validate_file(self, path, processes=1, chunk_size=10000):
+        # Yield (line number, error bitmask) for every record in a .jsonl or .csv file, in order.
+        # Blank lines are skipped; a line that is not a JSON object gets INVALID_RECORD
+        with open(path, newline="", encoding="utf-8") as f:
+            if path.lower().endswith(".csv"):
+                reader = csv.DictReader(f)
+                rows = ((reader.line_num, row) for row in reader)
+            else:
+                rows = enumerate(f, 1)
+            chunks = iter(lambda: list(islice(rows, chunk_size)), [])
+            if processes == 1:
+                for chunk in chunks:
+                    yield from _validate_chunk((self, chunk))
+                return
+
+            from multiprocessing import Pool
+            with Pool(processes) as pool:
+                for masks in pool.imap(_validate_chunk, ((self, chunk) for chunk in chunks)):
+                    yield from masks
+
+
+def describe_errors(mask):
+    """Return the error messages for a bitmask, as printed by the prompts."""
+    messages = []
+    if mask & INVALID_NAME:
+        messages.append("Name must contain only letters.")
+    if mask & INVALID_EMAIL:
+        messages.append("Invalid email format.")
+    if mask & INVALID_CONTACT:
+        messages.append("Phone must be at least 10 digits.")
+    if mask & INVALID_RATING:
+        messages.append("Rating must be between 1 and 5.")
+    if mask & INVALID_RECORD:
+        messages.append("Line is not a valid JSON object.")
+    return messages
+
+
+def _validate_chunk(job):
+    # Worker entry point: JSON lines are parsed here so parsing runs in parallel too
+    validator, chunk = job
+    validate = validator.validate
+    results = []
+    for line, row in chunk:
+        if isinstance(row, str):
+            if not row.strip():
+                continue
+            try:
+                row = json.loads(row)
+            except ValueError:
+                row = None
+            if not isinstance(row, dict):
+                results.append((line, INVALID_RECORD))
+                continue
+        results.append((line, validate(row)))
+    return results
+
+# ---------------------- Benchmark ----------------------
+
+def benchmark(path=None, count=500000, processes=(1, 2, 4)):
+    """Print validation throughput in records/second for each process count."""
+    import os
+    import tempfile
+
+    created = path is None
+    if created:
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for i in range(count):
+                bad = i % 7 == 0
+                f.write(json.dumps({"name": f"Guest{i}" if bad else "Guest Name",
+                                    "email": f"guest{i}@example.com",
+                                    "contact": f"05{i:08d}", "rating": str(1 + i % 5)}) + "\n")
+    try:
+        for workers in processes:
+            began = time.perf_counter()
+            total = sum(1 for _ in GuestValidator().validate_file(path, processes=workers))
+            elapsed = time.perf_counter() - began
+            print(f"{workers} process(es): {total} records in {elapsed:.2f}s = {total / elapsed:,.0f} records/s")
+    finally:
+        if created:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    benchmark()